@@ -20,11 +20,15 @@ from importlib.metadata import version
 __version__ = version("honeycomb-api")
 
 # Note: tools module is imported lazily via __getattr__ below to speed up CLI startup
+from .apply import ApplyAction, ApplyPlan, ApplyResult, DesiredState, PlanItem
 from .auth import APIKeyAuth, AuthStrategy, ManagementKeyAuth, create_auth
-from .client import HoneycombClient, RateLimitInfo, RetryConfig
+from .cache import CacheConfig, QueryResultCacheConfig, ResponseCache
+from .client import CompressionConfig, HoneycombClient, PoolConfig, RateLimitInfo, RetryConfig
+from .codec import JSONCodec, create_json_codec
 from .exceptions import (
     HoneycombAPIError,
     HoneycombAuthError,
+    HoneycombCircuitOpenError,
     HoneycombConnectionError,
     HoneycombForbiddenError,
     HoneycombNotFoundError,
@@ -57,6 +61,7 @@ from .models import (
     CalcOp,
     Calculation,
     Column,
+    ColumnarResult,
     ColumnCreate,
     ColumnType,
     Dataset,
@@ -109,6 +114,7 @@ from .models import (
     SLOBundle,
     SLOCreate,
     TagsMixin,
+    TimeSeries,
     Trigger,
     TriggerAlertType,
     TriggerBuilder,
@@ -123,13 +129,34 @@ from .models import (
     WebhookRecipientDetails,
     WebhookTemplateVariable,
 )
+from .polling import PollStats, PollStrategy
+from .rate_limit import RateLimiter
+from .resources.query_results import QueryRun
+from .rolling import RollingQuery
+from .transmission import Transmission, TransmissionOverflowError, TransmissionResponse
 
 __all__ = [
     "__version__",
     # Client
     "HoneycombClient",
     "RetryConfig",
+    "PoolConfig",
     "RateLimitInfo",
+    "RateLimiter",
+    "PollStrategy",
+    "PollStats",
+    "CacheConfig",
+    "ResponseCache",
+    "QueryResultCacheConfig",
+    "CompressionConfig",
+    "JSONCodec",
+    "create_json_codec",
+    # Declarative apply
+    "DesiredState",
+    "ApplyPlan",
+    "ApplyResult",
+    "ApplyAction",
+    "PlanItem",
     # Tools (Claude API) - lazily imported
     "tools",
     # Auth
@@ -146,6 +173,7 @@ __all__ = [
     "HoneycombRateLimitError",
     "HoneycombServerError",
     "HoneycombTimeoutError",
+    "HoneycombCircuitOpenError",
     "HoneycombConnectionError",
     # Models - Query Builder (enums and typed models)
     "CalcOp",
@@ -191,6 +219,10 @@ __all__ = [
     "Query",
     "QuerySpec",
     "QueryResult",
+    "QueryRun",
+    "RollingQuery",
+    "ColumnarResult",
+    "TimeSeries",
     # Models - Query Annotations
     "QueryAnnotation",
     "QueryAnnotationCreate",
@@ -237,6 +269,9 @@ __all__ = [
     # Models - Events
     "BatchEvent",
     "BatchEventResult",
+    "Transmission",
+    "TransmissionResponse",
+    "TransmissionOverflowError",
     # Models - API Keys (v2)
     "ApiKey",
     "ApiKeyCreate",
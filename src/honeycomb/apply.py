@@ -0,0 +1,709 @@
+"""Declarative apply of triggers, SLOs and boards.
+
+Given the desired state as builder bundles, apply lists what exists, computes a
+plan of creates, updates and deletes, and executes it concurrently. Objects are
+matched by name (per dataset for triggers and SLOs). An object whose content
+hash matches the desired definition (for SLOs, including their burn alerts and
+SLI derived column) is left untouched.
+
+Example:
+    >>> desired = DesiredState(
+    ...     triggers=[TriggerBuilder("High Errors").dataset("api").count()...build()],
+    ...     slos=[SLOBuilder("API Availability").dataset("api")...build()],
+    ... )
+    >>> plan = await client.plan_async(desired)
+    >>> print(plan.format())
+    >>> result = await client.apply_async(desired)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .client import DEFAULT_APPLY_CONCURRENCY
+from .exceptions import HoneycombNotFoundError
+from .models.recipients import RecipientType
+from .models.tags_mixin import TagsMixin
+from .models.triggers import TriggerCreate
+from .resources._recipient_utils import RecipientIndex, process_inline_recipients
+from .resources.slos import (
+    _burn_alert_create,
+    _derived_column_dataset,
+    _slo_dataset,
+    _split_recipients,
+)
+
+if TYPE_CHECKING:
+    from .client import HoneycombClient
+    from .models.board_builder import BoardBundle
+    from .models.boards import Board
+    from .models.burn_alerts import BurnAlert, BurnAlertCreate
+    from .models.derived_columns import DerivedColumn, DerivedColumnCreate
+    from .models.slo_builder import SLOBundle
+    from .models.slos import SLO
+    from .models.trigger_builder import TriggerBundle
+    from .models.triggers import Trigger
+
+
+# Tag recording the content hash of a board created or updated by apply.
+# Board panels reference queries created on apply, so a board's content cannot
+# be compared with the desired bundle directly.
+BOARD_HASH_TAG = "applyhash"
+
+# Tag recording DesiredState.owner on boards apply writes. Board prune only
+# deletes boards with the same owner, so separate apply runs don't prune each other.
+BOARD_OWNER_TAG = "applyowner"
+
+
+class ApplyAction(str, Enum):
+    """What a plan item does to an object."""
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+_SYMBOLS = {ApplyAction.CREATE: "+", ApplyAction.UPDATE: "~", ApplyAction.DELETE: "-"}
+
+
+@dataclass
+class DesiredState:
+    """Triggers, SLOs and boards that should exist.
+
+    Attributes:
+        triggers: Trigger bundles (TriggerBuilder.build()).
+        slos: SLO bundles (SLOBuilder.build()).
+        boards: Board bundles (BoardBuilder.build()).
+        prune: Delete objects that are not declared: triggers and SLOs in the
+            datasets the desired state mentions, and boards previously created
+            by apply with the same owner. Off by default.
+        owner: Name of this desired state (a tag value: lowercase letters,
+            numbers, / and -), recorded on its boards in an applyowner tag.
+            Boards are only pruned when an owner is set.
+    """
+
+    triggers: list[TriggerBundle] = field(default_factory=list)
+    slos: list[SLOBundle] = field(default_factory=list)
+    boards: list[BoardBundle] = field(default_factory=list)
+    prune: bool = False
+    owner: str | None = None
+
+
+@dataclass
+class PlanItem:
+    """One change in an ApplyPlan.
+
+    Attributes:
+        action: Create, update or delete.
+        kind: "trigger", "slo" or "board".
+        name: Object name.
+        dataset: Dataset the object lives in (None for boards).
+        id: ID of the existing object (None for creates).
+        desired: The bundle to create or update from (None for deletes).
+    """
+
+    action: ApplyAction
+    kind: str
+    name: str
+    dataset: str | None = None
+    id: str | None = None
+    desired: Any = field(default=None, repr=False, compare=False)
+
+    def __str__(self) -> str:
+        location = f"{self.dataset}/" if self.dataset else ""
+        return f"{_SYMBOLS[self.action]} {self.kind} {location}{self.name}"
+
+
+@dataclass
+class ApplyPlan:
+    """Changes needed to reach a DesiredState.
+
+    Attributes:
+        items: Creates and updates in declaration order, followed by deletes.
+        unchanged: Number of declared objects that already match.
+    """
+
+    items: list[PlanItem] = field(default_factory=list)
+    unchanged: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def count(self, action: ApplyAction) -> int:
+        """Number of plan items with the given action."""
+        return sum(1 for item in self.items if item.action == action)
+
+    def format(self) -> str:
+        """Render the plan one change per line, followed by a summary line."""
+        summary = (
+            f"Plan: {self.count(ApplyAction.CREATE)} to create, "
+            f"{self.count(ApplyAction.UPDATE)} to update, "
+            f"{self.count(ApplyAction.DELETE)} to delete, {self.unchanged} unchanged."
+        )
+        return "\n".join([*(str(item) for item in self.items), summary])
+
+
+@dataclass
+class ApplyResult:
+    """Outcome of apply_async().
+
+    Attributes:
+        plan: The executed (or, for a dry run, computed) plan.
+        succeeded: Plan items that were applied.
+        failed: Plan items that failed, with their exception.
+        skipped: Deletes that were not run because a create or update failed.
+        dry_run: True if nothing was executed.
+    """
+
+    plan: ApplyPlan
+    succeeded: list[PlanItem] = field(default_factory=list)
+    failed: list[tuple[PlanItem, BaseException]] = field(default_factory=list)
+    skipped: list[PlanItem] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True if no plan item failed or was skipped."""
+        return not self.failed and not self.skipped
+
+
+def content_hash(value: Any) -> str:
+    """Return a hash of a JSON-serializable value, independent of dict key order."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _project(current: Any, desired: Any) -> Any:
+    """Restrict `current` to the shape of `desired`, so fields the API adds are ignored."""
+    if isinstance(desired, dict) and isinstance(current, dict):
+        return {key: _project(current.get(key), value) for key, value in desired.items()}
+    if isinstance(desired, list) and isinstance(current, list) and len(desired) == len(current):
+        return [_project(c, d) for c, d in zip(current, desired, strict=True)]
+    return current
+
+
+def _matches(current: dict[str, Any], desired: dict[str, Any]) -> bool:
+    """Return True if the current object has the desired content."""
+    return content_hash(_project(current, desired)) == content_hash(desired)
+
+
+def _check_unique(names: list[str], kind: str, location: str | None) -> None:
+    """Reject desired objects that share a name (they could not be matched)."""
+    seen: set[str] = set()
+    for name in names:
+        if name in seen:
+            where = f" in {location}" if location else ""
+            raise ValueError(f"Duplicate {kind} name '{name}'{where}")
+        seen.add(name)
+
+
+def _group_by_name(objects: list[Any]) -> dict[str, list[Any]]:
+    """Group existing objects by name (the API allows duplicate names)."""
+    by_name: dict[str, list[Any]] = {}
+    for obj in objects:
+        by_name.setdefault(obj.name, []).append(obj)
+    return by_name
+
+
+def _take(by_name: dict[str, list[Any]], name: str) -> Any:
+    """Remove and return the first existing object with this name, if any."""
+    matches = by_name.get(name)
+    return matches.pop(0) if matches else None
+
+
+def _recipient_ids(
+    recipients: list[dict[str, Any]], index: RecipientIndex | None
+) -> list[dict[str, Any]]:
+    """Recipients as {"id": ...} sorted by ID, with inline recipients looked up in the index."""
+    ids = []
+    for recip in recipients:
+        recipient_id = recip.get("id")
+        if recipient_id is None and "type" in recip:
+            found = index.get(RecipientType(recip["type"]), recip["target"]) if index else None
+            # A recipient that does not exist yet can't match the current object
+            recipient_id = found or f"<new {recip['type']} {recip['target']}>"
+        ids.append({"id": recipient_id})
+    return sorted(ids, key=lambda r: r["id"] or "")
+
+
+def _trigger_body(bundle: TriggerBundle, index: RecipientIndex | None) -> dict[str, Any]:
+    """The trigger as the API would store it, with inline recipients looked up in the index."""
+    body = bundle.trigger.model_dump_for_api()
+    recipients = [*(body.get("recipients") or []), *bundle.inline_recipients]
+    if recipients:
+        body["recipients"] = _recipient_ids(recipients, index)
+    return body
+
+
+def _trigger_current(trigger: Trigger) -> dict[str, Any]:
+    current = trigger.model_dump(mode="json", exclude_none=True)
+    if current.get("recipients"):
+        current["recipients"] = sorted(
+            ({"id": r.get("id")} for r in current["recipients"]), key=lambda r: r["id"] or ""
+        )
+    return current
+
+
+# Burn alert fields apply manages; anything else the API returns is ignored
+_BURN_ALERT_FIELDS = (
+    "alert_type",
+    "description",
+    "exhaustion_minutes",
+    "budget_rate_window_minutes",
+    "budget_rate_decrease_threshold_per_million",
+    "recipients",
+)
+
+
+def _burn_alert_key(alert: dict[str, Any]) -> str:
+    """Content hash of a burn alert's managed fields (unset and empty values ignored)."""
+    return content_hash(
+        {key: alert[key] for key in _BURN_ALERT_FIELDS if alert.get(key) not in (None, "")}
+    )
+
+
+def _desired_burn_alert_key(burn_alert: BurnAlertCreate) -> str:
+    body = burn_alert.model_dump_for_api()
+    body["recipients"] = sorted(
+        ({"id": r.get("id")} for r in body["recipients"]), key=lambda r: r["id"] or ""
+    )
+    return _burn_alert_key(body)
+
+
+def _current_burn_alert_key(burn_alert: BurnAlert) -> str:
+    current = burn_alert.model_dump(mode="json")
+    current["recipients"] = sorted(
+        ({"id": r.get("id")} for r in burn_alert.recipients or []), key=lambda r: r["id"] or ""
+    )
+    return _burn_alert_key(current)
+
+
+def _derived_column_matches(current: DerivedColumn | None, desired: DerivedColumnCreate) -> bool:
+    return (
+        current is not None
+        and current.expression == desired.expression
+        and (current.description or "") == (desired.description or "")
+    )
+
+
+def _plain(value: Any) -> Any:
+    """Convert models and dataclasses to plain JSON data, so they hash by content."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _plain(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_plain(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _board_fingerprint(bundle: BoardBundle) -> str:
+    """Content hash of a board bundle, including the queries its panels create."""
+    return (
+        "h"
+        + content_hash(
+            {
+                "name": bundle.board_name,
+                "description": bundle.board_description,
+                "layout": bundle.layout_generation,
+                "tags": bundle.tags,
+                "preset_filters": bundle.preset_filters,
+                "query_panels": [
+                    {
+                        "dataset": panel.dataset_override or panel.builder.get_dataset(),
+                        "name": panel.builder.get_name(),
+                        "description": panel.builder.get_description(),
+                        "spec": panel.builder.build().model_dump_for_api(),
+                        "position": _plain(panel.position),
+                        "style": panel.style,
+                        "visualization": panel.visualization,
+                    }
+                    for panel in bundle.query_builder_panels
+                ],
+                "existing_query_panels": _plain(bundle.existing_query_panels),
+                "existing_slo_panels": _plain(bundle.existing_slo_panels),
+                "text_panels": _plain(bundle.text_panels),
+                "views": [view.model_dump_for_api() for view in bundle.views],
+            }
+        )[:32]
+    )
+
+
+def _board_tag(board: Board, key: str) -> str | None:
+    for tag in board.tags or []:
+        if tag.get("key") == key:
+            return tag.get("value")
+    return None
+
+
+def _with_apply_tags(bundle: BoardBundle, fingerprint: str, owner: str | None) -> BoardBundle:
+    tags = [
+        tag for tag in bundle.tags or [] if tag.get("key") not in (BOARD_HASH_TAG, BOARD_OWNER_TAG)
+    ]
+    tags.append({"key": BOARD_HASH_TAG, "value": fingerprint})
+    if owner is not None:
+        tags.append({"key": BOARD_OWNER_TAG, "value": owner})
+    return dataclasses.replace(bundle, tags=tags)
+
+
+def _check_owner(owner: str | None) -> None:
+    """Reject an owner that can't be stored as a tag value."""
+    if owner is None:
+        return
+    try:
+        TagsMixin().tag(BOARD_OWNER_TAG, owner)
+    except ValueError as e:
+        raise ValueError(f"Invalid DesiredState.owner '{owner}': {e}") from e
+
+
+class ApplyEngine:
+    """Plans and applies a DesiredState with bounded concurrency.
+
+    Use HoneycombClient.plan_async() / apply_async() rather than this class.
+
+    Args:
+        client: The HoneycombClient to use.
+        max_concurrency: Maximum list and write requests in flight (default: 8).
+    """
+
+    def __init__(
+        self, client: HoneycombClient, max_concurrency: int = DEFAULT_APPLY_CONCURRENCY
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._client = client
+        self._max_concurrency = max_concurrency
+
+    async def plan(self, desired: DesiredState) -> ApplyPlan:
+        """List current objects and compute the changes needed to reach `desired`.
+
+        Raises:
+            ValueError: If the desired state declares a name twice, has an
+                invalid owner, or declares a board with SLOBuilder panels
+                (declare those SLOs in DesiredState.slos).
+        """
+        _check_owner(desired.owner)
+        for board in desired.boards:
+            if board.slo_builder_panels:
+                raise ValueError(
+                    f"Board '{board.board_name}' creates SLOs from SLOBuilder panels. "
+                    "Declare the SLOs in DesiredState.slos and use existing SLO panels."
+                )
+
+        trigger_datasets = list(dict.fromkeys(bundle.dataset for bundle in desired.triggers))
+        slo_datasets = list(dict.fromkeys(_slo_dataset(bundle) for bundle in desired.slos))
+        # Validate before listing anything
+        for dataset in trigger_datasets:
+            _check_unique(
+                [bundle.trigger.name for bundle in desired.triggers if bundle.dataset == dataset],
+                "trigger",
+                dataset,
+            )
+        for dataset in slo_datasets:
+            _check_unique(
+                [bundle.slo.name for bundle in desired.slos if _slo_dataset(bundle) == dataset],
+                "SLO",
+                dataset,
+            )
+        _check_unique([bundle.board_name for bundle in desired.boards], "board", None)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def bounded(coro: Any) -> Any:
+            async with semaphore:
+                return await coro
+
+        # Every list request is independent: run them all at once
+        needs_index = any(bundle.inline_recipients for bundle in desired.triggers) or any(
+            "id" not in recipient
+            for bundle in desired.slos
+            for alert in bundle.burn_alerts
+            for recipient in alert.recipients
+        )
+        listed = await asyncio.gather(
+            *(bounded(self._client.triggers.list_async(ds)) for ds in trigger_datasets),
+            *(bounded(self._client.slos.list_async(ds)) for ds in slo_datasets),
+            bounded(self._client.boards.list_async()),
+            bounded(self._client.recipients.index_async()) if needs_index else asyncio.sleep(0),
+        )
+        current_triggers = dict(zip(trigger_datasets, listed, strict=False))
+        current_slos = dict(zip(slo_datasets, listed[len(trigger_datasets) :], strict=False))
+        current_boards: list[Board] = listed[-2]
+        index: RecipientIndex | None = listed[-1] if needs_index else None
+
+        plan = ApplyPlan()
+        deletes: list[PlanItem] = []
+
+        # Triggers
+        for dataset in trigger_datasets:
+            existing = _group_by_name(current_triggers[dataset])
+            wanted = [bundle for bundle in desired.triggers if bundle.dataset == dataset]
+            for bundle in wanted:
+                trigger = _take(existing, bundle.trigger.name)
+                if trigger is None:
+                    plan.items.append(
+                        PlanItem(
+                            ApplyAction.CREATE,
+                            "trigger",
+                            bundle.trigger.name,
+                            dataset,
+                            None,
+                            bundle,
+                        )
+                    )
+                elif _matches(_trigger_current(trigger), _trigger_body(bundle, index)):
+                    plan.unchanged += 1
+                else:
+                    plan.items.append(
+                        PlanItem(
+                            ApplyAction.UPDATE, "trigger", trigger.name, dataset, trigger.id, bundle
+                        )
+                    )
+            if desired.prune:
+                deletes.extend(
+                    PlanItem(ApplyAction.DELETE, "trigger", t.name, dataset, t.id)
+                    for triggers in existing.values()
+                    for t in triggers
+                )
+
+        # SLOs: definitions are compared first; burn alerts and the SLI derived
+        # column are only fetched for SLOs whose definition matches
+        slo_matches: list[tuple[str, SLOBundle, SLO | None]] = []
+        for dataset in slo_datasets:
+            existing_slos: dict[str, list[SLO]] = _group_by_name(current_slos[dataset])
+            wanted_slos = [bundle for bundle in desired.slos if _slo_dataset(bundle) == dataset]
+            for slo_bundle in wanted_slos:
+                slo_matches.append((dataset, slo_bundle, _take(existing_slos, slo_bundle.slo.name)))
+            if desired.prune:
+                deletes.extend(
+                    PlanItem(ApplyAction.DELETE, "slo", s.name, dataset, s.id)
+                    for slos in existing_slos.values()
+                    for s in slos
+                )
+        candidates = [
+            (slo, slo_bundle)
+            for _, slo_bundle, slo in slo_matches
+            if slo is not None
+            and _matches(slo.model_dump(mode="json"), slo_bundle.slo.model_dump_for_api())
+        ]
+        attached_match = await asyncio.gather(
+            *(bounded(self._slo_attachments_match(slo, b, index)) for slo, b in candidates)
+        )
+        unchanged_slos = {
+            slo.id for (slo, _), ok in zip(candidates, attached_match, strict=True) if ok
+        }
+        for dataset, slo_bundle, slo in slo_matches:
+            if slo is None:
+                plan.items.append(
+                    PlanItem(
+                        ApplyAction.CREATE,
+                        "slo",
+                        slo_bundle.slo.name,
+                        dataset,
+                        None,
+                        slo_bundle,
+                    )
+                )
+            elif slo.id in unchanged_slos:
+                plan.unchanged += 1
+            else:
+                plan.items.append(
+                    PlanItem(ApplyAction.UPDATE, "slo", slo.name, dataset, slo.id, slo_bundle)
+                )
+
+        # Boards: compared by the content hash recorded when apply last wrote them
+        existing_boards: dict[str, list[Board]] = _group_by_name(current_boards)
+        for board_bundle in desired.boards:
+            fingerprint = _board_fingerprint(board_bundle)
+            # Items carry the bundle with the tags apply records on the board
+            tagged = _with_apply_tags(board_bundle, fingerprint, desired.owner)
+            board = _take(existing_boards, board_bundle.board_name)
+            if board is None:
+                plan.items.append(
+                    PlanItem(
+                        ApplyAction.CREATE, "board", board_bundle.board_name, None, None, tagged
+                    )
+                )
+            elif (
+                _board_tag(board, BOARD_HASH_TAG) == fingerprint
+                and _board_tag(board, BOARD_OWNER_TAG) == desired.owner
+            ):
+                plan.unchanged += 1
+            else:
+                plan.items.append(
+                    PlanItem(ApplyAction.UPDATE, "board", board.name, None, board.id, tagged)
+                )
+        if desired.prune and desired.owner is not None:
+            # Only boards this owner applied are pruned; others may be managed
+            # by hand or by another desired state
+            deletes.extend(
+                PlanItem(ApplyAction.DELETE, "board", b.name, None, b.id)
+                for boards in existing_boards.values()
+                for b in boards
+                if _board_tag(b, BOARD_HASH_TAG) is not None
+                and _board_tag(b, BOARD_OWNER_TAG) == desired.owner
+            )
+
+        plan.items.extend(deletes)
+        return plan
+
+    async def execute(self, plan: ApplyPlan) -> ApplyResult:
+        """Execute a plan with at most max_concurrency requests in flight.
+
+        Creates and updates run first. Deletes run once they have all
+        succeeded; if any failed, the deletes are skipped. Failures are
+        collected per item; the remaining items of a phase still run.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        result = ApplyResult(plan)
+        changes = [item for item in plan.items if item.action != ApplyAction.DELETE]
+        deletes = [item for item in plan.items if item.action == ApplyAction.DELETE]
+        await self._execute_phase(changes, semaphore, result)
+        if result.failed:
+            result.skipped.extend(deletes)
+        else:
+            await self._execute_phase(deletes, semaphore, result)
+        return result
+
+    async def _execute_phase(
+        self, items: list[PlanItem], semaphore: asyncio.Semaphore, result: ApplyResult
+    ) -> None:
+        outcomes = await asyncio.gather(
+            *(self._execute_item(item, semaphore) for item in items), return_exceptions=True
+        )
+        for item, outcome in zip(items, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                result.failed.append((item, outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.succeeded.append(item)
+
+    async def _execute_item(self, item: PlanItem, semaphore: asyncio.Semaphore) -> None:
+        client = self._client
+        if item.kind == "board":
+            # Boards take a slot per request: creating one also creates its
+            # panel queries and views, which share the same bound
+            if item.action == ApplyAction.CREATE:
+                await client.boards._create_from_bundle_async(item.desired, semaphore)
+                return
+            assert item.id is not None
+            if item.action == ApplyAction.UPDATE:
+                # Views of an existing board are left as they are
+                board_create = await client.boards._board_create_from_bundle_async(
+                    item.desired, semaphore
+                )
+                async with semaphore:
+                    await client.boards.update_async(item.id, board_create)
+            else:
+                async with semaphore:
+                    await client.boards.delete_async(item.id)
+            return
+
+        async with semaphore:
+            assert item.dataset is not None
+            if item.kind == "trigger":
+                if item.action == ApplyAction.CREATE:
+                    await client.triggers.create_from_bundle_async(item.desired)
+                elif item.action == ApplyAction.UPDATE:
+                    assert item.id is not None
+                    await client.triggers.update_async(
+                        item.dataset, item.id, await self._resolved_trigger(item.desired)
+                    )
+                else:
+                    assert item.id is not None
+                    await client.triggers.delete_async(item.dataset, item.id)
+            elif item.action == ApplyAction.CREATE:
+                # Burn alerts one at a time: this item already holds a slot
+                await client.slos.create_from_bundle_async(item.desired, max_concurrency=1)
+            elif item.action == ApplyAction.UPDATE:
+                assert item.id is not None
+                await self._update_slo(item.dataset, item.id, item.desired)
+            else:
+                assert item.id is not None
+                await client.slos.delete_async(item.dataset, item.id)
+
+    async def _derived_column(self, bundle: SLOBundle) -> DerivedColumn | None:
+        """The existing derived column with the alias the bundle's SLI uses, if any."""
+        assert bundle.derived_column is not None
+        try:
+            columns = await self._client.derived_columns.list_async(
+                _derived_column_dataset(bundle), alias=bundle.derived_column.alias
+            )
+        except HoneycombNotFoundError:
+            return None
+        return columns[0] if columns else None
+
+    async def _slo_attachments_match(
+        self, slo: SLO, bundle: SLOBundle, index: RecipientIndex | None
+    ) -> bool:
+        """Return True if the SLO's burn alerts and SLI derived column match the bundle."""
+        burn_alerts = await self._client.burn_alerts.list_async(bundle.datasets[0], slo.id)
+        desired_keys = sorted(
+            _desired_burn_alert_key(
+                _burn_alert_create(alert, slo.id, _recipient_ids(alert.recipients, index))
+            )
+            for alert in bundle.burn_alerts
+        )
+        if sorted(map(_current_burn_alert_key, burn_alerts)) != desired_keys:
+            return False
+        if bundle.derived_column is None:
+            return True
+        return _derived_column_matches(await self._derived_column(bundle), bundle.derived_column)
+
+    async def _update_slo(self, dataset: str, slo_id: str, bundle: SLOBundle) -> None:
+        """Update an SLO along with its SLI derived column and burn alerts."""
+        client = self._client
+        if bundle.derived_column is not None:
+            column = await self._derived_column(bundle)
+            column_dataset = _derived_column_dataset(bundle)
+            if column is None:
+                await client.derived_columns.create_async(column_dataset, bundle.derived_column)
+            elif not _derived_column_matches(column, bundle.derived_column):
+                await client.derived_columns.update_async(
+                    column_dataset, column.id, bundle.derived_column
+                )
+        await client.slos.update_async(dataset, slo_id, bundle.slo)
+
+        # Burn alerts that already match are kept; new ones are created before
+        # the ones they replace are deleted
+        alert_dataset = bundle.datasets[0]
+        inline = [recipient for alert in bundle.burn_alerts for recipient in alert.recipients]
+        recipients = (
+            _split_recipients(bundle, await process_inline_recipients(client, inline))
+            if inline
+            else [[] for _ in bundle.burn_alerts]
+        )
+        current: dict[str, list[BurnAlert]] = {}
+        for burn_alert in await client.burn_alerts.list_async(alert_dataset, slo_id):
+            current.setdefault(_current_burn_alert_key(burn_alert), []).append(burn_alert)
+        for alert, alert_recipients in zip(bundle.burn_alerts, recipients, strict=True):
+            create = _burn_alert_create(alert, slo_id, alert_recipients)
+            matches = current.get(_desired_burn_alert_key(create))
+            if matches:
+                matches.pop()
+            else:
+                await client.burn_alerts.create_async(alert_dataset, create)
+        for stale in current.values():
+            for burn_alert in stale:
+                await client.burn_alerts.delete_async(alert_dataset, burn_alert.id)
+
+    async def _resolved_trigger(self, bundle: TriggerBundle) -> TriggerCreate:
+        """The bundle's trigger with inline recipients resolved (created if missing)."""
+        if not bundle.inline_recipients:
+            return bundle.trigger
+        processed = await process_inline_recipients(self._client, bundle.inline_recipients)
+        return bundle.trigger.model_copy(
+            update={"recipients": (bundle.trigger.recipients or []) + processed}
+        )
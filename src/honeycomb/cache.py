@@ -0,0 +1,624 @@
+"""Response caching for read-mostly metadata endpoints.
+
+Datasets, columns, derived columns, recipients, marker settings and auth info
+change rarely, but agents and scripts list them over and over. A ResponseCache
+keeps successful GET responses for these endpoint families for a per-family TTL,
+in a bounded LRU. Any create/update/delete made through the same client
+invalidates the cached responses of the family it touched.
+
+With a cache directory configured, dataset, column and derived-column listings
+are also persisted to disk so that new processes start warm. Stale entries that
+carry an ETag or Last-Modified validator are revalidated with a conditional
+request instead of being downloaded again.
+
+Saved queries are immutable, so a SavedQueryCache maps a content hash of each
+query spec (and its dataset) to the saved query created for it, letting repeat
+runs skip the create request.
+
+A QueryResultCache (opt-in) keeps query results by the same spec hash. Results
+of absolute time windows that ended before the ingestion delay cannot change
+any more and are kept for a long time (and on disk); windows that are still
+open, including every relative time_range query, are kept only briefly.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .rate_limit import endpoint_family
+
+# Default TTLs in seconds per endpoint family (see honeycomb.rate_limit.endpoint_family)
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "datasets": 300.0,
+    "columns": 300.0,
+    "derived_columns": 300.0,
+    "recipients": 300.0,
+    "marker_settings": 300.0,
+    "auth": 3600.0,
+}
+
+# Families persisted to disk when CacheConfig.directory is set
+DEFAULT_PERSISTENT_FAMILIES = frozenset({"datasets", "columns", "derived_columns"})
+
+# Mutations on these families also invalidate every other family
+# (deleting a dataset removes its columns, derived columns, ...)
+CASCADING_FAMILIES = frozenset({"datasets"})
+
+# Time range the API uses when a query spec sets none (seconds)
+DEFAULT_QUERY_TIME_RANGE = 7200
+
+# Hop-by-hop / body-encoding headers that no longer apply to the decoded body
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class CacheConfig:
+    """Configuration for the client response cache.
+
+    Attributes:
+        ttls: Seconds to cache GET responses per endpoint family. Families not
+            listed are never cached.
+        max_entries: Maximum number of cached responses (least recently used are evicted).
+        directory: Directory for a persistent cache shared across processes (optional).
+            Entries are namespaced by API host and a hash of the credentials.
+        persistent_families: Endpoint families written to the persistent cache.
+        reuse_queries: Reuse saved queries created from an identical spec instead of
+            creating a new one (persisted too when directory is set).
+    """
+
+    ttls: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_CACHE_TTLS))
+    max_entries: int = 1024
+    directory: str | Path | None = None
+    persistent_families: frozenset[str] = DEFAULT_PERSISTENT_FAMILIES
+    reuse_queries: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+
+@dataclass
+class QueryResultCacheConfig:
+    """Configuration for the query result cache.
+
+    Attributes:
+        open_ttl: Seconds to cache results of relative or still-open time windows.
+        settled_ttl: Seconds to cache results of absolute windows that have settled.
+        ingestion_delay: Seconds after which events are assumed ingested; a window
+            settles once it ended this long ago.
+        max_bytes: Maximum total size of in-memory results (least recently used are evicted).
+        directory: Directory for persisting settled results (optional).
+    """
+
+    open_ttl: float = 30.0
+    settled_ttl: float = 86400.0
+    ingestion_delay: float = 300.0
+    max_bytes: int = 64 * 1024 * 1024
+    directory: str | Path | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body.
+
+    Attributes:
+        status_code: HTTP status code.
+        headers: Response headers (body-encoding headers removed).
+        content: Decoded response body.
+        expires_at: Unix time after which the entry is stale.
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, expires_at: float) -> CacheEntry:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        return cls(response.status_code, headers, response.content, expires_at)
+
+    def validators(self) -> dict[str, str]:
+        """Return conditional request headers for revalidating this entry."""
+        conditional = {}
+        for name, value in self.headers.items():
+            if name.lower() == "etag":
+                conditional["If-None-Match"] = value
+            elif name.lower() == "last-modified":
+                conditional["If-Modified-Since"] = value
+        return conditional
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content, request=request
+        )
+
+
+def cache_key(path: str, params: dict | None) -> str:
+    """Return the cache key for a GET request."""
+    if not params:
+        return path
+    return f"{path}?{sorted(params.items())!r}"
+
+
+def cache_namespace(base_url: str, credentials: dict[str, str]) -> str:
+    """Return the persistent cache namespace for an API host and credentials.
+
+    Only a hash of the credentials is used, so keys never reach the disk.
+    """
+    digest = hashlib.sha256(base_url.encode())
+    for name in sorted(credentials):
+        digest.update(f"\0{name}\0{credentials[name]}".encode())
+    return digest.hexdigest()[:32]
+
+
+class DiskCache:
+    """Persistent cache entries, one JSON file per request.
+
+    Files are written atomically, so several processes can share a directory.
+    With a partition function, each entry is stored in a subdirectory named by
+    it (e.g. the endpoint family), so deleting one partition reads only its files.
+
+    Args:
+        directory: Directory holding this namespace's entries.
+        partition: Maps a key to the subdirectory its file is stored in (optional).
+    """
+
+    def __init__(
+        self, directory: str | Path, partition: Callable[[str], str] | None = None
+    ) -> None:
+        self.directory = Path(directory)
+        self._partition = partition
+
+    def _dir(self, key: str) -> Path:
+        if self._partition is None:
+            return self.directory
+        return self.directory / (self._partition(key) or "_")
+
+    def _file(self, key: str) -> Path:
+        return self._dir(key) / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read(self, file: Path) -> tuple[str, CacheEntry] | None:
+        try:
+            record = json.loads(file.read_text())
+            record["content"] = base64.b64decode(record["content"])
+            key = record.pop("key")
+            return key, CacheEntry(**record)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the stored entry for a key, fresh or not."""
+        found = self._read(self._file(key))
+        return found[1] if found is not None and found[0] == key else None
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any previous one."""
+        record = asdict(entry)
+        record["key"] = key
+        record["content"] = base64.b64encode(entry.content).decode()
+        directory = self._dir(key)
+        # A read-only or full disk must not break requests
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
+    def keys(self, partition: str | None = None) -> Iterator[tuple[str, Path]]:
+        """Yield (key, file) for every stored entry, or those of one partition."""
+        if partition is not None:
+            pattern = f"{partition or '_'}/*.json"
+        else:
+            pattern = "*/*.json" if self._partition is not None else "*.json"
+        if not self.directory.is_dir():
+            return
+        for file in self.directory.glob(pattern):
+            found = self._read(file)
+            if found is not None:
+                yield found[0], file
+
+    def delete(self, predicate: Callable[[str], bool], partition: str | None = None) -> list[str]:
+        """Delete entries whose key matches a predicate, returning their keys.
+
+        Args:
+            predicate: Selects the keys to delete.
+            partition: Only read the files of this partition (default: all).
+        """
+        removed = []
+        for key, file in list(self.keys(partition)):
+            if predicate(key):
+                with contextlib.suppress(OSError):
+                    file.unlink()
+                    removed.append(key)
+        return removed
+
+
+def spec_hash(dataset: str, spec: dict) -> str:
+    """Return a content hash of a query spec (as sent to the API) and its dataset.
+
+    The spec is serialized canonically (sorted keys, no whitespace), so equal
+    specs hash equally regardless of field order.
+    """
+    canonical = json.dumps(
+        {"dataset": dataset, "spec": spec}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SavedQueryCache:
+    """Saved queries by spec hash, so identical specs are only created once.
+
+    Honeycomb saved queries cannot be changed or deleted, so entries never expire.
+
+    Args:
+        directory: Directory to persist entries in (optional).
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, bytes] = {}
+        self._disk = DiskCache(directory) if directory is not None else None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, dataset: str, spec: dict) -> bytes | None:
+        """Return the create response body of a saved query with this spec, if any."""
+        key = spec_hash(dataset, spec)
+        with self._lock:
+            content = self._entries.get(key)
+        if content is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None:
+                content = entry.content
+                with self._lock:
+                    self._entries[key] = content
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return content
+
+    def put(self, dataset: str, spec: dict, content: bytes) -> None:
+        """Remember the create response body of a saved query."""
+        key = spec_hash(dataset, spec)
+        with self._lock:
+            self._entries[key] = content
+        if self._disk is not None:
+            self._disk.put(key, CacheEntry(200, {}, content, math.inf))
+
+    def clear(self) -> int:
+        """Forget every saved query, returning how many were removed."""
+        with self._lock:
+            removed = set(self._entries)
+            self._entries.clear()
+        if self._disk is not None:
+            removed.update(self._disk.delete(lambda _key: True))
+        return len(removed)
+
+
+class ResponseCache:
+    """TTL + LRU cache of GET responses, keyed by path and query parameters.
+
+    A cache belongs to a single client: in-memory entries are not keyed by
+    credentials, persistent entries live under a per-credentials namespace.
+
+    Args:
+        config: Cache configuration (default: CacheConfig()).
+        namespace: Subdirectory of config.directory for this client's entries
+            (see cache_namespace).
+        clock: Wall clock (for testing).
+    """
+
+    def __init__(
+        self,
+        config: CacheConfig | None = None,
+        *,
+        namespace: str = "default",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config or CacheConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._disk: DiskCache | None = None
+        directory = (
+            Path(self.config.directory).expanduser() / namespace
+            if self.config.directory is not None
+            else None
+        )
+        if directory is not None:
+            # One subdirectory per endpoint family, so invalidating a family
+            # only reads that family's files
+            self._disk = DiskCache(directory / "responses", partition=endpoint_family)
+        self.queries: SavedQueryCache | None = None
+        if self.config.reuse_queries:
+            self.queries = SavedQueryCache(directory / "queries" if directory is not None else None)
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every invalidation so that responses fetched before a write
+        # are not stored after it
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float | None:
+        """Return the TTL for a path, or None if its family is not cached."""
+        return self.config.ttls.get(endpoint_family(path))
+
+    def _persistent(self, key: str) -> bool:
+        return self._disk is not None and endpoint_family(key) in self.config.persistent_families
+
+    def get(self, path: str, params: dict | None = None) -> CacheEntry | None:
+        """Return the fresh cached entry for a GET request, if any."""
+        if self.ttl_for(path) is None:
+            return None
+        key = cache_key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        if self._persistent(key):
+            assert self._disk is not None
+            entry = self._disk.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self.put(key, entry, persist=False)
+                with self._lock:
+                    self.hits += 1
+                return entry
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_stale(self, path: str, params: dict | None = None) -> CacheEntry | None:
+        """Return an expired entry that can be revalidated (has an ETag or Last-Modified)."""
+        if self.ttl_for(path) is None:
+            return None
+        key = cache_key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self._persistent(key):
+            assert self._disk is not None
+            entry = self._disk.get(key)
+        if entry is None or not entry.validators():
+            return None
+        return entry
+
+    def refresh(
+        self, path: str, params: dict | None, entry: CacheEntry, *, generation: int | None = None
+    ) -> CacheEntry:
+        """Renew an entry's TTL after the server confirmed it is unchanged (304)."""
+        ttl = self.ttl_for(path) or 0.0
+        renewed = CacheEntry(entry.status_code, entry.headers, entry.content, self._clock() + ttl)
+        self.put(cache_key(path, params), renewed, generation=generation)
+        return renewed
+
+    def store(
+        self,
+        path: str,
+        params: dict | None,
+        response: httpx.Response,
+        *,
+        generation: int | None = None,
+    ) -> CacheEntry | None:
+        """Cache a successful GET response if its family is cacheable.
+
+        Args:
+            path: Request path.
+            params: Query parameters.
+            response: The response to cache.
+            generation: Cache generation read before the request was sent; the
+                response is discarded if the cache was invalidated since.
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None or response.status_code != 200:
+            return None
+        entry = CacheEntry.from_response(response, self._clock() + ttl)
+        self.put(cache_key(path, params), entry, generation=generation)
+        return entry
+
+    def put(
+        self, key: str, entry: CacheEntry, *, generation: int | None = None, persist: bool = True
+    ) -> None:
+        """Insert an entry, evicting the least recently used beyond max_entries.
+
+        Entries of persistent families are also written to disk unless persist is False.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+        if persist and self._persistent(key):
+            assert self._disk is not None
+            self._disk.put(key, entry)
+
+    def invalidate(self, target: str | None = None) -> int:
+        """Drop cached responses.
+
+        Args:
+            target: An endpoint family (e.g. "columns"), a path prefix
+                (e.g. "/1/columns/my-dataset"), or None to clear everything.
+
+        Returns:
+            Number of entries removed.
+        """
+
+        def matches(key: str) -> bool:
+            if target is None:
+                return True
+            if target.startswith("/"):
+                return key.startswith(target)
+            return endpoint_family(key) == target
+
+        with self._lock:
+            keys = [k for k in self._entries if matches(k)]
+            for key in keys:
+                del self._entries[key]
+            self.generation += 1
+        removed = set(keys)
+        if self._disk is not None:
+            family = None
+            if target is not None:
+                family = endpoint_family(target) if target.startswith("/") else target
+            if family is None or family in self.config.persistent_families:
+                # Includes entries only on disk, written by earlier processes
+                removed.update(self._disk.delete(matches, family))
+        return len(removed)
+
+    def invalidate_for_write(self, path: str) -> int:
+        """Invalidate what a create/update/delete on a path may have changed.
+
+        Writes to families that are neither cached nor cascading (events,
+        triggers, queries, ...) are ignored, so they do not discard responses
+        of unrelated families that are being fetched concurrently.
+        """
+        family = endpoint_family(path)
+        if family in CASCADING_FAMILIES:
+            return self.invalidate()
+        if family not in self.config.ttls and family not in self.config.persistent_families:
+            return 0
+        return self.invalidate(family)
+
+
+class QueryResultCache:
+    """TTL + size-bounded LRU cache of query results, keyed by spec hash.
+
+    Args:
+        config: Cache configuration (default: QueryResultCacheConfig()).
+        namespace: Subdirectory of config.directory for this client's entries
+            (see cache_namespace).
+        clock: Wall clock (for testing).
+    """
+
+    def __init__(
+        self,
+        config: QueryResultCacheConfig | None = None,
+        *,
+        namespace: str = "default",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config or QueryResultCacheConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._disk: DiskCache | None = None
+        if self.config.directory is not None:
+            self._disk = DiskCache(
+                Path(self.config.directory).expanduser() / namespace / "query_results"
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the results held in memory."""
+        return self._bytes
+
+    def key(self, dataset: str, spec: dict, **options: Any) -> str:
+        """Return the cache key for running a spec (as sent to the API) with options."""
+        return spec_hash(dataset, {"spec": spec, "options": options})
+
+    def settled(self, spec: dict) -> bool:
+        """Return True if a spec's absolute time window can no longer change."""
+        start: int | None = spec.get("start_time")
+        end: int | None = spec.get("end_time")
+        if end is None:
+            if start is None:
+                return False
+            end = start + (spec.get("time_range") or DEFAULT_QUERY_TIME_RANGE)
+        return end <= self._clock() - self.config.ingestion_delay
+
+    def ttl_for(self, spec: dict) -> float:
+        """Return how long to cache the result of a spec."""
+        return self.config.settled_ttl if self.settled(spec) else self.config.open_ttl
+
+    def get(self, key: str) -> bytes | None:
+        """Return a fresh cached result body, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.content
+        if self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self._insert(key, entry)
+                with self._lock:
+                    self.hits += 1
+                return entry.content
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, spec: dict, content: bytes) -> None:
+        """Cache a result body; settled results are also written to disk."""
+        settled = self.settled(spec)
+        ttl = self.config.settled_ttl if settled else self.config.open_ttl
+        entry = CacheEntry(200, {}, content, self._clock() + ttl)
+        self._insert(key, entry)
+        if settled and self._disk is not None:
+            self._disk.put(key, entry)
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        if len(entry.content) > self.config.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.content)
+            self._entries[key] = entry
+            self._bytes += len(entry.content)
+            while self._bytes > self.config.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+
+    def clear(self) -> int:
+        """Drop every cached result, returning how many were removed."""
+        with self._lock:
+            removed = set(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+        if self._disk is not None:
+            removed.update(self._disk.delete(lambda _key: True))
+        return len(removed)
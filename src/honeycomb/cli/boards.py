@@ -2,19 +2,30 @@
 Board management commands.
 """
 
+import asyncio
+import hashlib
 import json
+from collections import Counter
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
 
+from honeycomb import HoneycombClient
 from honeycomb.cli.config import get_client
 from honeycomb.cli.formatters import DEFAULT_OUTPUT_FORMAT, OutputFormat, output_result
-from honeycomb.models.boards import BoardCreate
+from honeycomb.models.boards import Board, BoardCreate
 
 app = typer.Typer(help="Manage boards (dashboards)")
 console = Console()
 
+# Export manifest written to the export-all output directory
+MANIFEST_FILE = ".export-manifest.json"
+
+# Number of boards export-all exports at once
+DEFAULT_EXPORT_CONCURRENCY = 8
+
 
 @app.command("list")
 def list_boards(
@@ -171,33 +182,188 @@ def export_board(
         raise typer.Exit(1)
 
 
+def _board_filenames(boards: list[Board]) -> dict[str, str]:
+    """Map board IDs to export filenames, suffixing the ID where names collide."""
+    # Sanitize filename (replace special chars with dash)
+    stems = {board.id: board.name.replace("/", "-").replace(" ", "-").lower() for board in boards}
+    counts = Counter(stems.values())
+    return {
+        board_id: f"{stem}-{board_id}.json" if counts[stem] > 1 else f"{stem}.json"
+        for board_id, stem in stems.items()
+    }
+
+
+def _board_version(board: Board) -> str:
+    """Return the board's updated_at, or a hash of the listed board if the API omits it."""
+    updated_at = (board.model_extra or {}).get("updated_at")
+    if updated_at:
+        return str(updated_at)
+    return "sha256:" + hashlib.sha256(board.model_dump_json().encode()).hexdigest()
+
+
+def _views_version(views: list[dict[str, Any]]) -> str:
+    """Return a hash of a board's exported views."""
+    canonical = json.dumps(views, sort_keys=True, default=str)
+    return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _load_manifest(path: Path) -> dict[str, dict[str, Any]]:
+    """Load the board entries of an export manifest.
+
+    Returns an empty manifest, so every board is exported, if there is none or
+    it can't be read.
+    """
+    if not path.exists():
+        return {}
+    try:
+        boards = json.loads(path.read_text()).get("boards", {})
+        if not isinstance(boards, dict) or not all(isinstance(e, dict) for e in boards.values()):
+            raise ValueError("unexpected format")
+    except (OSError, ValueError, AttributeError) as e:
+        console.print(
+            f"[yellow]Ignoring unreadable manifest {path} ({e}); exporting all boards[/yellow]"
+        )
+        return {}
+    return boards
+
+
+async def _export_all_async(
+    client: HoneycombClient,
+    output_dir: Path,
+    *,
+    include_views: bool,
+    include_queries: bool,
+    incremental: bool,
+    concurrency: int,
+) -> bool:
+    """Export every board, writing each file as soon as it is fetched.
+
+    Returns:
+        True if every board was exported.
+    """
+    manifest_path = output_dir / MANIFEST_FILE
+    previous = _load_manifest(manifest_path)
+
+    async with client:
+        boards = await client.boards.list_async()
+        filenames = _board_filenames(boards)
+        manifest: dict[str, dict[str, Any]] = {}
+        # Boards to export, with the views version to compare first (if any)
+        pending: list[tuple[Board, dict[str, Any], str | None]] = []
+        options = {"views": include_views, "queries": include_queries}
+        for board in boards:
+            entry: dict[str, Any] = {
+                "name": board.name,
+                "file": filenames[board.id],
+                "version": _board_version(board),
+                "options": options,
+            }
+            prev = previous.get(board.id, {})
+            if (
+                not incremental
+                or any(prev.get(key) != value for key, value in entry.items())
+                or not (output_dir / entry["file"]).exists()
+            ):
+                pending.append((board, entry, None))
+            elif include_views:
+                # View edits don't change the board's version: compare the views
+                pending.append((board, entry, prev.get("views")))
+            else:
+                manifest[board.id] = entry
+        unchanged = len(boards) - len(pending)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def export(
+            board: Board, entry: dict[str, Any], views_version: str | None
+        ) -> tuple[Board, dict, Any]:
+            async with semaphore:
+                try:
+                    if views_version is not None:
+                        views = await client.boards.list_views_async(board.id)
+                        exported = [v.model_dump(exclude={"id"}, mode="json") for v in views]
+                        if _views_version(exported) == views_version:
+                            return board, {**entry, "views": views_version}, None
+                    data = await client.boards.export_board_async(
+                        board, include_views=include_views, include_queries=include_queries
+                    )
+                except Exception as e:
+                    return board, entry, e
+                return board, entry, data
+
+        failed = 0
+        for next_done in asyncio.as_completed([export(*args) for args in pending]):
+            board, entry, data = await next_done
+            if data is None:
+                unchanged += 1
+                manifest[board.id] = entry
+                continue
+            if isinstance(data, Exception):
+                failed += 1
+                # Keep the previous entry: its version no longer matches, so the
+                # next incremental export retries this board
+                if board.id in previous:
+                    manifest[board.id] = previous[board.id]
+                console.print(f"[red]Failed to export '{board.name}':[/red] {data}")
+                continue
+            file_path = output_dir / entry["file"]
+            file_path.write_text(json.dumps(data, indent=2, default=str))
+            if include_views:
+                entry = {**entry, "views": _views_version(data.get("views", []))}
+            manifest[board.id] = entry
+            console.print(f"[green]Exported '{board.name}' to {file_path}[/green]")
+
+    manifest_path.write_text(json.dumps({"boards": manifest}, indent=2, sort_keys=True))
+
+    summary = f"Exported {len(boards) - unchanged - failed} boards to {output_dir}"
+    if incremental:
+        summary += f" ({unchanged} unchanged)"
+    console.print(f"\n[bold green]{summary}[/bold green]")
+    if failed:
+        console.print(f"[red]{failed} boards failed to export[/red]", style="bold")
+    return not failed
+
+
 @app.command("export-all")
 def export_all_boards(
     output_dir: Path = typer.Option(..., "--output-dir", help="Output directory"),
     profile: str | None = typer.Option(None, "--profile", "-p", help="Config profile"),
     api_key: str | None = typer.Option(None, "--api-key", envvar="HONEYCOMB_API_KEY"),
+    include_views: bool = typer.Option(True, "--views/--no-views", help="Include board views"),
+    include_queries: bool = typer.Option(
+        False, "--queries/--no-queries", help="Include the query specs panels reference"
+    ),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Skip boards unchanged since the last export"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_EXPORT_CONCURRENCY, "--concurrency", "-j", min=1, help="Boards exported at once"
+    ),
 ) -> None:
-    """Export all boards to individual JSON files."""
+    """
+    Export all boards to individual JSON files.
+
+    Boards are exported concurrently. A manifest (.export-manifest.json) records
+    each board's file, version, views and export options; with --incremental,
+    boards whose updated_at and views have not changed since the last export
+    with the same options are skipped.
+    """
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        client = get_client(profile=profile, api_key=api_key)
-        boards = client.boards.list()
-
-        for board in boards:
-            # Export without IDs/timestamps
-            data = board.model_dump(exclude={"id", "created_at", "updated_at"}, mode="json")
-
-            # Sanitize filename (replace special chars with dash)
-            filename = f"{board.name}.json".replace("/", "-").replace(" ", "-").lower()
-            file_path = output_dir / filename
-
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-
-            console.print(f"[green]Exported '{board.name}' to {file_path}[/green]")
-
-        console.print(f"\n[bold green]Exported {len(boards)} boards to {output_dir}[/bold green]")
+        client = get_client(profile=profile, api_key=api_key, sync=False)
+        ok = asyncio.run(
+            _export_all_async(
+                client,
+                output_dir,
+                include_views=include_views,
+                include_queries=include_queries,
+                incremental=incremental,
+                concurrency=concurrency,
+            )
+        )
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}", style="bold")
         raise typer.Exit(1)
+    if not ok:
+        raise typer.Exit(1)
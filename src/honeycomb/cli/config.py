@@ -5,6 +5,7 @@ Handles profiles, credentials, and client initialization.
 """
 
 import os
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -13,13 +14,14 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
-from honeycomb import HoneycombClient
+from honeycomb import CacheConfig, HoneycombClient
 
 app = typer.Typer(help="Manage CLI configuration and profiles")
 console = Console()
 
 CONFIG_DIR = Path.home() / ".honeycomb"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
+CACHE_DIR = CONFIG_DIR / "cache"
 
 
 def _ensure_config_dir() -> None:
@@ -71,16 +73,38 @@ def get_api_key_from_config(profile: str | None = None) -> str | None:
     return profiles[profile_name].get("api_key")
 
 
+def _get_cache_dir() -> Path:
+    """Get the persistent metadata cache directory (HONEYCOMB_CACHE_DIR overrides)."""
+    return Path(os.environ.get("HONEYCOMB_CACHE_DIR") or CACHE_DIR)
+
+
+def get_cache_config() -> CacheConfig | None:
+    """
+    Get the response cache configuration for CLI clients.
+
+    Dataset, column and derived-column listings are persisted under the cache
+    directory so that repeated CLI invocations start warm. Set HONEYCOMB_NO_CACHE=1
+    to disable caching.
+    """
+    if os.environ.get("HONEYCOMB_NO_CACHE"):
+        return None
+    return CacheConfig(directory=_get_cache_dir())
+
+
 def get_client(
     profile: str | None = None,
     api_key: str | None = None,
     management_key: str | None = None,
     management_secret: str | None = None,
     base_url: str | None = None,
+    sync: bool = True,
 ) -> HoneycombClient:
     """
     Get a configured Honeycomb client.
 
+    Clients are created in sync mode unless sync=False is passed (for commands
+    that run requests concurrently).
+
     Priority order:
     1. Explicit parameters (api_key, management_key, etc.)
     2. Environment variables (HONEYCOMB_API_KEY, etc.)
@@ -94,7 +118,8 @@ def get_client(
             management_key=management_key,
             management_secret=management_secret,
             base_url=base_url or "https://api.honeycomb.io",
-            sync=True,
+            cache=get_cache_config(),
+            sync=sync,
         )
 
     # Try environment variables
@@ -108,7 +133,8 @@ def get_client(
             management_key=env_mgmt_key,
             management_secret=env_mgmt_secret,
             base_url=base_url or "https://api.honeycomb.io",
-            sync=True,
+            cache=get_cache_config(),
+            sync=sync,
         )
 
     # Try profile from config file
@@ -138,7 +164,8 @@ def get_client(
         management_key=profile_config.get("management_key"),
         management_secret=profile_config.get("management_secret"),
         base_url=profile_config.get("base_url", "https://api.honeycomb.io"),
-        sync=True,
+        cache=get_cache_config(),
+        sync=sync,
     )
 
 
@@ -257,3 +284,15 @@ def set_default(name: str = typer.Argument(..., help="Profile name")) -> None:
     config["default_profile"] = name
     _save_config(config)
     console.print(f"[green]Default profile set to '{name}'[/green]")
+
+
+@app.command("clear-cache")
+def clear_cache() -> None:
+    """Clear the persistent metadata cache."""
+    cache_dir = _get_cache_dir()
+    if not cache_dir.exists():
+        console.print(f"[yellow]No cache found at {cache_dir}[/yellow]")
+        return
+
+    shutil.rmtree(cache_dir)
+    console.print(f"[green]Cache cleared at {cache_dir}[/green]")
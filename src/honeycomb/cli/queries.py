@@ -161,7 +161,9 @@ def run_query(
     order_by: str | None = typer.Option(None, "--order-by", help="Order by field"),
     limit_rows: int | None = typer.Option(None, "--limit", help="Limit results"),
     # Query execution
-    poll_interval: float = typer.Option(1.0, "--poll-interval", help="Polling interval in seconds"),
+    poll_interval: float | None = typer.Option(
+        None, "--poll-interval", help="Maximum polling interval in seconds"
+    ),
     timeout: float = typer.Option(60.0, "--timeout", help="Timeout in seconds"),
     # Auth and output
     profile: str | None = typer.Option(None, "--profile", "-p", help="Config profile"),
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import importlib.util
+import random
+import threading
 from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,9 +16,19 @@ from typing import TYPE_CHECKING, Any
 import httpx
 
 from .auth import create_auth
+from .cache import (
+    CacheConfig,
+    CacheEntry,
+    QueryResultCache,
+    QueryResultCacheConfig,
+    ResponseCache,
+    cache_namespace,
+)
+from .codec import JSONCodec, create_json_codec
 from .exceptions import (
     HoneycombAPIError,
     HoneycombAuthError,
+    HoneycombCircuitOpenError,
     HoneycombConnectionError,
     HoneycombForbiddenError,
     HoneycombNotFoundError,
@@ -23,8 +37,12 @@ from .exceptions import (
     HoneycombTimeoutError,
     HoneycombValidationError,
 )
+from .polling import PollStrategy
+from .rate_limit import RateLimiter
+from .resilience import CircuitBreaker, RetryBudget, get_circuit_breaker, get_retry_budget
 
 if TYPE_CHECKING:
+    from .apply import ApplyPlan, ApplyResult, DesiredState
     from .resources.api_keys import ApiKeysResource
     from .resources.auth import AuthResource
     from .resources.boards import BoardsResource
@@ -47,6 +65,10 @@ if TYPE_CHECKING:
 DEFAULT_BASE_URL = "https://api.honeycomb.io"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_APPLY_CONCURRENCY = 8
+
+
+JITTER_MODES = ("none", "full", "decorrelated")
 
 
 @dataclass
@@ -59,6 +81,15 @@ class RetryConfig:
         max_delay: Maximum delay in seconds between retries.
         exponential_base: Base for exponential backoff calculation.
         retry_statuses: HTTP status codes that should trigger a retry.
+        jitter: Randomization of backoff delays: "none" (deterministic), "full"
+            (uniform between 0 and the exponential delay) or "decorrelated"
+            (uniform between base_delay and 3x the previous delay).
+        retry_budget: Maximum retries as a fraction of requests, shared by all
+            clients in the process (None disables the budget).
+        retry_budget_min: Retries always allowed per 10s window under a retry budget.
+        circuit_breaker_threshold: Consecutive failures (5xx, timeouts, connection
+            errors) after which requests to the host fail fast (None disables it).
+        circuit_breaker_reset: Seconds an open circuit waits before a probe request.
     """
 
     max_retries: int = 3
@@ -66,6 +97,94 @@ class RetryConfig:
     max_delay: float = 30.0
     exponential_base: float = 2.0
     retry_statuses: set[int] = field(default_factory=lambda: {429, 500, 502, 503, 504})
+    jitter: str = "none"
+    retry_budget: float | None = None
+    retry_budget_min: int = 10
+    circuit_breaker_threshold: int | None = None
+    circuit_breaker_reset: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.jitter not in JITTER_MODES:
+            raise ValueError(
+                f"Unsupported jitter mode: {self.jitter!r}. Must be one of: {', '.join(JITTER_MODES)}"
+            )
+
+
+COMPRESSION_CODECS = ("gzip", "zstd")
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "zstd": 3}
+
+
+@dataclass
+class CompressionConfig:
+    """Configuration for request-body compression on event ingestion.
+
+    The events endpoints accept gzip or zstd encoded bodies. Compression is
+    skipped for bodies smaller than ``min_size``, where the CPU cost outweighs
+    the bytes saved.
+
+    Attributes:
+        codec: Compression codec, "gzip" or "zstd" (zstd requires the zstandard package).
+        level: Compression level (default: 6 for gzip, 3 for zstd).
+        min_size: Minimum uncompressed body size in bytes to compress.
+    """
+
+    codec: str = "gzip"
+    level: int | None = None
+    min_size: int = 1024
+
+    def __post_init__(self) -> None:
+        if self.codec not in COMPRESSION_CODECS:
+            raise ValueError(
+                f"Unsupported compression codec: {self.codec!r}. "
+                f"Must be one of: {', '.join(COMPRESSION_CODECS)}"
+            )
+        if self.codec == "zstd" and importlib.util.find_spec("zstandard") is None:
+            raise ImportError(
+                "zstd compression requires the 'zstandard' package. "
+                "Install it with: pip install zstandard"
+            )
+
+    def compress(self, body: bytes) -> bytes:
+        """Compress a request body with the configured codec."""
+        level = self.level if self.level is not None else DEFAULT_COMPRESSION_LEVELS[self.codec]
+        if self.codec == "zstd":
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=level).compress(body)
+        return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+@dataclass
+class PoolConfig:
+    """Configuration for HTTP connection pooling.
+
+    Defaults match httpx's own defaults.
+
+    Attributes:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        http2: Enable HTTP/2 (requires the h2 package: pip install 'httpx[http2]').
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+
+    def __post_init__(self) -> None:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package. Install it with: pip install 'httpx[http2]'"
+            )
+
+    def limits(self) -> httpx.Limits:
+        """Return the equivalent httpx.Limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
 
 @dataclass
@@ -105,6 +224,30 @@ class HoneycombClient:
         timeout: Request timeout in seconds (default: 30).
         max_retries: Maximum retry attempts for failed requests (default: 3).
         retry_config: Custom retry configuration (optional, overrides max_retries).
+        compression: Request-body compression for event ingestion (optional, off by default).
+        json_codec: JSON backend for request/response bodies: a JSONCodec instance or one of
+            "auto", "orjson", "msgspec", "stdlib" (default: "auto", fastest installed).
+        pool: HTTP connection pool and HTTP/2 settings (optional, httpx defaults).
+        http_client: Externally-owned httpx.AsyncClient (or httpx.Client with sync=True) to
+            send requests through, e.g. one shared by clients for several environments.
+            The Honeycomb client adds its own base URL and auth headers and never closes it.
+        transport: httpx transport for the client's own HTTP client, e.g. a shared
+            httpx.AsyncHTTPTransport. A shared transport is not closed by this client.
+        rate_limiter: Client-side rate limiting driven by rate limit response headers. True
+            (default) gives the client its own RateLimiter, False disables it, and a
+            RateLimiter instance can be shared between clients using the same credentials.
+        cache: Cache GET responses of read-mostly metadata endpoints (datasets, columns,
+            derived columns, recipients, marker settings, auth) with per-family TTLs
+            (optional, off by default). With CacheConfig.directory set, dataset, column
+            and derived-column listings persist across processes and are revalidated
+            with ETag / Last-Modified when stale.
+        result_cache: Cache query results by spec (optional, off by default). Results of
+            absolute time windows that have settled are kept long and persisted; relative
+            or still-open windows only briefly.
+        poll_strategy: Adaptive polling schedule shared by every poll loop (query results,
+            service map dependencies). Defaults to PollStrategy().
+        coalesce_requests: Merge concurrent identical GET requests (same path and params)
+            into a single network call whose response is shared (async only, default: False).
         sync: If True, use synchronous HTTP client (default: False).
     """
 
@@ -118,6 +261,16 @@ class HoneycombClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_config: RetryConfig | None = None,
+        compression: CompressionConfig | None = None,
+        json_codec: JSONCodec | str = "auto",
+        pool: PoolConfig | None = None,
+        http_client: httpx.AsyncClient | httpx.Client | None = None,
+        transport: httpx.AsyncBaseTransport | httpx.BaseTransport | None = None,
+        rate_limiter: RateLimiter | bool = True,
+        cache: CacheConfig | None = None,
+        result_cache: QueryResultCacheConfig | None = None,
+        poll_strategy: PollStrategy | None = None,
+        coalesce_requests: bool = False,
         sync: bool = False,
     ) -> None:
         self._auth = create_auth(
@@ -129,11 +282,52 @@ class HoneycombClient:
         self._timeout = timeout
         self._max_retries = max_retries
         self._retry_config = retry_config or RetryConfig(max_retries=max_retries)
+        self._retry_budget: RetryBudget | None = None
+        if self._retry_config.retry_budget is not None:
+            self._retry_budget = get_retry_budget(
+                self._retry_config.retry_budget, self._retry_config.retry_budget_min
+            )
+        self._circuit_breaker: CircuitBreaker | None = None
+        if self._retry_config.circuit_breaker_threshold is not None:
+            self._circuit_breaker = get_circuit_breaker(
+                httpx.URL(self._base_url).host,
+                self._retry_config.circuit_breaker_threshold,
+                self._retry_config.circuit_breaker_reset,
+            )
+        self._compression = compression
+        self._json_codec = (
+            json_codec if isinstance(json_codec, JSONCodec) else create_json_codec(json_codec)
+        )
+        if isinstance(rate_limiter, RateLimiter):
+            self._rate_limiter: RateLimiter | None = rate_limiter
+        else:
+            self._rate_limiter = RateLimiter() if rate_limiter else None
+        namespace = cache_namespace(self._base_url, self._auth.get_headers())
+        self._cache: ResponseCache | None = None
+        if cache is not None:
+            self._cache = ResponseCache(cache, namespace=namespace)
+        self._result_cache: QueryResultCache | None = None
+        if result_cache is not None:
+            self._result_cache = QueryResultCache(result_cache, namespace=namespace)
+        self._poll_strategy = poll_strategy or PollStrategy()
+        self._coalesce_requests = coalesce_requests
+        self._inflight: dict[tuple[str, str, str], asyncio.Task[httpx.Response]] = {}
         self._sync_mode = sync
 
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either http_client or transport, not both")
+        expected = httpx.Client if sync else httpx.AsyncClient
+        if http_client is not None and not isinstance(http_client, expected):
+            raise TypeError(f"http_client must be an {expected.__name__} when sync={sync}")
+        self._pool = pool or PoolConfig()
+        self._transport = transport
+        self._external_client = http_client
+
         # HTTP clients (lazily initialized)
         self._async_client: httpx.AsyncClient | None = None
         self._sync_client: httpx.Client | None = None
+        # Sync resources may call _get_sync_client() from worker threads
+        self._sync_client_lock = threading.Lock()
 
         # Resource instances (lazily initialized)
         self._triggers: TriggersResource | None = None
@@ -311,30 +505,140 @@ class HoneycombClient:
             self._service_map_dependencies = ServiceMapDependenciesResource(self)
         return self._service_map_dependencies
 
+    # -------------------------------------------------------------------------
+    # Declarative apply
+    # -------------------------------------------------------------------------
+
+    async def plan_async(
+        self, desired: DesiredState, *, max_concurrency: int = DEFAULT_APPLY_CONCURRENCY
+    ) -> ApplyPlan:
+        """Compute the changes needed to reach a desired state, without making them.
+
+        Lists triggers and SLOs for every dataset in `desired` concurrently,
+        then compares each declared object with the existing one by content hash.
+
+        Args:
+            desired: Triggers, SLOs and boards that should exist.
+            max_concurrency: Maximum list requests in flight (default: 8).
+
+        Returns:
+            ApplyPlan of creates, updates and deletes.
+
+        Raises:
+            ValueError: If `desired` declares a name twice.
+
+        Example:
+            >>> plan = await client.plan_async(DesiredState(triggers=[bundle]))
+            >>> print(plan.format())
+        """
+        from .apply import ApplyEngine
+
+        return await ApplyEngine(self, max_concurrency).plan(desired)
+
+    async def apply_async(
+        self,
+        desired: DesiredState,
+        *,
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_APPLY_CONCURRENCY,
+    ) -> ApplyResult:
+        """Create, update and delete triggers, SLOs and boards to match a desired state.
+
+        Objects whose content already matches are not touched. Changes run
+        concurrently; a failed change is reported in the result and does not
+        stop the others. Deletes run after every create and update has
+        succeeded, and are skipped otherwise.
+
+        Args:
+            desired: Triggers, SLOs and boards that should exist.
+            dry_run: Only compute the plan (default: False).
+            max_concurrency: Maximum requests in flight (default: 8).
+
+        Returns:
+            ApplyResult with the plan and the succeeded, failed and skipped items.
+
+        Raises:
+            ValueError: If `desired` declares a name twice.
+
+        Example:
+            >>> result = await client.apply_async(desired)
+            >>> for item, error in result.failed:
+            ...     print(f"{item}: {error}")
+        """
+        from .apply import ApplyEngine, ApplyResult
+
+        engine = ApplyEngine(self, max_concurrency)
+        plan = await engine.plan(desired)
+        if dry_run:
+            return ApplyResult(plan, dry_run=True)
+        return await engine.execute(plan)
+
     # -------------------------------------------------------------------------
     # HTTP client management
     # -------------------------------------------------------------------------
 
     def _get_sync_client(self) -> httpx.Client:
         """Get or create the sync HTTP client."""
-        if self._sync_client is None:
-            self._sync_client = httpx.Client(
-                base_url=self._base_url,
-                headers=self._auth.get_headers(),
-                timeout=self._timeout,
-            )
-        return self._sync_client
+        if isinstance(self._external_client, httpx.Client):
+            return self._external_client
+        client = self._sync_client
+        if client is None:
+            with self._sync_client_lock:
+                client = self._sync_client
+                if client is None:
+                    transport = self._transport
+                    if transport is not None and not isinstance(transport, httpx.BaseTransport):
+                        raise TypeError("transport must be an httpx.BaseTransport when sync=True")
+                    client = self._sync_client = httpx.Client(
+                        base_url=self._base_url,
+                        headers=self._auth.get_headers(),
+                        timeout=self._timeout,
+                        limits=self._pool.limits(),
+                        http2=self._pool.http2,
+                        transport=transport,
+                    )
+        return client
 
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
+        if isinstance(self._external_client, httpx.AsyncClient):
+            return self._external_client
         if self._async_client is None:
+            transport = self._transport
+            if transport is not None and not isinstance(transport, httpx.AsyncBaseTransport):
+                raise TypeError("transport must be an httpx.AsyncBaseTransport in async mode")
             self._async_client = httpx.AsyncClient(
                 base_url=self._base_url,
                 headers=self._auth.get_headers(),
                 timeout=self._timeout,
+                limits=self._pool.limits(),
+                http2=self._pool.http2,
+                transport=transport,
             )
         return self._async_client
 
+    def _cache_lookup(self, path: str, params: dict | None) -> httpx.Response | None:
+        """Return a cached response for a GET request, if a fresh one exists."""
+        assert self._cache is not None
+        entry = self._cache.get(path, params)
+        if entry is None:
+            return None
+        url, _ = self._request_target(path, None)
+        return entry.to_response(httpx.Request("GET", url, params=params))
+
+    def _request_target(
+        self, path: str, headers: dict[str, str] | None
+    ) -> tuple[str, dict[str, str] | None]:
+        """Return the URL and headers to send a request with.
+
+        Requests through an externally-owned http_client carry the base URL and
+        auth headers themselves, since the shared client is not configured for
+        this HoneycombClient.
+        """
+        if self._external_client is None:
+            return path, headers
+        return f"{self._base_url}{path}", {**self._auth.get_headers(), **(headers or {})}
+
     # -------------------------------------------------------------------------
     # Context managers
     # -------------------------------------------------------------------------
@@ -358,15 +662,23 @@ class HoneycombClient:
         self.close()
 
     async def aclose(self) -> None:
-        """Close async HTTP client."""
+        """Close async HTTP client.
+
+        An externally-owned http_client or shared transport is left open.
+        """
         if self._async_client is not None:
-            await self._async_client.aclose()
+            if self._transport is None:
+                await self._async_client.aclose()
             self._async_client = None
 
     def close(self) -> None:
-        """Close sync HTTP client."""
+        """Close sync HTTP client.
+
+        An externally-owned http_client or shared transport is left open.
+        """
         if self._sync_client is not None:
-            self._sync_client.close()
+            if self._transport is None:
+                self._sync_client.close()
             self._sync_client = None
 
     # -------------------------------------------------------------------------
@@ -415,6 +727,19 @@ class HoneycombClient:
 
         return info
 
+    def _record_rate_limit(self, path: str, response: httpx.Response) -> None:
+        """Feed rate limit headers (and 429 Retry-After) into the rate limiter."""
+        if self._rate_limiter is None:
+            return
+        info = self._parse_rate_limit_headers(response)
+        self._rate_limiter.update(path, info)
+        if response.status_code == 429:
+            retry_after = self._parse_retry_after(response)
+            if retry_after is None:
+                retry_after = info.reset
+            if retry_after is not None:
+                self._rate_limiter.penalize(path, retry_after)
+
     def _parse_retry_after(self, response: httpx.Response) -> int | None:
         """Parse Retry-After header.
 
@@ -455,7 +780,7 @@ class HoneycombClient:
         - JSON:API: {"errors": [{"detail": "..."}]}
         """
         try:
-            body = response.json()
+            body = self._json_codec.decode(response.content)
         except Exception:
             return response.text or "Unknown error", None
 
@@ -512,12 +837,15 @@ class HoneycombClient:
             return False
         return response.status_code in self._retry_config.retry_statuses
 
-    def _calculate_backoff(self, attempt: int, retry_after: int | None = None) -> float:
+    def _calculate_backoff(
+        self, attempt: int, retry_after: int | None = None, previous: float | None = None
+    ) -> float:
         """Calculate backoff delay for retry.
 
         Args:
             attempt: The current retry attempt number (0-indexed).
             retry_after: Explicit retry delay in seconds from server (optional).
+            previous: The previous backoff delay, used by decorrelated jitter (optional).
 
         Returns:
             Number of seconds to wait before retrying.
@@ -525,9 +853,66 @@ class HoneycombClient:
         if retry_after:
             return float(retry_after)
 
+        config = self._retry_config
+        if config.jitter == "decorrelated":
+            upper = max(previous or config.base_delay, config.base_delay) * 3
+            return min(random.uniform(config.base_delay, upper), config.max_delay)
+
         # Exponential backoff: base_delay * (exponential_base ^ attempt)
-        delay = self._retry_config.base_delay * (self._retry_config.exponential_base**attempt)
-        return min(delay, self._retry_config.max_delay)
+        delay = min(config.base_delay * (config.exponential_base**attempt), config.max_delay)
+        if config.jitter == "full":
+            return random.uniform(0, delay)
+        return delay
+
+    def _allow_retry(self) -> bool:
+        """Withdraw a retry from the retry budget, if one is configured."""
+        return self._retry_budget is None or self._retry_budget.try_retry()
+
+    def _check_circuit(self) -> None:
+        """Fail fast if the circuit breaker for the API host is open."""
+        if self._circuit_breaker is None:
+            return
+        retry_in = self._circuit_breaker.before_request()
+        if retry_in is not None:
+            raise HoneycombCircuitOpenError(httpx.URL(self._base_url).host, retry_in)
+
+    def _record_outcome(self, failed: bool) -> None:
+        """Report a request outcome to the circuit breaker."""
+        if self._circuit_breaker is None:
+            return
+        if failed:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+
+    def _encode_json_body(self, payload: Any, *, compress: bool = False) -> tuple[bytes, dict]:
+        """Serialize a JSON request body, compressing it when configured.
+
+        Args:
+            payload: JSON-serializable request body.
+            compress: Apply the client's CompressionConfig (if any) to the body.
+
+        Returns:
+            Tuple of (body bytes, headers describing the body).
+        """
+        return self._prepare_json_body(self._json_codec.encode(payload), compress=compress)
+
+    def _prepare_json_body(self, body: bytes, *, compress: bool = False) -> tuple[bytes, dict]:
+        """Build headers for an already-serialized JSON body, compressing it when configured.
+
+        Args:
+            body: Serialized JSON request body.
+            compress: Apply the client's CompressionConfig (if any) to the body.
+
+        Returns:
+            Tuple of (body bytes, headers describing the body).
+        """
+        headers = {"Content-Type": "application/json"}
+        config = self._compression
+        if compress and config is not None and len(body) >= config.min_size:
+            body = config.compress(body)
+            headers["Content-Encoding"] = config.codec
+        return body, headers
 
     # -------------------------------------------------------------------------
     # Async request methods
@@ -539,45 +924,150 @@ class HoneycombClient:
         path: str,
         *,
         json: dict | None = None,
+        content: bytes | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Make an async HTTP request with retry logic."""
+        """Make an async HTTP request with retry logic.
+
+        Plain GETs are served from the response cache when enabled, and with
+        coalesce_requests concurrent identical GETs share one request.
+        """
+        cacheable = method == "GET" and json is None and content is None and headers is None
+        generation = 0
+        if cacheable and self._cache is not None:
+            cached = self._cache_lookup(path, params)
+            if cached is not None:
+                return cached
+            generation = self._cache.generation
+            stale = self._cache.get_stale(path, params)
+            if stale is not None:
+                return await self._revalidate_async(path, params, stale, generation)
+        try:
+            if cacheable and self._coalesce_requests:
+                response = await self._request_coalesced_async(method, path, params)
+            else:
+                response = await self._send_async(
+                    method, path, json=json, content=content, params=params, headers=headers
+                )
+        finally:
+            if method != "GET" and self._cache is not None:
+                self._cache.invalidate_for_write(path)
+        if cacheable and self._cache is not None:
+            self._cache.store(path, params, response, generation=generation)
+        return response
+
+    async def _revalidate_async(
+        self, path: str, params: dict | None, stale: CacheEntry, generation: int
+    ) -> httpx.Response:
+        """Revalidate a stale cache entry with a conditional GET."""
+        response = await self._send_async("GET", path, params=params, headers=stale.validators())
+        return self._finish_revalidation(path, params, stale, generation, response)
+
+    def _finish_revalidation(
+        self,
+        path: str,
+        params: dict | None,
+        stale: CacheEntry,
+        generation: int,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Serve the cached body on 304 Not Modified, otherwise cache the new response."""
+        assert self._cache is not None
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            entry = self._cache.refresh(path, params, stale, generation=generation)
+            return entry.to_response(response.request)
+        self._cache.store(path, params, response, generation=generation)
+        return response
+
+    async def _request_coalesced_async(
+        self, method: str, path: str, params: dict | None
+    ) -> httpx.Response:
+        """Join an identical in-flight request, or start one that others can join.
+
+        The request runs in its own task so that a cancelled caller does not
+        cancel it for the others waiting on the same response.
+        """
+        key = (method, path, repr(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_async(method, path, params=params))
+            self._inflight[key] = task
+
+            def _done(t: asyncio.Task[httpx.Response]) -> None:
+                if self._inflight.get(key) is t:
+                    del self._inflight[key]
+                # Mark the exception retrieved even if every caller was cancelled
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict | None = None,
+        content: bytes | None = None,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send an async HTTP request with retry logic."""
+        if json is not None:
+            content = self._json_codec.encode(json)
+            headers = {"Content-Type": "application/json", **(headers or {})}
         client = self._get_async_client()
+        url, headers = self._request_target(path, headers)
         last_response: httpx.Response | None = None
+        delay: float | None = None
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
 
         for attempt in range(self._max_retries + 1):
+            self._check_circuit()
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async(path)
             try:
                 response = await client.request(
                     method,
-                    path,
-                    json=json,
+                    url,
+                    content=content,
                     params=params,
                     headers=headers,
+                    timeout=self._timeout,
                 )
                 last_response = response
+                self._record_rate_limit(path, response)
+                self._record_outcome(failed=response.status_code >= 500)
 
-                if response.is_success:
+                # 304 only answers the conditional requests used to revalidate the cache
+                if response.is_success or response.status_code == httpx.codes.NOT_MODIFIED:
                     return response
 
-                if self._should_retry(response, attempt):
+                if self._should_retry(response, attempt) and self._allow_retry():
                     retry_after = self._parse_retry_after(response)
-                    delay = self._calculate_backoff(attempt, retry_after)
+                    delay = self._calculate_backoff(attempt, retry_after, delay)
                     await asyncio.sleep(delay)
                     continue
 
-                # Non-retryable error
+                # Non-retryable error (or retry budget exhausted)
                 self._raise_for_status(response)
 
             except httpx.TimeoutException as e:
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
+                self._record_outcome(failed=True)
+                if attempt < self._max_retries and self._allow_retry():
+                    delay = self._calculate_backoff(attempt, previous=delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise HoneycombTimeoutError(timeout=self._timeout) from e
 
             except httpx.ConnectError as e:
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
+                self._record_outcome(failed=True)
+                if attempt < self._max_retries and self._allow_retry():
+                    delay = self._calculate_backoff(attempt, previous=delay)
+                    await asyncio.sleep(delay)
                     continue
                 raise HoneycombConnectionError(original_error=e) from e
 
@@ -595,11 +1085,14 @@ class HoneycombClient:
         path: str,
         *,
         json: dict | None = None,
+        content: bytes | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Make an async POST request."""
-        return await self._request_async("POST", path, json=json, params=params, headers=headers)
+        return await self._request_async(
+            "POST", path, json=json, content=content, params=params, headers=headers
+        )
 
     async def put_async(
         self,
@@ -637,47 +1130,108 @@ class HoneycombClient:
         path: str,
         *,
         json: dict | None = None,
+        content: bytes | None = None,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Make a sync HTTP request with retry logic.
+
+        Plain GETs are served from the response cache when enabled.
+        """
+        cacheable = method == "GET" and json is None and content is None and headers is None
+        generation = 0
+        if cacheable and self._cache is not None:
+            cached = self._cache_lookup(path, params)
+            if cached is not None:
+                return cached
+            generation = self._cache.generation
+            stale = self._cache.get_stale(path, params)
+            if stale is not None:
+                return self._revalidate_sync(path, params, stale, generation)
+        try:
+            response = self._send_sync(
+                method, path, json=json, content=content, params=params, headers=headers
+            )
+        finally:
+            if method != "GET" and self._cache is not None:
+                self._cache.invalidate_for_write(path)
+        if cacheable and self._cache is not None:
+            self._cache.store(path, params, response, generation=generation)
+        return response
+
+    def _revalidate_sync(
+        self, path: str, params: dict | None, stale: CacheEntry, generation: int
+    ) -> httpx.Response:
+        """Revalidate a stale cache entry with a conditional GET."""
+        response = self._send_sync("GET", path, params=params, headers=stale.validators())
+        return self._finish_revalidation(path, params, stale, generation, response)
+
+    def _send_sync(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict | None = None,
+        content: bytes | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Make a sync HTTP request with retry logic."""
+        """Send a sync HTTP request with retry logic."""
+        if json is not None:
+            content = self._json_codec.encode(json)
+            headers = {"Content-Type": "application/json", **(headers or {})}
         import time
 
         client = self._get_sync_client()
+        url, headers = self._request_target(path, headers)
         last_response: httpx.Response | None = None
+        delay: float | None = None
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
 
         for attempt in range(self._max_retries + 1):
+            self._check_circuit()
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(path)
             try:
                 response = client.request(
                     method,
-                    path,
-                    json=json,
+                    url,
+                    content=content,
                     params=params,
                     headers=headers,
+                    timeout=self._timeout,
                 )
                 last_response = response
+                self._record_rate_limit(path, response)
+                self._record_outcome(failed=response.status_code >= 500)
 
-                if response.is_success:
+                # 304 only answers the conditional requests used to revalidate the cache
+                if response.is_success or response.status_code == httpx.codes.NOT_MODIFIED:
                     return response
 
-                if self._should_retry(response, attempt):
+                if self._should_retry(response, attempt) and self._allow_retry():
                     retry_after = self._parse_retry_after(response)
-                    delay = self._calculate_backoff(attempt, retry_after)
+                    delay = self._calculate_backoff(attempt, retry_after, delay)
                     time.sleep(delay)
                     continue
 
-                # Non-retryable error
+                # Non-retryable error (or retry budget exhausted)
                 self._raise_for_status(response)
 
             except httpx.TimeoutException as e:
-                if attempt < self._max_retries:
-                    time.sleep(self._calculate_backoff(attempt))
+                self._record_outcome(failed=True)
+                if attempt < self._max_retries and self._allow_retry():
+                    delay = self._calculate_backoff(attempt, previous=delay)
+                    time.sleep(delay)
                     continue
                 raise HoneycombTimeoutError(timeout=self._timeout) from e
 
             except httpx.ConnectError as e:
-                if attempt < self._max_retries:
-                    time.sleep(self._calculate_backoff(attempt))
+                self._record_outcome(failed=True)
+                if attempt < self._max_retries and self._allow_retry():
+                    delay = self._calculate_backoff(attempt, previous=delay)
+                    time.sleep(delay)
                     continue
                 raise HoneycombConnectionError(original_error=e) from e
 
@@ -695,11 +1249,14 @@ class HoneycombClient:
         path: str,
         *,
         json: dict | None = None,
+        content: bytes | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Make a sync POST request."""
-        return self._request_sync("POST", path, json=json, params=params, headers=headers)
+        return self._request_sync(
+            "POST", path, json=json, content=content, params=params, headers=headers
+        )
 
     def put_sync(
         self,
@@ -731,6 +1288,35 @@ class HoneycombClient:
     # Convenience properties
     # -------------------------------------------------------------------------
 
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Return the response cache, or None if caching is disabled.
+
+        Example:
+            >>> client.cache.invalidate("columns")
+        """
+        return self._cache
+
+    @property
+    def result_cache(self) -> QueryResultCache | None:
+        """Return the query result cache, or None if result caching is disabled."""
+        return self._result_cache
+
+    @property
+    def poll_strategy(self) -> PollStrategy:
+        """Return the polling strategy (and its stats) shared by all poll loops."""
+        return self._poll_strategy
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Return the client-side rate limiter, or None if disabled."""
+        return self._rate_limiter
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """Return the JSON codec used for request and response bodies."""
+        return self._json_codec
+
     @property
     def is_sync(self) -> bool:
         """Return True if client is in sync mode."""
@@ -0,0 +1,143 @@
+"""JSON codecs for request and response bodies.
+
+The client serializes request bodies and parses response bodies through a
+single JSONCodec. By default the fastest installed backend is used:
+orjson, then msgspec, falling back to the standard library.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+CODEC_NAMES = ("auto", "orjson", "msgspec", "stdlib")
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types every backend supports, the way msgspec does.
+
+    Raises:
+        TypeError: For any other type, like ``json.dumps`` without ``default``.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, time)):
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec(ABC):
+    """Base class for JSON encode/decode backends.
+
+    Besides plain JSON values, every backend encodes enums (as their value),
+    datetimes (ISO 8601, with ``Z`` for UTC), UUIDs and dataclasses, and
+    produces the same bytes for them. Any other type raises ``TypeError``.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        ...
+
+    @abstractmethod
+    def decode(self, data: bytes | str) -> Any:
+        """Parse JSON bytes or text into Python objects."""
+        ...
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return self.encode(obj).decode()
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Format datetimes in _default so they match the other backends
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_default, option=self._options)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+def create_json_codec(name: str = "auto") -> JSONCodec:
+    """Create a JSON codec by backend name.
+
+    Args:
+        name: One of "auto", "orjson", "msgspec" or "stdlib". "auto" picks the
+            fastest installed backend.
+
+    Returns:
+        A JSONCodec instance.
+
+    Raises:
+        ValueError: If the name is not a known backend.
+        ImportError: If the requested backend is not installed.
+    """
+    if name not in CODEC_NAMES:
+        raise ValueError(f"Unknown JSON codec: {name!r}. Must be one of: {', '.join(CODEC_NAMES)}")
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "msgspec":
+        return MsgspecCodec()
+    if name == "stdlib":
+        return StdlibJSONCodec()
+
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibJSONCodec()
@@ -193,6 +193,31 @@ class HoneycombConnectionError(HoneycombAPIError):
         self.original_error = original_error
 
 
+class HoneycombCircuitOpenError(HoneycombAPIError):
+    """Circuit breaker is open.
+
+    Raised without sending a request when recent requests to the API host kept
+    failing (see RetryConfig.circuit_breaker_threshold).
+
+    Attributes:
+        host: API host the circuit belongs to.
+        retry_in: Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        retry_in: float,
+        message: str = "Circuit breaker open after repeated failures",
+    ) -> None:
+        super().__init__(message, status_code=0)
+        self.host = host
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return f"{self.message} for {self.host} (retry in {self.retry_in:.1f}s)"
+
+
 def raise_for_status(
     status_code: int,
     response_body: dict | None = None,
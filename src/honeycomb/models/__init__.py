@@ -19,6 +19,7 @@ from .boards import (
     BoardViewFilter,
 )
 from .burn_alerts import BurnAlert, BurnAlertCreate, BurnAlertRecipient, BurnAlertType
+from .columnar import ColumnarResult
 from .columns import Column, ColumnCreate, ColumnType
 from .datasets import Dataset, DatasetCreate, DatasetUpdate
 from .derived_columns import DerivedColumn, DerivedColumnBuilder, DerivedColumnCreate
@@ -67,6 +68,7 @@ from .service_map_dependencies import (
 from .slo_builder import BurnAlertBuilder, BurnAlertDefinition, SLIDefinition, SLOBuilder, SLOBundle
 from .slos import SLI, SLO, SLOCreate
 from .tags_mixin import TagsMixin
+from .timeseries import TimeSeries
 from .trigger_builder import TriggerBuilder, TriggerBundle
 from .triggers import (
     Trigger,
@@ -128,6 +130,8 @@ __all__ = [
     "QuerySpec",
     "QueryResult",
     "QueryResultData",
+    "ColumnarResult",
+    "TimeSeries",
     # Query Annotations
     "QueryAnnotation",
     "QueryAnnotationCreate",
@@ -0,0 +1,167 @@
+"""Column-oriented view of query result rows.
+
+A 10K-row query result is 10K dicts that repeat every key string. A
+ColumnarResult stores one column per breakdown and calculation instead:
+numeric columns are typed ``array.array`` buffers and string columns hold
+interned strings, so repeated breakdown values share one object.
+
+Numeric columns export to NumPy and Arrow without copying. Both libraries are
+optional and only imported by the export methods.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeAlias
+
+# array typecodes for numeric columns, with the matching NumPy dtype
+INT_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+_NUMPY_DTYPES = {INT_TYPECODE: "int64", FLOAT_TYPECODE: "float64"}
+
+Column: TypeAlias = "array.array[Any] | list[Any]"
+
+
+def _build_column(values: list[Any]) -> Column:
+    """Pack values into the most compact column type that represents them exactly.
+
+    - Integers only: array("q")
+    - Numbers with missing values, or any float: array("d"), missing values as NaN
+    - Anything else: a list, with strings interned
+    """
+    has_float = has_none = False
+    numeric = True
+    for value in values:
+        if value is None:
+            has_none = True
+        elif isinstance(value, float):
+            has_float = True
+        elif not isinstance(value, int) or isinstance(value, bool):
+            numeric = False
+            break
+    if numeric and values and not all(value is None for value in values):
+        if not has_float and not has_none:
+            try:
+                return array.array(INT_TYPECODE, values)
+            except OverflowError:
+                pass
+        return array.array(FLOAT_TYPECODE, (math.nan if v is None else v for v in values))
+    return [sys.intern(v) if isinstance(v, str) else v for v in values]
+
+
+class ColumnarResult:
+    """Query result rows stored column by column.
+
+    Example:
+        >>> columns = result.data.columns
+        >>> columns.names
+        ['service', 'COUNT', 'P99']
+        >>> sum(columns["COUNT"])
+        >>> arrays = columns.to_numpy()  # numeric columns share memory
+        >>> table = columns.to_arrow()
+
+    Args:
+        columns: Column name to column (all of equal length).
+    """
+
+    def __init__(self, columns: dict[str, Column]) -> None:
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self._columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> ColumnarResult:
+        """Build columns from row dicts.
+
+        Columns are ordered by first appearance; a key missing from a row is
+        stored as None (NaN in float columns).
+        """
+        values: dict[str, list[Any]] = {}
+        for count, row in enumerate(rows):
+            for name in row:
+                if name not in values:
+                    values[name] = [None] * count
+            for name, column in values.items():
+                column.append(row.get(name))
+        return cls({name: _build_column(column) for name, column in values.items()})
+
+    @property
+    def names(self) -> list[str]:
+        """Column names."""
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Yield rows as dicts (rebuilt on demand; NaN stands for missing numbers)."""
+        for i in range(self._length):
+            yield {name: column[i] for name, column in self._columns.items()}
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return a NumPy array per column.
+
+        Numeric columns are zero-copy views of the column buffers (int64 or
+        float64); other columns become object arrays.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "to_numpy() requires the 'numpy' package. Install it with: pip install numpy"
+            ) from e
+
+        arrays: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, array.array):
+                arrays[name] = np.frombuffer(column, dtype=_NUMPY_DTYPES[column.typecode])
+            else:
+                arrays[name] = np.array(column, dtype=object)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a pyarrow Table.
+
+        Numeric columns wrap the column buffers without copying; string
+        columns are dictionary-encoded.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "to_arrow() requires the 'pyarrow' package. Install it with: pip install pyarrow"
+            ) from e
+
+        arrow_types = {INT_TYPECODE: pa.int64(), FLOAT_TYPECODE: pa.float64()}
+        arrays = []
+        for column in self._columns.values():
+            if isinstance(column, array.array):
+                buffer = pa.py_buffer(column)
+                arrays.append(
+                    pa.Array.from_buffers(arrow_types[column.typecode], len(column), [None, buffer])
+                )
+            elif all(value is None or isinstance(value, str) for value in column):
+                arrays.append(pa.array(column, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(column))
+        return pa.Table.from_arrays(arrays, names=self.names)
@@ -5,8 +5,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
+from honeycomb.models.columnar import ColumnarResult
 from honeycomb.models.query_builder import (
     VALID_COMPARE_OFFSETS,
     Calculation,
@@ -15,6 +16,7 @@ from honeycomb.models.query_builder import (
     Having,
     Order,
 )
+from honeycomb.models.timeseries import TimeSeries
 
 if TYPE_CHECKING:
     from honeycomb.models.query_builder import QueryBuilder
@@ -203,6 +205,9 @@ class QueryResultData(BaseModel):
 
     model_config = {"extra": "allow"}
 
+    _columns: ColumnarResult | None = PrivateAttr(default=None)
+    _time_series: TimeSeries | None = PrivateAttr(default=None)
+
     @property
     def rows(self) -> list[dict]:
         """Get unwrapped result rows.
@@ -214,9 +219,57 @@ class QueryResultData(BaseModel):
             List of result row dicts with breakdown and calculation values.
         """
         if not self.results:
+            if self._columns is not None:
+                return list(self._columns.iter_rows())
             return []
         return [row.get("data", row) for row in self.results]
 
+    @property
+    def columns(self) -> ColumnarResult:
+        """Get the result rows as columns (built once, then cached).
+
+        Numeric columns are typed arrays and breakdown strings are interned,
+        which takes far less memory than the row dicts for large results.
+        See ColumnarResult for NumPy and Arrow export.
+
+        Returns:
+            ColumnarResult with one column per breakdown and calculation.
+        """
+        if self._columns is None:
+            self._columns = ColumnarResult.from_rows(
+                row.get("data", row) for row in self.results or []
+            )
+        return self._columns
+
+    @property
+    def time_series(self) -> TimeSeries:
+        """Get the series as typed arrays (parsed once, then cached).
+
+        Fields with non-numeric values are treated as breakdowns; use
+        TimeSeries.from_series(data.series, breakdowns=[...]) when a breakdown
+        is numeric. Requires running the query with disable_series=False.
+
+        Returns:
+            TimeSeries with bucket timestamps and one value array per
+            calculation and group.
+        """
+        if self._time_series is None:
+            self._time_series = TimeSeries.from_series(self.series or [])
+        return self._time_series
+
+    def compact(self) -> ColumnarResult:
+        """Convert the rows to columns and release the row dicts.
+
+        Afterwards ``results`` is None and ``rows`` is rebuilt from the columns
+        on each access.
+
+        Returns:
+            The cached ColumnarResult.
+        """
+        columns = self.columns
+        self.results = None
+        return columns
+
 
 class QueryResult(BaseModel):
     """Results from a query execution.
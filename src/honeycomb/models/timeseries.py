@@ -0,0 +1,250 @@
+"""Parsed, column-oriented view of query result time series.
+
+The API returns a time series as one dict per (bucket, group):
+``[{"time": "2024-04-09T14:16:00Z", "data": {"service": "api", "COUNT": 3}}, ...]``.
+A TimeSeries parses each distinct timestamp once and stores one ``array("q")``
+of bucket times plus one ``array("d")`` of values per calculation and group,
+with NaN for buckets a group has no data in. Arrays export to NumPy without
+copying.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+from .columnar import FLOAT_TYPECODE, INT_TYPECODE
+
+# A series is keyed by (calculation name, tuple of breakdown values)
+SeriesKey = tuple[str, tuple[Any, ...]]
+
+_RESAMPLE_AGGREGATES: dict[str, Callable[[list[float]], float]] = {
+    "sum": math.fsum,
+    "mean": lambda values: math.fsum(values) / len(values),
+    "min": min,
+    "max": max,
+    "last": lambda values: values[-1],
+}
+
+
+def parse_time(value: Any) -> int:
+    """Return a series timestamp as Unix seconds.
+
+    Accepts the API's ISO 8601 strings (with a trailing "Z") and numeric epochs.
+    """
+    if isinstance(value, int | float):
+        return int(value)
+    return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp())
+
+
+def _is_value(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+class TimeSeries:
+    """Query result time series as typed arrays.
+
+    Example:
+        >>> ts = result.data.time_series
+        >>> ts.timestamps  # array('q', [...]) of bucket start times (Unix seconds)
+        >>> ts["COUNT"]  # ungrouped query
+        >>> ts["COUNT", "api"]  # one breakdown value
+        >>> ts["P99(duration_ms)", ("api", "GET")]  # several breakdowns
+        >>> hourly = ts.resample(3600, how="sum")
+
+    Args:
+        timestamps: Sorted bucket times in Unix seconds.
+        values: (calculation, group) to values, aligned with timestamps.
+        breakdowns: Breakdown names, in the order of the group tuples.
+    """
+
+    def __init__(
+        self,
+        timestamps: array.array[int],
+        values: dict[SeriesKey, array.array[float]],
+        breakdowns: list[str] | None = None,
+    ) -> None:
+        if any(len(column) != len(timestamps) for column in values.values()):
+            raise ValueError("All value arrays must have the same length as timestamps")
+        self.timestamps = timestamps
+        self.breakdowns = breakdowns or []
+        self._values = values
+
+    @classmethod
+    def from_series(
+        cls, series: Iterable[dict[str, Any]], breakdowns: list[str] | None = None
+    ) -> TimeSeries:
+        """Parse API series entries.
+
+        Args:
+            series: Entries of the form {"time": ..., "data": {...}} (unwrapped
+                entries with the values next to "time" are accepted too).
+            breakdowns: Breakdown names. Defaults to every field that has a
+                non-numeric value; pass them explicitly for numeric breakdowns.
+        """
+        parsed: dict[Any, int] = {}
+        entries: list[tuple[int, dict[str, Any]]] = []
+        for entry in series:
+            raw = entry.get("time")
+            if raw not in parsed:
+                parsed[raw] = parse_time(raw)
+            data = entry.get("data", entry)
+            entries.append((parsed[raw], data))
+
+        if breakdowns is None:
+            names: dict[str, None] = {}
+            for _, data in entries:
+                for name, value in data.items():
+                    if name != "time" and value is not None and not _is_value(value):
+                        names[name] = None
+            breakdowns = list(names)
+        excluded = {"time", *breakdowns}
+
+        timestamps = sorted(set(parsed.values()))
+        index = {t: i for i, t in enumerate(timestamps)}
+        values: dict[SeriesKey, array.array[float]] = {}
+        for t, data in entries:
+            group = tuple(data.get(name) for name in breakdowns)
+            for name, value in data.items():
+                if name in excluded or not _is_value(value):
+                    continue
+                column = values.get((name, group))
+                if column is None:
+                    column = values[(name, group)] = array.array(
+                        FLOAT_TYPECODE, [math.nan] * len(timestamps)
+                    )
+                column[index[t]] = value
+        return cls(array.array(INT_TYPECODE, timestamps), values, breakdowns)
+
+    @property
+    def calculations(self) -> list[str]:
+        """Calculation names, in order of first appearance."""
+        return list(dict.fromkeys(name for name, _ in self._values))
+
+    @property
+    def groups(self) -> list[tuple[Any, ...]]:
+        """Breakdown value tuples, in order of first appearance (``()`` if ungrouped)."""
+        return list(dict.fromkeys(group for _, group in self._values))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return self._key(key) in self._values
+        except (TypeError, ValueError):
+            return False
+
+    def __getitem__(self, key: str | tuple[str, Any]) -> array.array[float]:
+        return self._values[self._key(key)]
+
+    def __iter__(self) -> Iterator[SeriesKey]:
+        return iter(self._values)
+
+    def items(self) -> Iterator[tuple[SeriesKey, array.array[float]]]:
+        """Yield ((calculation, group), values) pairs."""
+        return iter(self._values.items())
+
+    @staticmethod
+    def _key(key: Any) -> SeriesKey:
+        if isinstance(key, str):
+            return key, ()
+        name, group = key
+        return name, group if isinstance(group, tuple) else (group,)
+
+    def _derive(
+        self, timestamps: Iterable[int], values: dict[SeriesKey, array.array[float]]
+    ) -> TimeSeries:
+        return TimeSeries(array.array(INT_TYPECODE, timestamps), values, list(self.breakdowns))
+
+    def reindex(self, timestamps: Iterable[int]) -> TimeSeries:
+        """Return the series at the given bucket times (NaN where there is no bucket)."""
+        target = list(timestamps)
+        index = {t: i for i, t in enumerate(self.timestamps)}
+        positions = [index.get(t) for t in target]
+        return self._derive(
+            target,
+            {
+                key: array.array(
+                    FLOAT_TYPECODE, [math.nan if i is None else column[i] for i in positions]
+                )
+                for key, column in self._values.items()
+            },
+        )
+
+    def shift(self, seconds: int) -> TimeSeries:
+        """Return the series with every bucket time moved by `seconds`."""
+        return self._derive(
+            (t + seconds for t in self.timestamps),
+            {key: array.array(FLOAT_TYPECODE, column) for key, column in self._values.items()},
+        )
+
+    def resample(self, granularity: int, how: str = "sum") -> TimeSeries:
+        """Aggregate buckets into coarser buckets of `granularity` seconds.
+
+        Args:
+            granularity: New bucket size in seconds.
+            how: "sum", "mean", "min", "max" or "last". NaN values are ignored;
+                a bucket with no values is NaN.
+
+        Raises:
+            ValueError: If granularity or how is invalid.
+        """
+        if granularity <= 0:
+            raise ValueError("granularity must be > 0")
+        if how not in _RESAMPLE_AGGREGATES:
+            raise ValueError(f"how must be one of {sorted(_RESAMPLE_AGGREGATES)}, got {how!r}")
+        aggregate = _RESAMPLE_AGGREGATES[how]
+
+        buckets: dict[int, list[int]] = {}
+        for i, t in enumerate(self.timestamps):
+            buckets.setdefault(t // granularity * granularity, []).append(i)
+
+        values: dict[SeriesKey, array.array[float]] = {}
+        for key, column in self._values.items():
+            resampled: array.array[float] = array.array(FLOAT_TYPECODE)
+            for positions in buckets.values():
+                present = [column[i] for i in positions if not math.isnan(column[i])]
+                resampled.append(aggregate(present) if present else math.nan)
+            values[key] = resampled
+        return self._derive(buckets, values)
+
+    def compare(self, previous: TimeSeries, offset: int) -> TimeSeries:
+        """Align a time-shifted run of the same query with this one.
+
+        For compare_time_offset_seconds style comparisons: `previous` covers
+        the window `offset` seconds earlier. Its buckets are shifted forward
+        by `offset` and reindexed onto this series' timestamps, so
+        ``current["COUNT"][i]`` and ``baseline["COUNT"][i]`` refer to the same
+        bucket position.
+
+        Returns:
+            The aligned baseline series.
+        """
+        return previous.shift(offset).reindex(self.timestamps)
+
+    @staticmethod
+    def align(*series: TimeSeries) -> list[TimeSeries]:
+        """Reindex several series onto the union of their bucket times."""
+        timestamps = sorted(set().union(*(s.timestamps for s in series)))
+        return [s.reindex(timestamps) for s in series]
+
+    def to_numpy(self) -> tuple[Any, dict[SeriesKey, Any]]:
+        """Return (timestamps, values) as NumPy arrays sharing the series buffers.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "to_numpy() requires the 'numpy' package. Install it with: pip install numpy"
+            ) from e
+
+        return np.frombuffer(self.timestamps, dtype="int64"), {
+            key: np.frombuffer(column, dtype="float64") for key, column in self._values.items()
+        }
@@ -0,0 +1,304 @@
+"""Adaptive polling for asynchronous API operations.
+
+Query results and service map dependency requests are created first and then
+polled until ready. A PollStrategy polls quickly at first so that short
+operations return promptly, then backs off geometrically up to a maximum
+interval so that long ones do not waste requests. A server Retry-After hint
+takes precedence over the schedule.
+
+The client holds one PollStrategy that every poll loop uses, so its stats
+cover all polling done through the client. A PollScheduler follows the same
+schedule for many operations at once from a single loop, instead of one
+sleeping coroutine per operation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+DEFAULT_INITIAL_DELAY = 0.1
+DEFAULT_MULTIPLIER = 1.5
+DEFAULT_MAX_DELAY = 1.0
+
+
+@dataclass
+class PollStats:
+    """Polling statistics.
+
+    Attributes:
+        loops: Number of poll loops run (one per operation waited on).
+        polls: Total number of status requests made.
+        wall_time: Total seconds spent waiting in poll loops.
+        last_polls: Status requests made by the most recent loop.
+        last_wall_time: Seconds the most recent loop took.
+    """
+
+    loops: int = 0
+    polls: int = 0
+    wall_time: float = 0.0
+    last_polls: int = 0
+    last_wall_time: float = 0.0
+
+
+class PollStrategy:
+    """Adaptive poll schedule: fast first polls, then geometric backoff.
+
+    The n-th wait is ``initial_delay * multiplier**n``, capped at the
+    ``max_delay`` passed to a single poll loop (a method's ``poll_interval``),
+    or at the strategy's ``max_delay`` when the loop sets no cap. A Retry-After
+    hint from the server replaces the scheduled wait.
+
+    Example:
+        >>> strategy = PollStrategy(initial_delay=0.05, max_delay=2.0)
+        >>> client = HoneycombClient(api_key="...", poll_strategy=strategy)
+        >>> ...
+        >>> strategy.stats.polls, strategy.stats.wall_time
+
+    Args:
+        initial_delay: Seconds to wait after the first poll.
+        multiplier: Growth factor between successive waits.
+        max_delay: Upper bound for a single wait in loops without their own cap.
+        clock: Monotonic clock (for testing).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        multiplier: float = DEFAULT_MULTIPLIER,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if initial_delay <= 0 or max_delay <= 0:
+            raise ValueError("initial_delay and max_delay must be > 0")
+        if multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.stats = PollStats()
+
+    def delay(
+        self, attempt: int, retry_after: float | None = None, max_delay: float | None = None
+    ) -> float:
+        """Return how long to wait after the given (0-indexed) poll.
+
+        Args:
+            attempt: Number of polls made so far, minus one.
+            retry_after: Server hint in seconds (takes precedence when present).
+            max_delay: Cap for this loop, e.g. an explicit poll_interval; replaces
+                the strategy's max_delay (default: the strategy's max_delay).
+        """
+        if retry_after is not None:
+            return float(retry_after)
+        cap = self.max_delay if max_delay is None else max_delay
+        return min(self.initial_delay * self.multiplier**attempt, cap)
+
+    def _record(self, polls: int, elapsed: float) -> None:
+        with self._lock:
+            self.stats.loops += 1
+            self.stats.polls += polls
+            self.stats.wall_time += elapsed
+            self.stats.last_polls = polls
+            self.stats.last_wall_time = elapsed
+
+    async def poll_async(
+        self,
+        poll: Callable[[], Awaitable[tuple[T, float | None]]],
+        done: Callable[[T], bool],
+        *,
+        timeout: float,
+        max_delay: float | None = None,
+    ) -> T:
+        """Call poll until done(result) is true.
+
+        Args:
+            poll: Makes one status request, returning (result, Retry-After seconds or None).
+            done: Returns True once the result is final.
+            timeout: Maximum seconds to keep polling.
+            max_delay: Cap on a single wait for this loop.
+
+        Returns:
+            The final result.
+
+        Raises:
+            TimeoutError: If the result is not final within timeout.
+        """
+        start = self._clock()
+        polls = 0
+        try:
+            while True:
+                result, retry_after = await poll()
+                polls += 1
+                if done(result):
+                    return result
+                remaining = timeout - (self._clock() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"Polling did not complete within {timeout}s")
+                await asyncio.sleep(min(self.delay(polls - 1, retry_after, max_delay), remaining))
+        finally:
+            self._record(polls, self._clock() - start)
+
+    def poll(
+        self,
+        poll: Callable[[], tuple[T, float | None]],
+        done: Callable[[T], bool],
+        *,
+        timeout: float,
+        max_delay: float | None = None,
+    ) -> T:
+        """Blocking variant of poll_async()."""
+        start = self._clock()
+        polls = 0
+        try:
+            while True:
+                result, retry_after = poll()
+                polls += 1
+                if done(result):
+                    return result
+                remaining = timeout - (self._clock() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"Polling did not complete within {timeout}s")
+                time.sleep(min(self.delay(polls - 1, retry_after, max_delay), remaining))
+        finally:
+            self._record(polls, self._clock() - start)
+
+
+@dataclass
+class _Pending(Generic[K, T]):
+    key: K
+    future: asyncio.Future[tuple[T, int]]
+    started: float
+    deadline: float
+    next_poll: float
+    polls: int = field(default=0)
+
+
+class PollScheduler(Generic[K, T]):
+    """Polls many pending operations from one loop.
+
+    Each operation registered with wait() is polled on the strategy's schedule
+    (fast first, then backing off, honoring Retry-After), but all due polls are
+    issued together by a single background task.
+
+    Args:
+        poll: Makes one status request for a key, returning (result, Retry-After or None).
+        done: Returns True once a result is final.
+        strategy: Poll schedule; its stats record one loop per operation.
+        timeout: Maximum seconds to wait for each operation.
+        max_delay: Cap on a single wait.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[K], Awaitable[tuple[T, float | None]]],
+        done: Callable[[T], bool],
+        *,
+        strategy: PollStrategy,
+        timeout: float,
+        max_delay: float | None = None,
+    ) -> None:
+        self._poll = poll
+        self._done = done
+        self._strategy = strategy
+        self._timeout = timeout
+        self._max_delay = max_delay
+        self._pending: list[_Pending[K, T]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def wait(self, key: K) -> tuple[T, int]:
+        """Wait for an operation to finish.
+
+        Args:
+            key: Identifies the operation (passed to poll).
+
+        Returns:
+            Tuple of (final result, number of polls made).
+
+        Raises:
+            TimeoutError: If the result is not final within timeout.
+        """
+        now = self._strategy._clock()
+        entry: _Pending[K, T] = _Pending(
+            key=key,
+            future=asyncio.get_running_loop().create_future(),
+            started=now,
+            deadline=now + self._timeout,
+            next_poll=now,
+        )
+        self._pending.append(entry)
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        try:
+            return await entry.future
+        finally:
+            if entry in self._pending:
+                # Cancelled while pending
+                self._pending.remove(entry)
+                self._wakeup.set()
+
+    def _finish(self, entry: _Pending[K, T], now: float) -> None:
+        self._pending.remove(entry)
+        self._strategy._record(entry.polls, now - entry.started)
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                now = self._strategy._clock()
+                due = [e for e in self._pending if e.next_poll <= now]
+                if not due:
+                    self._wakeup.clear()
+                    delay = min(e.next_poll for e in self._pending) - now
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    continue
+
+                outcomes: list[Any] = await asyncio.gather(
+                    *(self._poll(e.key) for e in due), return_exceptions=True
+                )
+                now = self._strategy._clock()
+                for entry, outcome in zip(due, outcomes, strict=True):
+                    if entry not in self._pending:
+                        continue
+                    entry.polls += 1
+                    if isinstance(outcome, BaseException):
+                        self._finish(entry, now)
+                        entry.future.set_exception(outcome)
+                        continue
+                    result, retry_after = outcome
+                    if self._done(result):
+                        self._finish(entry, now)
+                        entry.future.set_result((result, entry.polls))
+                    elif now >= entry.deadline:
+                        self._finish(entry, now)
+                        entry.future.set_exception(
+                            TimeoutError(f"Polling did not complete within {self._timeout}s")
+                        )
+                    else:
+                        delay = self._strategy.delay(entry.polls - 1, retry_after, self._max_delay)
+                        entry.next_poll = min(now + delay, entry.deadline)
+        except BaseException as e:
+            # Never leave waiters hanging if the loop itself fails or is cancelled
+            for entry in list(self._pending):
+                self._pending.remove(entry)
+                if entry.future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    entry.future.cancel()
+                else:
+                    entry.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
@@ -0,0 +1,213 @@
+"""Client-side rate limiting driven by server rate limit headers.
+
+Honeycomb reports its limits through ``RateLimit`` / ``X-RateLimit-*`` response
+headers. A RateLimiter keeps one token bucket per endpoint family (``boards``,
+``query_results``, ``batch``, ...) that is refilled from those headers, so
+requests wait locally for the window to reset instead of being sent only to be
+rejected with a 429 and retried after a backoff sleep.
+
+A single RateLimiter can be shared by several clients (sync or async, across
+threads) that use the same credentials, so a fan-out across datasets paces
+itself as a whole.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import RateLimitInfo
+
+API_VERSION_SEGMENTS = ("1", "2")
+
+# Reset values above this are Unix timestamps rather than delays in seconds
+EPOCH_RESET_THRESHOLD = 1_000_000_000
+
+
+def endpoint_family(path: str) -> str:
+    """Return the endpoint family a request path belongs to.
+
+    The family is the first path segment after the API version, or after the
+    team slug for v2 team-scoped endpoints.
+
+    Example:
+        >>> endpoint_family("/1/query_results/my-dataset/abc123")
+        'query_results'
+        >>> endpoint_family("/2/teams/my-team/api-keys")
+        'api-keys'
+    """
+    segments = [s for s in path.split("?", 1)[0].split("/") if s]
+    if segments and segments[0] in API_VERSION_SEGMENTS:
+        segments = segments[1:]
+    if len(segments) >= 3 and segments[0] == "teams":
+        segments = segments[2:]
+    return segments[0] if segments else ""
+
+
+@dataclass
+class _Bucket:
+    """Token bucket for one endpoint family.
+
+    ``tokens`` may go negative: each unit below zero is a request that has
+    reserved a slot in a later window and is sleeping until then. Once the
+    window length is known (from the reset header), debt beyond one window's
+    capacity is pushed into the windows after it instead of waking every
+    waiting request at the next reset.
+    """
+
+    capacity: float = math.inf
+    tokens: float = math.inf
+    refill_rate: float = 0.0
+    reset_at: float | None = None
+    window: float | None = None
+    updated: float = field(default_factory=time.monotonic)
+
+    def refill(self, now: float) -> None:
+        if self.refill_rate and self.tokens < self.capacity:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        if self.reset_at is not None and now >= self.reset_at:
+            if self.window:
+                # Every elapsed window adds a window of tokens, minus slots already
+                # reserved; the next reset follows one window later
+                windows = 1 + int((now - self.reset_at) // self.window)
+                self.tokens = min(self.capacity, self.tokens + windows * self.capacity)
+                self.reset_at += windows * self.window
+            else:
+                # Window reset: a full window of tokens, minus slots already reserved
+                self.tokens = min(self.capacity, self.tokens + self.capacity)
+                self.reset_at = None
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        self.refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        if self.reset_at is not None:
+            delay = self.reset_at - now
+            if self.window and not math.isinf(self.capacity):
+                # Slot -1..-capacity is in the next window, the rest in later ones
+                delay += self.window * ((-self.tokens - 1) // self.capacity)
+            return delay
+        if self.refill_rate:
+            return -self.tokens / self.refill_rate
+        return 0.0
+
+
+class RateLimiter:
+    """Per-endpoint-family token bucket limiter.
+
+    Buckets start unlimited and learn their limits from response headers: the
+    ``limit`` becomes the bucket capacity, ``remaining`` the available tokens and
+    ``reset`` the time the window refills. A 429 empties the bucket until its
+    Retry-After has elapsed. Static limits can also be configured up front for
+    endpoints with documented limits.
+
+    Example:
+        >>> limiter = RateLimiter(limits={"query_results": (10, 60.0)})
+        >>> async with (
+        ...     HoneycombClient(api_key="key-a", rate_limiter=limiter) as a,
+        ...     HoneycombClient(api_key="key-a", rate_limiter=limiter) as b,
+        ... ):
+        ...     ...
+
+    Args:
+        limits: Static limits per endpoint family, as (requests, per_seconds).
+        clock: Monotonic clock (for testing).
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: dict[str, tuple[int, float]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        self._limits = dict(limits or {})
+
+    def _bucket(self, family: str) -> _Bucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            bucket = _Bucket(updated=self._clock())
+            if family in self._limits:
+                requests, per_seconds = self._limits[family]
+                bucket.capacity = bucket.tokens = float(requests)
+                bucket.refill_rate = requests / per_seconds
+            self._buckets[family] = bucket
+        return bucket
+
+    def reserve(self, path: str) -> float:
+        """Reserve a request slot for a path.
+
+        Returns:
+            Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            return self._bucket(endpoint_family(path)).reserve(self._clock())
+
+    async def acquire_async(self, path: str) -> None:
+        """Wait until a request to this path may be sent."""
+        delay = self.reserve(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire(self, path: str) -> None:
+        """Block until a request to this path may be sent."""
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, path: str, info: RateLimitInfo) -> None:
+        """Refresh the bucket for a path from parsed rate limit headers."""
+        if info.limit is None and info.remaining is None and info.reset is None:
+            return
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint_family(path))
+            bucket.refill(now)
+            if info.limit is not None:
+                bucket.capacity = float(info.limit)
+                bucket.tokens = min(bucket.tokens, bucket.capacity)
+            if info.remaining is not None:
+                # Keep debt from requests already waiting for the next window
+                bucket.tokens = info.remaining + min(bucket.tokens, 0.0)
+            if info.reset is not None:
+                reset = float(info.reset)
+                if reset > EPOCH_RESET_THRESHOLD:
+                    reset = max(reset - time.time(), 0.0)
+                bucket.reset_at = now + reset
+                # The time left in a window is at most its length
+                bucket.window = max(bucket.window or 0.0, reset) or None
+
+    def penalize(self, path: str, retry_after: float) -> None:
+        """Empty the bucket for a path until retry_after seconds have passed (after a 429)."""
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint_family(path))
+            bucket.refill(now)
+            bucket.tokens = min(bucket.tokens, 0.0)
+            reset_at = now + retry_after
+            if bucket.reset_at is None or bucket.reset_at < reset_at:
+                bucket.reset_at = reset_at
+
+    def get_info(self, path: str) -> RateLimitInfo:
+        """Return the limiter's current view of the limits for a path."""
+        from .client import RateLimitInfo
+
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(endpoint_family(path))
+            bucket.refill(now)
+            return RateLimitInfo(
+                limit=None if math.isinf(bucket.capacity) else int(bucket.capacity),
+                remaining=None if math.isinf(bucket.tokens) else max(int(bucket.tokens), 0),
+                reset=None if bucket.reset_at is None else math.ceil(bucket.reset_at - now),
+            )
@@ -0,0 +1,172 @@
+"""Retry budget and circuit breaker shared by every client in the process.
+
+Both are configured through RetryConfig. Instances are registered process-wide
+(the budget per configuration, the breaker per API host and configuration), so
+that all clients talking to the same Honeycomb host back off together instead of
+amplifying an incident with independent retry storms.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class RetryBudget:
+    """Caps retries as a fraction of recent requests.
+
+    Over a sliding window, a retry is allowed while the number of retries is
+    below ``ratio`` times the number of requests, with ``min_retries`` always
+    allowed so that low-traffic clients can still retry.
+
+    Args:
+        ratio: Maximum retries per request (e.g. 0.2 allows one retry per five requests).
+        min_retries: Retries always allowed within the window.
+        window: Window length in seconds.
+        clock: Monotonic clock (for testing).
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        *,
+        min_retries: int = 10,
+        window: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("Retry budget ratio must be >= 0")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        # One [second, requests, retries] slot per second of the window
+        self._slots: deque[list[int]] = deque()
+
+    def _current_slot(self) -> list[int]:
+        second = int(self._clock())
+        while self._slots and self._slots[0][0] <= second - self.window:
+            self._slots.popleft()
+        if not self._slots or self._slots[-1][0] != second:
+            self._slots.append([second, 0, 0])
+        return self._slots[-1]
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request."""
+        with self._lock:
+            self._current_slot()[1] += 1
+
+    def try_retry(self) -> bool:
+        """Withdraw a retry from the budget.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted.
+        """
+        with self._lock:
+            slot = self._current_slot()
+            requests = sum(s[1] for s in self._slots)
+            retries = sum(s[2] for s in self._slots)
+            if retries >= max(self.min_retries, self.ratio * requests):
+                return False
+            slot[2] += 1
+            return True
+
+
+class CircuitBreaker:
+    """Fails fast while a host keeps failing.
+
+    After ``failure_threshold`` consecutive failures (5xx responses, timeouts or
+    connection errors) the circuit opens and requests are rejected for
+    ``reset_timeout`` seconds. Then a single probe request is let through: if it
+    succeeds the circuit closes, otherwise it opens again.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe.
+        clock: Monotonic clock (for testing).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("Circuit breaker failure_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        return self._state
+
+    def before_request(self) -> float | None:
+        """Check whether a request may be sent.
+
+        Returns:
+            None if the request may proceed, otherwise seconds until the next probe.
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return None
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if remaining > 0:
+                return remaining
+            # Let one probe through; re-arm the timer in case it never reports back
+            self._state = CIRCUIT_HALF_OPEN
+            self._opened_at = self._clock()
+            return None
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+
+
+_registry_lock = threading.Lock()
+_retry_budgets: dict[tuple[float, int], RetryBudget] = {}
+_circuit_breakers: dict[tuple[str, int, float], CircuitBreaker] = {}
+
+
+def get_retry_budget(ratio: float, min_retries: int = 10) -> RetryBudget:
+    """Return the process-wide retry budget for a configuration."""
+    with _registry_lock:
+        key = (ratio, min_retries)
+        if key not in _retry_budgets:
+            _retry_budgets[key] = RetryBudget(ratio, min_retries=min_retries)
+        return _retry_budgets[key]
+
+
+def get_circuit_breaker(
+    host: str, failure_threshold: int, reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a host and configuration."""
+    with _registry_lock:
+        key = (host, failure_threshold, reset_timeout)
+        if key not in _circuit_breakers:
+            _circuit_breakers[key] = CircuitBreaker(failure_threshold, reset_timeout)
+        return _circuit_breakers[key]
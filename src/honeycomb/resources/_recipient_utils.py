@@ -2,10 +2,157 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+from honeycomb.models.recipients import RecipientType
+
 if TYPE_CHECKING:
     from honeycomb.client import HoneycombClient
+    from honeycomb.models.recipients import Recipient, RecipientCreate
+
+# Seconds a client's cached recipient index is reused before it is listed again
+RECIPIENT_INDEX_TTL = 60.0
+
+# Number of missing inline recipients created at once
+DEFAULT_RECIPIENT_CONCURRENCY = 4
+
+# Details field that holds an inline recipient's target, per recipient type
+_TARGET_FIELDS = {
+    RecipientType.EMAIL: "email_address",
+    RecipientType.SLACK: "slack_channel",
+    RecipientType.WEBHOOK: "webhook_url",
+    RecipientType.MSTEAMS_WORKFLOW: "webhook_url",
+    RecipientType.MSTEAMS: "webhook_url",
+    RecipientType.PAGERDUTY: "pagerduty_integration_key",
+}
+
+
+class RecipientIndex:
+    """Existing recipients keyed by (RecipientType, target) for constant-time lookup.
+
+    The target is the type's details field an inline recipient is matched on
+    (email address, Slack channel, webhook URL or PagerDuty integration key).
+    When several recipients share a key, the first one listed wins.
+
+    Args:
+        recipients: Recipients to index.
+        clock: Monotonic clock used to age the index (for testing).
+    """
+
+    def __init__(
+        self, recipients: Iterable[Recipient], clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._ids: dict[tuple[RecipientType, str], str] = {}
+        self._clock = clock
+        self.loaded_at = clock()
+        for recipient in recipients:
+            self.add(recipient)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, recipient: Recipient) -> None:
+        """Index a recipient (no-op for types without a matchable target)."""
+        field = _TARGET_FIELDS.get(recipient.type)
+        target = recipient.details.get(field) if field else None
+        if target is not None:
+            self._ids.setdefault((recipient.type, target), recipient.id)
+
+    def get(self, recip_type: RecipientType, target: str) -> str | None:
+        """Return the ID of the recipient with this type and target, if any."""
+        return self._ids.get((recip_type, target))
+
+    def fresh(self, ttl: float = RECIPIENT_INDEX_TTL) -> bool:
+        """Return True if the index was loaded less than ttl seconds ago."""
+        return self._clock() - self.loaded_at < ttl
+
+
+def _build_recipient_create(recip: dict[str, Any]) -> RecipientCreate:
+    """Build the RecipientCreate for an inline recipient (details matching the API spec)."""
+    from honeycomb.models.recipients import RecipientCreate
+
+    recip_type = RecipientType(recip["type"])
+    target = recip["target"]
+    details = recip.get("details", {})
+    if recip_type == RecipientType.EMAIL:
+        if "email_address" not in details:
+            details = {"email_address": target}
+    elif recip_type == RecipientType.SLACK:
+        if "slack_channel" not in details:
+            details = {"slack_channel": target}
+    elif recip_type == RecipientType.PAGERDUTY:
+        if "pagerduty_integration_key" not in details:
+            details = {
+                "pagerduty_integration_key": target,
+                "pagerduty_integration_name": "PagerDuty Integration",
+            }
+    elif recip_type == RecipientType.WEBHOOK:
+        if "webhook_url" not in details:
+            details = {
+                "webhook_url": target,
+                "webhook_name": recip.get("name", "Webhook"),
+            }
+    elif (
+        recip_type
+        in (
+            RecipientType.MSTEAMS_WORKFLOW,
+            RecipientType.MSTEAMS,
+        )
+        and "webhook_url" not in details
+    ):
+        details = {
+            "webhook_url": target,
+            "webhook_name": "MS Teams",
+        }
+    return RecipientCreate(type=recip_type, details=details)
+
+
+def _missing_recipients(
+    index: RecipientIndex, recipients_input: list[dict[str, Any]]
+) -> dict[tuple[RecipientType, str], dict[str, Any]]:
+    """Return the inline recipients not in the index, one per (type, target)."""
+    missing: dict[tuple[RecipientType, str], dict[str, Any]] = {}
+    for recip in recipients_input:
+        if "id" not in recip:
+            key = (RecipientType(recip["type"]), recip["target"])
+            if index.get(*key) is None:
+                missing.setdefault(key, recip)
+    return missing
+
+
+def _is_conflict(error: BaseException) -> bool:
+    from honeycomb.exceptions import HoneycombAPIError
+
+    return isinstance(error, HoneycombAPIError) and error.status_code == 409
+
+
+def _resolve(
+    index: RecipientIndex,
+    created: dict[tuple[RecipientType, str], str],
+    recipients_input: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Replace inline recipients with {"id": ...} of the created or indexed recipient."""
+    result = []
+    for recip in recipients_input:
+        if "id" in recip:
+            result.append(recip)
+        else:
+            key = (RecipientType(recip["type"]), recip["target"])
+            result.append({"id": created.get(key) or index.get(*key)})
+    return result
+
+
+def _check_conflicts(
+    index: RecipientIndex, conflicts: dict[tuple[RecipientType, str], BaseException]
+) -> None:
+    """Raise the 409 error of a conflicting recipient that is still not listed."""
+    for key, error in conflicts.items():
+        if index.get(*key) is None:
+            raise error
 
 
 async def process_inline_recipients(
@@ -15,10 +162,12 @@ async def process_inline_recipients(
     """Process inline recipients with idempotency.
 
     For each recipient without 'id':
-    1. Check if matching recipient exists (by type + target)
+    1. Look up an existing recipient with the same type + target in the
+       client's cached recipient index
     2. Reuse existing ID if found
-    3. Create new recipient if not found
-    4. Handle 409 conflicts (race conditions)
+    3. Create new recipient if not found (missing recipients are created
+       concurrently, each at most once)
+    4. Handle 409 conflicts (race conditions) by reloading the index
 
     Recipients with existing 'id' fields are returned unchanged.
 
@@ -37,120 +186,78 @@ async def process_inline_recipients(
         >>> resolved = await process_inline_recipients(client, recipients)
         >>> # First recipient now has an ID, second unchanged
     """
-    from honeycomb.exceptions import HoneycombAPIError
-    from honeycomb.models.recipients import RecipientCreate, RecipientType
+    if all("id" in recip for recip in recipients_input):
+        return list(recipients_input)
 
-    # List existing recipients once for idempotent checks
-    existing_recipients = await client.recipients.list_async()
+    index = await client.recipients.index_async()
+    missing = _missing_recipients(index, recipients_input)
+    created: dict[tuple[RecipientType, str], str] = {}
+    if missing:
+        # Created recipients are added to the client's index by create_async()
+        semaphore = asyncio.Semaphore(DEFAULT_RECIPIENT_CONCURRENCY)
 
-    result: list[dict[str, Any]] = []
+        async def create(recip: dict[str, Any]) -> Recipient:
+            async with semaphore:
+                return await client.recipients.create_async(_build_recipient_create(recip))
 
-    for recip in recipients_input:
-        if "id" in recip:
-            # Already has ID - keep as is
-            result.append(recip)
-            continue
-
-        # Inline recipient - find existing or create new
-        recip_type = RecipientType(recip["type"])
-        target = recip["target"]
-
-        # Check if recipient with matching type and target already exists
-        existing = None
-        for existing_recip in existing_recipients:
-            if existing_recip.type == recip_type:
-                # Check target match based on type
-                existing_target = None
-                if recip_type == RecipientType.EMAIL:
-                    existing_target = existing_recip.details.get("email_address")
-                elif recip_type == RecipientType.SLACK:
-                    existing_target = existing_recip.details.get("slack_channel")
-                elif recip_type == RecipientType.WEBHOOK or recip_type in (
-                    RecipientType.MSTEAMS_WORKFLOW,
-                    RecipientType.MSTEAMS,
-                ):
-                    existing_target = existing_recip.details.get("webhook_url")
-                elif recip_type == RecipientType.PAGERDUTY:
-                    existing_target = existing_recip.details.get("pagerduty_integration_key")
-
-                if existing_target == target:
-                    existing = existing_recip
-                    break
-
-        if existing:
-            # Reuse existing recipient
-            result.append({"id": existing.id})
-        else:
-            # Create new recipient - build details based on type (matching API spec)
-            details = recip.get("details", {})
-            if recip_type == RecipientType.EMAIL:
-                if "email_address" not in details:
-                    details = {"email_address": target}
-            elif recip_type == RecipientType.SLACK:
-                if "slack_channel" not in details:
-                    details = {"slack_channel": target}
-            elif recip_type == RecipientType.PAGERDUTY:
-                if "pagerduty_integration_key" not in details:
-                    details = {
-                        "pagerduty_integration_key": target,
-                        "pagerduty_integration_name": "PagerDuty Integration",
-                    }
-            elif recip_type == RecipientType.WEBHOOK:
-                if "webhook_url" not in details:
-                    details = {
-                        "webhook_url": target,
-                        "webhook_name": recip.get("name", "Webhook"),
-                    }
-            elif (
-                recip_type
-                in (
-                    RecipientType.MSTEAMS_WORKFLOW,
-                    RecipientType.MSTEAMS,
-                )
-                and "webhook_url" not in details
-            ):
-                details = {
-                    "webhook_url": target,
-                    "webhook_name": "MS Teams",
-                }
-
-            # Create recipient via Recipients API
-            try:
-                recipient_obj = RecipientCreate(type=recip_type, details=details)
-                created_recip = await client.recipients.create_async(recipient_obj)
-                result.append({"id": created_recip.id})
-            except HoneycombAPIError as e:
-                if e.status_code == 409:
-                    # Conflict - recipient exists but we didn't find it (race condition)
-                    # Re-fetch and try to find it
-                    existing_recipients = await client.recipients.list_async()
-                    found = False
-                    for existing_recip in existing_recipients:
-                        if existing_recip.type == recip_type:
-                            check_target = None
-                            if recip_type == RecipientType.EMAIL:
-                                check_target = existing_recip.details.get("email_address")
-                            elif recip_type == RecipientType.SLACK:
-                                check_target = existing_recip.details.get("slack_channel")
-                            elif recip_type == RecipientType.WEBHOOK or recip_type in (
-                                RecipientType.MSTEAMS_WORKFLOW,
-                                RecipientType.MSTEAMS,
-                            ):
-                                check_target = existing_recip.details.get("webhook_url")
-                            elif recip_type == RecipientType.PAGERDUTY:
-                                check_target = existing_recip.details.get(
-                                    "pagerduty_integration_key"
-                                )
-
-                            if check_target == target:
-                                result.append({"id": existing_recip.id})
-                                found = True
-                                break
-
-                    if not found:
-                        # Still not found - re-raise original error
-                        raise
-                else:
-                    raise
+        outcomes = await asyncio.gather(
+            *(create(recip) for recip in missing.values()), return_exceptions=True
+        )
+        conflicts: dict[tuple[RecipientType, str], BaseException] = {}
+        for key, outcome in zip(missing, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not _is_conflict(outcome):
+                    raise outcome
+                conflicts[key] = outcome
+            else:
+                created[key] = outcome.id
+        if conflicts:
+            # Conflict - recipient exists but we didn't find it (race condition)
+            index = await client.recipients.index_async(refresh=True)
+            _check_conflicts(index, conflicts)
 
-    return result
+    return _resolve(index, created, recipients_input)
+
+
+def process_inline_recipients_sync(
+    client: HoneycombClient,
+    recipients_input: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Process inline recipients with idempotency (sync).
+
+    Same as process_inline_recipients(), using the client's sync methods and
+    a thread pool to create missing recipients.
+
+    Args:
+        client: HoneycombClient (sync mode) for API calls
+        recipients_input: List of recipient specs (may have inline recipients)
+
+    Returns:
+        Updated recipients list with all IDs resolved
+    """
+    if all("id" in recip for recip in recipients_input):
+        return list(recipients_input)
+
+    index = client.recipients.index()
+    missing = _missing_recipients(index, recipients_input)
+    created: dict[tuple[RecipientType, str], str] = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=DEFAULT_RECIPIENT_CONCURRENCY) as pool:
+            futures = {
+                key: pool.submit(client.recipients.create, _build_recipient_create(recip))
+                for key, recip in missing.items()
+            }
+        conflicts: dict[tuple[RecipientType, str], BaseException] = {}
+        for key, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                if not _is_conflict(error):
+                    raise error
+                conflicts[key] = error
+            else:
+                created[key] = future.result().id
+        if conflicts:
+            index = client.recipients.index(refresh=True)
+            _check_conflicts(index, conflicts)
+
+    return _resolve(index, created, recipients_input)
@@ -34,7 +34,7 @@ class BaseResource:
     async def _get_async(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
         """Make an async GET request and return JSON response."""
         response = await self._client.get_async(path, params=params)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     async def _post_async(
         self,
@@ -46,7 +46,7 @@ class BaseResource:
     ) -> Any:
         """Make an async POST request and return JSON response."""
         response = await self._client.post_async(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     async def _put_async(
         self,
@@ -58,7 +58,7 @@ class BaseResource:
     ) -> Any:
         """Make an async PUT request and return JSON response."""
         response = await self._client.put_async(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     async def _patch_async(
         self,
@@ -70,7 +70,7 @@ class BaseResource:
     ) -> Any:
         """Make an async PATCH request and return JSON response."""
         response = await self._client.patch_async(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     async def _delete_async(self, path: str, *, params: dict[str, Any] | None = None) -> None:
         """Make an async DELETE request."""
@@ -83,7 +83,7 @@ class BaseResource:
     def _get_sync(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
         """Make a sync GET request and return JSON response."""
         response = self._client.get_sync(path, params=params)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     def _post_sync(
         self,
@@ -95,7 +95,7 @@ class BaseResource:
     ) -> Any:
         """Make a sync POST request and return JSON response."""
         response = self._client.post_sync(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     def _put_sync(
         self,
@@ -107,7 +107,7 @@ class BaseResource:
     ) -> Any:
         """Make a sync PUT request and return JSON response."""
         response = self._client.put_sync(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     def _patch_sync(
         self,
@@ -119,7 +119,7 @@ class BaseResource:
     ) -> Any:
         """Make a sync PATCH request and return JSON response."""
         response = self._client.patch_sync(path, json=json, params=params, headers=headers)
-        return response.json()
+        return self._client.json_codec.decode(response.content)
 
     def _delete_sync(self, path: str, *, params: dict[str, Any] | None = None) -> None:
         """Make a sync DELETE request."""
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
+import copy
+import warnings
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING, Any
 
 from ..models.boards import Board, BoardCreate, BoardView, BoardViewCreate
 from ..models.tool_inputs import PositionInput
 from .base import BaseResource
+from .slos import _slo_dataset
 
 if TYPE_CHECKING:
     from ..client import HoneycombClient
-    from ..models.board_builder import BoardBundle
+    from ..models.board_builder import BoardBundle, QueryBuilderPanel, SLOBuilderPanel
+
+# Default number of panels or views create_from_bundle_async creates at once
+DEFAULT_BUNDLE_CONCURRENCY = 4
+
+
+def _panel_queries(board: Board) -> dict[str, str]:
+    """Map the query IDs referenced by a board's query panels to their dataset."""
+    refs: dict[str, str] = {}
+    for panel in board.panels or []:
+        query_panel = panel.get("query_panel") if panel.get("type") == "query" else None
+        if query_panel and query_panel.get("query_id"):
+            # Panels of environment-wide queries carry no dataset
+            refs.setdefault(query_panel["query_id"], query_panel.get("dataset") or "__all__")
+    return refs
 
 
 class BoardsResource(BaseResource):
@@ -104,24 +123,37 @@ class BoardsResource(BaseResource):
         """
         await self._delete_async(self._build_path(board_id))
 
-    async def create_from_bundle_async(self, bundle: BoardBundle) -> Board:
+    async def create_from_bundle_async(
+        self, bundle: BoardBundle, max_concurrency: int = DEFAULT_BUNDLE_CONCURRENCY
+    ) -> Board:
         """Create board from BoardBundle with automatic query and view creation.
 
         Orchestrates:
-        1. Create queries + annotations from QueryBuilder instances
+        1. Create queries + annotations from QueryBuilder instances, and SLOs
+           from SLOBuilder instances, concurrently
         2. Assemble all panel configurations
         3. Create board with all panels
-        4. Create views for the board (if any)
+        4. Create views for the board (if any), concurrently
 
-        Panels are added to the board in the order they appear in the bundle:
+        At most max_concurrency query panels, SLO panels or views are created
+        at once. Each query's annotation is created right after its query.
+
+        Panels are added to the board in the order they appear in the bundle,
+        regardless of which request finishes first:
         - Auto-layout: Honeycomb arranges panels in this order
         - Manual-layout: Respects explicit positions
 
+        If creating a query or SLO fails, panels that have not started yet are
+        skipped, and the first error in bundle order is raised once all
+        in-flight requests have finished. No board is created, and SLOs already
+        created for the bundle are deleted again (with a warning if that fails).
+
         If view creation fails, a warning is issued but the board creation succeeds.
         Views can be created manually later using create_view_async().
 
         Args:
             bundle: BoardBundle from BoardBuilder.build()
+            max_concurrency: Maximum panels or views created at once (default: 4).
 
         Returns:
             Created Board object
@@ -140,35 +172,107 @@ class BoardsResource(BaseResource):
             ...         .build()
             ... )
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        return await self._create_from_bundle_async(bundle, asyncio.Semaphore(max_concurrency))
+
+    async def _create_from_bundle_async(
+        self, bundle: BoardBundle, semaphore: asyncio.Semaphore
+    ) -> Board:
+        """Create the board and its views, holding the semaphore for each request."""
+        board_create = await self._board_create_from_bundle_async(bundle, semaphore)
+        async with semaphore:
+            board = await self.create_async(board_create)
+
+        # Create views after board creation
+        if bundle.views:
+
+            async def create_view(view_create: BoardViewCreate) -> BoardView:
+                async with semaphore:
+                    return await self.create_view_async(board.id, view_create)
+
+            results = await asyncio.gather(
+                *(create_view(view_create) for view_create in bundle.views),
+                return_exceptions=True,
+            )
+            for view_create, result in zip(bundle.views, results, strict=True):
+                if isinstance(result, Exception):
+                    # Log but don't fail - board was created successfully
+                    # User can retry view creation manually
+                    warnings.warn(
+                        f"Failed to create view '{view_create.name}' for board '{board.id}': "
+                        f"{result}",
+                        UserWarning,
+                        stacklevel=3,
+                    )
+                elif isinstance(result, BaseException):
+                    raise result
+
+        return board
 
-        panels = []
+    async def _board_create_from_bundle_async(
+        self, bundle: BoardBundle, semaphore: asyncio.Semaphore
+    ) -> BoardCreate:
+        """Create the bundle's queries and SLOs and assemble the board definition."""
 
-        # Create query panels from QueryBuilder instances
-        for qb_panel in bundle.query_builder_panels:
-            # Apply dataset override if specified
+        async def create_query_panel(qb_panel: QueryBuilderPanel) -> dict[str, Any] | None:
+            builder = qb_panel.builder
             if qb_panel.dataset_override:
-                # Temporarily override the dataset on the builder
-                original_dataset = qb_panel.builder.get_dataset()
-                qb_panel.builder.dataset(qb_panel.dataset_override)
-                query, annotation_id = await self._client.queries.create_with_annotation_async(
-                    qb_panel.builder
-                )
-                # Restore original dataset
-                qb_panel.builder.dataset(original_dataset)
-            else:
+                # Override the dataset on a copy: the bundle's builder may be shared
+                # by other panels whose queries are being created concurrently
+                builder = copy.copy(builder).dataset(qb_panel.dataset_override)
+            async with semaphore:
+                if failed.is_set():
+                    return None
                 query, annotation_id = await self._client.queries.create_with_annotation_async(
-                    qb_panel.builder
-                )
-            panels.append(
-                self._build_query_panel_dict(
-                    query.id,
-                    annotation_id,
-                    qb_panel.position,
-                    qb_panel.style,
-                    qb_panel.visualization,
+                    builder
                 )
+            return self._build_query_panel_dict(
+                query.id,
+                annotation_id,
+                qb_panel.position,
+                qb_panel.style,
+                qb_panel.visualization,
             )
 
+        async def create_slo_panel(slo_panel: SLOBuilderPanel) -> dict[str, Any] | None:
+            slo_bundle = slo_panel.builder.build()
+            async with semaphore:
+                if failed.is_set():
+                    return None
+                slo_dict = await self._client.slos.create_from_bundle_async(slo_bundle)
+            # Get first SLO (should only be one dataset for board usage)
+            slo = next(iter(slo_dict.values()))
+            created_slos.append((_slo_dataset(slo_bundle), slo.id))
+            return self._build_slo_panel_dict(slo.id, slo_panel.position)
+
+        async def stop_on_failure(coro: Awaitable[dict[str, Any] | None]) -> Any:
+            try:
+                return await coro
+            except Exception:
+                failed.set()
+                raise
+
+        # Once a panel fails, panels still waiting for the semaphore are skipped
+        failed = asyncio.Event()
+        created_slos: list[tuple[str, str]] = []
+
+        # Create queries and SLOs together; gather keeps results in bundle order.
+        # Exceptions are collected so that no request is left running on failure.
+        created = await asyncio.gather(
+            *(stop_on_failure(create_query_panel(panel)) for panel in bundle.query_builder_panels),
+            *(stop_on_failure(create_slo_panel(panel)) for panel in bundle.slo_builder_panels),
+            return_exceptions=True,
+        )
+        error = next((outcome for outcome in created if isinstance(outcome, BaseException)), None)
+        if error is not None:
+            await self._delete_created_slos(bundle, created_slos, semaphore)
+            raise error
+        query_panels = created[: len(bundle.query_builder_panels)]
+        slo_panels = created[len(bundle.query_builder_panels) :]
+
+        panels: list[dict[str, Any]] = [panel for panel in query_panels if isinstance(panel, dict)]
+
         # Add existing query panels
         for existing in bundle.existing_query_panels:
             panels.append(
@@ -181,13 +285,7 @@ class BoardsResource(BaseResource):
                 )
             )
 
-        # Create SLOs from SLOBuilder instances
-        for slo_panel in bundle.slo_builder_panels:
-            # Create SLO using existing orchestration
-            slo_dict = await self._client.slos.create_from_bundle_async(slo_panel.builder.build())
-            # Get first SLO (should only be one dataset for board usage)
-            slo = next(iter(slo_dict.values()))
-            panels.append(self._build_slo_panel_dict(slo.id, slo_panel.position))
+        panels.extend(panel for panel in slo_panels if isinstance(panel, dict))
 
         # Add existing SLO panels
         for slo_existing in bundle.existing_slo_panels:
@@ -197,8 +295,7 @@ class BoardsResource(BaseResource):
         for text in bundle.text_panels:
             panels.append(self._build_text_panel_dict(text.content, text.position))
 
-        # Create board
-        board_create = BoardCreate(
+        return BoardCreate(
             name=bundle.board_name,
             description=bundle.board_description,
             type="flexible",
@@ -208,25 +305,32 @@ class BoardsResource(BaseResource):
             preset_filters=bundle.preset_filters,
         )
 
-        board = await self.create_async(board_create)
-
-        # Create views after board creation
-        if bundle.views:
-            import warnings
-
-            for view_create in bundle.views:
-                try:
-                    await self.create_view_async(board.id, view_create)
-                except Exception as e:
-                    # Log but don't fail - board was created successfully
-                    # User can retry view creation manually
-                    warnings.warn(
-                        f"Failed to create view '{view_create.name}' for board '{board.id}': {e}",
-                        UserWarning,
-                        stacklevel=2,
-                    )
-
-        return board
+    async def _delete_created_slos(
+        self,
+        bundle: BoardBundle,
+        created_slos: builtins.list[tuple[str, str]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Delete the SLOs created for a board that could not be created."""
+
+        async def delete(dataset: str, slo_id: str) -> None:
+            async with semaphore:
+                await self._client.slos.delete_async(dataset, slo_id)
+
+        results = await asyncio.gather(
+            *(delete(dataset, slo_id) for dataset, slo_id in created_slos),
+            return_exceptions=True,
+        )
+        for (dataset, slo_id), result in zip(created_slos, results, strict=True):
+            if isinstance(result, Exception):
+                warnings.warn(
+                    f"Failed to delete SLO '{slo_id}' in '{dataset}' created for board "
+                    f"'{bundle.board_name}': {result}",
+                    UserWarning,
+                    stacklevel=4,
+                )
+            elif isinstance(result, BaseException):
+                raise result
 
     def _build_query_panel_dict(
         self,
@@ -438,7 +542,9 @@ class BoardsResource(BaseResource):
             raise RuntimeError("Use delete_async() for async mode, or pass sync=True to client")
         self._delete_sync(self._build_path(board_id))
 
-    def create_from_bundle(self, bundle: BoardBundle) -> Board:
+    def create_from_bundle(
+        self, bundle: BoardBundle, max_concurrency: int = DEFAULT_BUNDLE_CONCURRENCY
+    ) -> Board:
         """Create board from BoardBundle with automatic query creation (sync).
 
         Orchestrates:
@@ -448,6 +554,7 @@ class BoardsResource(BaseResource):
 
         Args:
             bundle: BoardBundle from BoardBuilder.build()
+            max_concurrency: Maximum panels or views created at once (default: 4).
 
         Returns:
             Created Board object
@@ -456,9 +563,7 @@ class BoardsResource(BaseResource):
             raise RuntimeError(
                 "Use create_from_bundle_async() for async mode, or pass sync=True to client"
             )
-        import asyncio
-
-        return asyncio.run(self.create_from_bundle_async(bundle))
+        return asyncio.run(self.create_from_bundle_async(bundle, max_concurrency))
 
     # -------------------------------------------------------------------------
     # Board View Methods - Sync
@@ -572,7 +677,43 @@ class BoardsResource(BaseResource):
             ...     json.dump(data, f, indent=2)
         """
         board = await self.get_async(board_id)
-        views = await self.list_views_async(board_id)
+        return await self.export_board_async(board)
+
+    async def export_board_async(
+        self, board: Board, *, include_views: bool = True, include_queries: bool = False
+    ) -> dict[str, Any]:
+        """Export a board that was already fetched, e.g. by list_async() (async).
+
+        The board's views and the specs of the queries its panels reference
+        are fetched concurrently.
+
+        Args:
+            board: Board to export
+            include_views: Fetch and include the board's views (default: True)
+            include_queries: Fetch and include the query specs referenced by
+                query panels, keyed by query ID (default: False)
+
+        Returns:
+            Dict with board data, views and queries (IDs stripped for portability)
+
+        Example:
+            >>> for board in await client.boards.list_async():
+            ...     data = await client.boards.export_board_async(board, include_queries=True)
+        """
+        query_refs = _panel_queries(board) if include_queries else {}
+
+        async def fetch_views() -> builtins.list[BoardView]:
+            return await self.list_views_async(board.id) if include_views else []
+
+        views, queries = await asyncio.gather(
+            fetch_views(),
+            asyncio.gather(
+                *(
+                    self._client.queries.get_async(dataset, query_id)
+                    for query_id, dataset in query_refs.items()
+                )
+            ),
+        )
 
         # Export board without IDs and timestamps for portability
         data = board.model_dump(exclude={"id", "created_at", "updated_at"}, mode="json")
@@ -581,6 +722,17 @@ class BoardsResource(BaseResource):
         if views:
             data["views"] = [v.model_dump(exclude={"id"}, mode="json") for v in views]
 
+        if queries:
+            data["queries"] = {
+                query_id: {
+                    "dataset": dataset,
+                    **query.model_dump(
+                        exclude={"id", "created_at", "updated_at"}, exclude_none=True, mode="json"
+                    ),
+                }
+                for (query_id, dataset), query in zip(query_refs.items(), queries, strict=True)
+            }
+
         return data
 
     def export_with_views(self, board_id: str) -> dict[str, Any]:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from ..models.events import BatchEvent, BatchEventResult
@@ -9,6 +11,68 @@ from .base import BaseResource
 
 if TYPE_CHECKING:
     from ..client import HoneycombClient
+    from ..codec import JSONCodec
+    from ..transmission import Transmission
+
+# Honeycomb ingest limits on uncompressed JSON
+MAX_BATCH_BYTES = 5_000_000
+MAX_EVENT_BYTES = 1_000_000
+
+# Concurrent requests used when a batch is split into several chunks
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def _encode_event(event: BatchEvent, codec: JSONCodec) -> bytes:
+    """Serialize a single batch event to compact JSON bytes."""
+    return codec.encode(event.model_dump_for_api())
+
+
+def _encode_raw_event(event: bytes | dict[str, Any], codec: JSONCodec) -> bytes:
+    """Pass pre-encoded event bytes through, or serialize an API-shaped event dict."""
+    if isinstance(event, bytes):
+        return event
+    return codec.encode(event)
+
+
+def _split_batches(
+    encoded: list[bytes],
+    max_batch_bytes: int = MAX_BATCH_BYTES,
+    max_event_bytes: int = MAX_EVENT_BYTES,
+) -> tuple[list[list[int]], list[int]]:
+    """Group serialized events into chunks whose JSON array body fits the size limit.
+
+    Sizes are accumulated incrementally, counting the surrounding brackets
+    and the comma separators of the final ``[e1,e2,...]`` body.
+
+    Args:
+        encoded: Serialized events, in input order.
+        max_batch_bytes: Maximum size of one batch request body.
+        max_event_bytes: Maximum size of a single event.
+
+    Returns:
+        Tuple of (chunks of input indices, indices of events over max_event_bytes).
+    """
+    chunks: list[list[int]] = []
+    oversized: list[int] = []
+    current: list[int] = []
+    size = 2  # "[" and "]"
+
+    for i, part in enumerate(encoded):
+        if len(part) > max_event_bytes or len(part) + 2 > max_batch_bytes:
+            oversized.append(i)
+            continue
+        added = len(part) + (1 if current else 0)
+        if current and size + added > max_batch_bytes:
+            chunks.append(current)
+            current = []
+            size = 2
+            added = len(part)
+        current.append(i)
+        size += added
+
+    if current:
+        chunks.append(current)
+    return chunks, oversized
 
 
 class EventsResource(BaseResource):
@@ -19,6 +83,9 @@ class EventsResource(BaseResource):
 
     Note: Batch sending is highly preferred over single events for efficiency.
 
+    Request bodies are gzip/zstd compressed when the client is created with a
+    CompressionConfig (see HoneycombClient's ``compression`` argument).
+
     Example (async):
         >>> async with HoneycombClient(api_key="...") as client:
         ...     # Send single event
@@ -43,6 +110,30 @@ class EventsResource(BaseResource):
     def __init__(self, client: HoneycombClient) -> None:
         super().__init__(client)
 
+    def transmission(self, **kwargs: Any) -> Transmission:
+        """Create a background batching Transmission bound to this client.
+
+        The transmission queues events in memory, groups them per dataset and
+        sends them through send_batch_async() from a pool of background workers.
+        Use it as an async context manager so pending events are flushed on exit.
+
+        Args:
+            **kwargs: Options forwarded to Transmission (max_batch_size,
+                max_batch_bytes, send_frequency, max_concurrent_batches,
+                pending_work_capacity, block_on_send, block_on_response,
+                response_capacity).
+
+        Returns:
+            A Transmission whose workers start on first use.
+
+        Example:
+            >>> async with client.events.transmission(max_concurrent_batches=4) as tx:
+            ...     tx.add("my-dataset", {"endpoint": "/api/users", "duration_ms": 42})
+        """
+        from ..transmission import Transmission
+
+        return Transmission(self, **kwargs)
+
     # -------------------------------------------------------------------------
     # Async methods
     # -------------------------------------------------------------------------
@@ -71,31 +162,116 @@ class EventsResource(BaseResource):
         if samplerate is not None:
             headers["X-Honeycomb-Samplerate"] = str(samplerate)
 
+        body, body_headers = self._client._encode_json_body(data, compress=True)
+        headers.update(body_headers)
+
         # Single event endpoint returns empty 200, don't try to parse JSON
-        await self._client.post_async(path, json=data, headers=headers)
+        await self._client.post_async(path, content=body, headers=headers)
 
     async def send_batch_async(
-        self, dataset: str, events: list[BatchEvent]
+        self,
+        dataset: str,
+        events: list[BatchEvent],
+        *,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
     ) -> list[BatchEventResult]:
         """Send a batch of events (async).
 
         This is the preferred method for sending events to Honeycomb.
 
+        Lists of any size are accepted: events are serialized one at a time and
+        split into chunks that fit Honeycomb's request body limit, which are sent
+        concurrently. Events larger than the per-event limit are not sent and get
+        a 413 result. When some chunk requests fail, their events get error
+        results with the request's status code; the request error is raised
+        only if no chunk was accepted.
+
         Args:
             dataset: Dataset slug.
             events: List of BatchEvent objects.
+            max_batch_bytes: Maximum uncompressed body size per request (default: 5MB).
+            max_concurrency: Maximum chunk requests in flight at once (default: 4).
 
         Returns:
-            List of BatchEventResult objects indicating status for each event.
+            List of BatchEventResult objects indicating status for each event,
+            in the same order as ``events``.
         """
-        path = f"/1/batch/{dataset}"
-        payload = [event.model_dump_for_api() for event in events]
-        data = await self._post_async(path, json=payload)  # type: ignore[arg-type]
+        codec = self._client.json_codec
+        encoded = [_encode_event(event, codec) for event in events]
+        return await self._send_all_encoded_async(
+            dataset, encoded, max_batch_bytes=max_batch_bytes, max_concurrency=max_concurrency
+        )
 
-        # Parse results
-        if isinstance(data, list):
-            return self._parse_model_list(BatchEventResult, data)
-        return []
+    async def send_batch_raw_async(
+        self,
+        dataset: str,
+        events: Iterable[bytes | dict[str, Any]],
+        *,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[BatchEventResult]:
+        """Send pre-serialized events without building BatchEvent models (async).
+
+        Fast path for pipelines that already hold event JSON (for example,
+        records forwarded from Kafka). Each item is either the bytes of one
+        complete batch event object, e.g. ``b'{"data":{"k":"v"},"samplerate":2}'``,
+        or a dict in the same API shape. Bytes are concatenated into the request
+        body as-is and are not validated; dicts are serialized directly.
+
+        Splitting, concurrency and result ordering behave as in send_batch_async().
+
+        Args:
+            dataset: Dataset slug.
+            events: Iterable of encoded event bytes or API-shaped event dicts.
+            max_batch_bytes: Maximum uncompressed body size per request (default: 5MB).
+            max_concurrency: Maximum chunk requests in flight at once (default: 4).
+
+        Returns:
+            List of BatchEventResult objects indicating status for each event,
+            in input order.
+
+        Example:
+            >>> records = [b'{"data":{"endpoint":"/api/users","duration_ms":42}}']
+            >>> results = await client.events.send_batch_raw_async("my-dataset", records)
+        """
+        codec = self._client.json_codec
+        encoded = [_encode_raw_event(event, codec) for event in events]
+        return await self._send_all_encoded_async(
+            dataset, encoded, max_batch_bytes=max_batch_bytes, max_concurrency=max_concurrency
+        )
+
+    async def _send_all_encoded_async(
+        self,
+        dataset: str,
+        encoded: list[bytes],
+        *,
+        max_batch_bytes: int,
+        max_concurrency: int,
+    ) -> list[BatchEventResult]:
+        """Split serialized events into sized chunks and send them concurrently (async)."""
+        chunks, oversized = _split_batches(encoded, max_batch_bytes)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_chunk(chunk: list[int]) -> list[BatchEventResult]:
+            async with semaphore:
+                return await self._send_encoded_async(dataset, [encoded[i] for i in chunk])
+
+        # A failed chunk must not discard the results of chunks that were accepted
+        chunk_results = await asyncio.gather(
+            *(send_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        return self._stitch_results(len(encoded), chunks, chunk_results, oversized)
+
+    async def _send_encoded_async(self, dataset: str, parts: list[bytes]) -> list[BatchEventResult]:
+        """POST already-serialized events as one batch request (async)."""
+        body, headers = self._client._prepare_json_body(
+            b"[" + b",".join(parts) + b"]", compress=True
+        )
+        response = await self._client.post_async(
+            f"/1/batch/{dataset}", content=body, headers=headers
+        )
+        return self._parse_batch_response(self._client.json_codec.decode(response.content))
 
     # -------------------------------------------------------------------------
     # Sync methods
@@ -128,29 +304,146 @@ class EventsResource(BaseResource):
         if samplerate is not None:
             headers["X-Honeycomb-Samplerate"] = str(samplerate)
 
+        body, body_headers = self._client._encode_json_body(data, compress=True)
+        headers.update(body_headers)
+
         # Single event endpoint returns empty 200, don't try to parse JSON
-        self._client.post_sync(path, json=data, headers=headers)
+        self._client.post_sync(path, content=body, headers=headers)
 
-    def send_batch(self, dataset: str, events: list[BatchEvent]) -> list[BatchEventResult]:
+    def send_batch(
+        self,
+        dataset: str,
+        events: list[BatchEvent],
+        *,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+    ) -> list[BatchEventResult]:
         """Send a batch of events.
 
         This is the preferred method for sending events to Honeycomb.
 
+        Lists of any size are accepted: events are split into chunks that fit
+        Honeycomb's request body limit and sent one request at a time. Events
+        larger than the per-event limit are not sent and get a 413 result.
+        Failed chunk requests are reported as in send_batch_async().
+
         Args:
             dataset: Dataset slug.
             events: List of BatchEvent objects.
+            max_batch_bytes: Maximum uncompressed body size per request (default: 5MB).
 
         Returns:
-            List of BatchEventResult objects indicating status for each event.
+            List of BatchEventResult objects indicating status for each event,
+            in the same order as ``events``.
         """
         if not self._client.is_sync:
             raise RuntimeError("Use send_batch_async() for async mode, or pass sync=True to client")
 
-        path = f"/1/batch/{dataset}"
-        payload = [event.model_dump_for_api() for event in events]
-        data = self._post_sync(path, json=payload)  # type: ignore[arg-type]
+        codec = self._client.json_codec
+        encoded = [_encode_event(event, codec) for event in events]
+        return self._send_all_encoded_sync(dataset, encoded, max_batch_bytes=max_batch_bytes)
 
-        # Parse results
+    def send_batch_raw(
+        self,
+        dataset: str,
+        events: Iterable[bytes | dict[str, Any]],
+        *,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+    ) -> list[BatchEventResult]:
+        """Send pre-serialized events without building BatchEvent models.
+
+        Each item is either the bytes of one complete batch event object or a
+        dict in the same API shape. See send_batch_raw_async() for details.
+
+        Args:
+            dataset: Dataset slug.
+            events: Iterable of encoded event bytes or API-shaped event dicts.
+            max_batch_bytes: Maximum uncompressed body size per request (default: 5MB).
+
+        Returns:
+            List of BatchEventResult objects indicating status for each event,
+            in input order.
+        """
+        if not self._client.is_sync:
+            raise RuntimeError(
+                "Use send_batch_raw_async() for async mode, or pass sync=True to client"
+            )
+
+        codec = self._client.json_codec
+        encoded = [_encode_raw_event(event, codec) for event in events]
+        return self._send_all_encoded_sync(dataset, encoded, max_batch_bytes=max_batch_bytes)
+
+    def _send_all_encoded_sync(
+        self, dataset: str, encoded: list[bytes], *, max_batch_bytes: int
+    ) -> list[BatchEventResult]:
+        """Split serialized events into sized chunks and send them one at a time."""
+        chunks, oversized = _split_batches(encoded, max_batch_bytes)
+        chunk_results: list[list[BatchEventResult] | BaseException] = []
+        for chunk in chunks:
+            try:
+                chunk_results.append(self._send_encoded_sync(dataset, [encoded[i] for i in chunk]))
+            except Exception as e:
+                chunk_results.append(e)
+        return self._stitch_results(len(encoded), chunks, chunk_results, oversized)
+
+    def _send_encoded_sync(self, dataset: str, parts: list[bytes]) -> list[BatchEventResult]:
+        """POST already-serialized events as one batch request."""
+        body, headers = self._client._prepare_json_body(
+            b"[" + b",".join(parts) + b"]", compress=True
+        )
+        response = self._client.post_sync(f"/1/batch/{dataset}", content=body, headers=headers)
+        return self._parse_batch_response(self._client.json_codec.decode(response.content))
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _parse_batch_response(self, data: Any) -> list[BatchEventResult]:
+        """Parse the per-event results of a batch request."""
         if isinstance(data, list):
             return self._parse_model_list(BatchEventResult, data)
         return []
+
+    def _stitch_results(
+        self,
+        count: int,
+        chunks: list[list[int]],
+        chunk_results: list[list[BatchEventResult] | BaseException],
+        oversized: list[int],
+    ) -> list[BatchEventResult]:
+        """Reassemble per-chunk results into input order.
+
+        The returned list always has one result per input event. Events of a
+        chunk whose request failed get an error result with the request's
+        status code (0 for transport errors), and events a short response has
+        no entry for get an error result too. If every chunk failed, the first
+        error is raised instead.
+
+        Raises:
+            HoneycombAPIError: If no chunk was accepted.
+        """
+        errors = [result for result in chunk_results if isinstance(result, BaseException)]
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+        if errors and len(errors) == len(chunk_results):
+            raise errors[0]
+
+        results: list[BatchEventResult | None] = [None] * count
+        for i in oversized:
+            results[i] = BatchEventResult(
+                status=413, error=f"Event exceeds maximum size of {MAX_EVENT_BYTES} bytes"
+            )
+        for chunk, chunk_result in zip(chunks, chunk_results, strict=True):
+            if isinstance(chunk_result, BaseException):
+                status = getattr(chunk_result, "status_code", 0)
+                for i in chunk:
+                    results[i] = BatchEventResult(status=status, error=str(chunk_result))
+                continue
+            for i, result in zip(chunk, chunk_result, strict=False):
+                results[i] = result
+        return [
+            result
+            if result is not None
+            else BatchEventResult(status=0, error="Batch response has no result for this event")
+            for result in results
+        ]
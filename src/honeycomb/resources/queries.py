@@ -8,6 +8,7 @@ from ..models.queries import Query, QuerySpec
 from .base import BaseResource
 
 if TYPE_CHECKING:
+    from ..cache import SavedQueryCache
     from ..client import HoneycombClient
     from ..models.query_builder import QueryBuilder
 
@@ -48,6 +49,11 @@ class QueriesResource(BaseResource):
             return f"{base}/{query_id}"
         return base
 
+    def _saved_queries(self) -> SavedQueryCache | None:
+        """Return the client's saved-query cache, if query reuse is enabled."""
+        cache = self._client.cache
+        return cache.queries if cache is not None else None
+
     # -------------------------------------------------------------------------
     # Async methods
     # -------------------------------------------------------------------------
@@ -68,7 +74,8 @@ class QueriesResource(BaseResource):
             dataset: Dataset slug. Required for QuerySpec, extracted from QueryBuilder.
 
         Returns:
-            Created Query object.
+            Created Query object. With the client cache enabled, a query already
+            created from an identical spec is returned without a request.
 
         Raises:
             HoneycombValidationError: If the query spec is invalid.
@@ -108,10 +115,17 @@ class QueriesResource(BaseResource):
                 )
             query_spec = spec
 
-        data = await self._post_async(
-            self._build_path(dataset), json=query_spec.model_dump_for_api()
-        )
-        return self._parse_model(Query, data)
+        body = query_spec.model_dump_for_api()
+        saved = self._saved_queries()
+        if saved is not None:
+            content = saved.get(dataset, body)
+            if content is not None:
+                return self._parse_model(Query, self._client.json_codec.decode(content))
+
+        response = await self._client.post_async(self._build_path(dataset), json=body)
+        if saved is not None:
+            saved.put(dataset, body, response.content)
+        return self._parse_model(Query, self._client.json_codec.decode(response.content))
 
     async def get_async(self, dataset: str, query_id: str) -> Query:
         """Get a specific query (async).
@@ -205,7 +219,8 @@ class QueriesResource(BaseResource):
             dataset: Dataset slug. Required for QuerySpec, extracted from QueryBuilder.
 
         Returns:
-            Created Query object.
+            Created Query object. With the client cache enabled, a query already
+            created from an identical spec is returned without a request.
 
         Raises:
             HoneycombValidationError: If the query spec is invalid.
@@ -234,8 +249,17 @@ class QueriesResource(BaseResource):
                 )
             query_spec = spec
 
-        data = self._post_sync(self._build_path(dataset), json=query_spec.model_dump_for_api())
-        return self._parse_model(Query, data)
+        body = query_spec.model_dump_for_api()
+        saved = self._saved_queries()
+        if saved is not None:
+            content = saved.get(dataset, body)
+            if content is not None:
+                return self._parse_model(Query, self._client.json_codec.decode(content))
+
+        response = self._client.post_sync(self._build_path(dataset), json=body)
+        if saved is not None:
+            saved.put(dataset, body, response.content)
+        return self._parse_model(Query, self._client.json_codec.decode(response.content))
 
     def get(self, dataset: str, query_id: str) -> Query:
         """Get a specific query.
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import operator
 import time as time_module
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, overload
 
 from ..models.queries import Query, QueryResult, QuerySpec
 from ..models.query_builder import Calculation
+from ..polling import PollScheduler
+from ..rolling import RollingQuery
 from .base import BaseResource
 
 if TYPE_CHECKING:
@@ -22,6 +27,82 @@ DEFAULT_MAX_RESULTS = 100_000
 DUPLICATION_THRESHOLD = 0.5  # 50%
 
 
+# Default number of queries run_many_async keeps in flight
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@dataclass
+class QueryRun:
+    """Outcome and timing of one query run by run_many_async().
+
+    Attributes:
+        index: Position of the spec in the input.
+        dataset: Dataset the query ran against.
+        query: The saved query (None if creating it failed).
+        result: The query result (None if the run failed).
+        error: The exception that ended the run, if any.
+        queue_time: Seconds spent waiting for a concurrency slot.
+        create_time: Seconds spent creating the saved query and query result.
+        poll_time: Seconds from query result creation until it completed.
+        polls: Number of status requests made.
+    """
+
+    index: int
+    dataset: str
+    query: Query | None = None
+    result: QueryResult | None = None
+    error: BaseException | None = None
+    queue_time: float = 0.0
+    create_time: float = 0.0
+    poll_time: float = 0.0
+    polls: int = 0
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from submission to completion, including queueing."""
+        return self.queue_time + self.create_time + self.poll_time
+
+
+# How per-window values of each calculation combine when run_all_async shards time
+_SHARD_MERGES: dict[str, Callable[[Any, Any], Any]] = {
+    "COUNT": operator.add,
+    "SUM": operator.add,
+    "MIN": min,
+    "MAX": max,
+}
+
+
+def _split_window(start_time: int, end_time: int, shards: int) -> list[tuple[int, int]]:
+    """Split [start_time, end_time) into up to `shards` contiguous whole-second windows."""
+    shards = max(1, min(shards, end_time - start_time))
+    bounds = [start_time + (end_time - start_time) * i // shards for i in range(shards + 1)]
+    return list(itertools.pairwise(bounds))
+
+
+def _resolve_dataset(spec: QuerySpec | QueryBuilder, dataset: str | None) -> str:
+    """Return the dataset a spec runs against, validating the dataset argument."""
+    from ..models.query_builder import QueryBuilder
+
+    if isinstance(spec, QueryBuilder):
+        if dataset is not None:
+            raise ValueError(
+                "dataset parameter not allowed with QueryBuilder. "
+                "Use .dataset() on the builder instead."
+            )
+        return spec.get_dataset()
+    if dataset is None:
+        raise ValueError(
+            "dataset parameter required when using QuerySpec. "
+            "Pass dataset='your-dataset' or use QueryBuilder instead."
+        )
+    return dataset
+
+
+def _is_complete(result: QueryResult) -> bool:
+    """Return True once a polled query result has its data."""
+    return result.data is not None and result.data.results is not None
+
+
 def _get_calc_attr(calc: Calculation | dict[str, Any], attr: str, default: Any = None) -> Any:
     """Get an attribute from a Calculation or dict.
 
@@ -91,6 +172,49 @@ class QueryResultsResource(BaseResource):
             return f"{base}/{query_result_id}"
         return base
 
+    def _result_cache_key(
+        self,
+        spec: QuerySpec | QueryBuilder,
+        dataset: str,
+        disable_series: bool,
+        limit: int | None,
+    ) -> tuple[str, dict] | None:
+        """Return (cache key, API spec) for a run, or None if result caching is disabled."""
+        cache = self._client.result_cache
+        if cache is None:
+            return None
+        query_spec = spec if isinstance(spec, QuerySpec) else spec.build()
+        body = query_spec.model_dump_for_api()
+        return cache.key(dataset, body, disable_series=disable_series, limit=limit), body
+
+    def _result_cache_get(
+        self, cache_key: tuple[str, dict] | None
+    ) -> tuple[Query, QueryResult] | None:
+        """Return a cached (Query, QueryResult) for a run, if any."""
+        if cache_key is None or self._client.result_cache is None:
+            return None
+        content = self._client.result_cache.get(cache_key[0])
+        if content is None:
+            return None
+        data = self._client.json_codec.decode(content)
+        return self._parse_model(Query, data["query"]), self._parse_model(
+            QueryResult, data["result"]
+        )
+
+    def _result_cache_put(
+        self, cache_key: tuple[str, dict] | None, query: Query, result: QueryResult
+    ) -> None:
+        """Cache the outcome of a completed run."""
+        if cache_key is None or self._client.result_cache is None:
+            return
+        content = self._client.json_codec.encode(
+            {
+                "query": query.model_dump(mode="json", by_alias=True),
+                "result": result.model_dump(mode="json", by_alias=True),
+            }
+        )
+        self._client.result_cache.put(cache_key[0], cache_key[1], content)
+
     # -------------------------------------------------------------------------
     # Async methods
     # -------------------------------------------------------------------------
@@ -152,8 +276,16 @@ class QueryResultsResource(BaseResource):
         Raises:
             HoneycombNotFoundError: If the query result doesn't exist.
         """
-        data = await self._get_async(self._build_path(dataset, query_result_id))
-        return self._parse_model(QueryResult, data)
+        result, _ = await self._get_with_hint_async(dataset, query_result_id)
+        return result
+
+    async def _get_with_hint_async(
+        self, dataset: str, query_result_id: str
+    ) -> tuple[QueryResult, float | None]:
+        """Get a query result along with the server's Retry-After hint (if any)."""
+        response = await self._client.get_async(self._build_path(dataset, query_result_id))
+        data = self._client.json_codec.decode(response.content)
+        return self._parse_model(QueryResult, data), self._client._parse_retry_after(response)
 
     async def run_async(
         self,
@@ -161,7 +293,7 @@ class QueryResultsResource(BaseResource):
         query_id: str,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> QueryResult:
         """Run a saved query and poll for results (async).
@@ -175,7 +307,8 @@ class QueryResultsResource(BaseResource):
                            (default: True for better performance).
             limit: Override result limit (max 10,000 when disable_series=True, 1,000 otherwise).
                    Defaults to 10,000 when disable_series=True, 1,000 when False.
-            poll_interval: Seconds between poll attempts (default: 1.0).
+            poll_interval: Maximum seconds between poll attempts; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -196,24 +329,19 @@ class QueryResultsResource(BaseResource):
             dataset, query_id=query_id, disable_series=disable_series, limit=limit
         )
 
-        # Poll for completion
-        start_time = asyncio.get_event_loop().time()
-        while True:
-            result = await self.get_async(dataset, result_id)
-
-            # Check if query is complete (has results)
-            if result.data is not None and result.data.results is not None:
-                return result
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
-                raise HoneycombTimeoutError(
-                    f"Query did not complete within {timeout}s", timeout=timeout
-                )
-
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
+        # Poll for completion (adaptive: fast first polls, backing off to poll_interval
+        # or, if it is not given, the poll strategy's max_delay)
+        try:
+            return await self._client.poll_strategy.poll_async(
+                lambda: self._get_with_hint_async(dataset, result_id),
+                _is_complete,
+                timeout=timeout,
+                max_delay=poll_interval,
+            )
+        except TimeoutError as e:
+            raise HoneycombTimeoutError(
+                f"Query did not complete within {timeout}s", timeout=timeout
+            ) from e
 
     @overload
     async def create_and_run_async(
@@ -222,7 +350,7 @@ class QueryResultsResource(BaseResource):
         *,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]: ...
 
@@ -234,7 +362,7 @@ class QueryResultsResource(BaseResource):
         dataset: str,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]: ...
 
@@ -245,7 +373,7 @@ class QueryResultsResource(BaseResource):
         dataset: str | None = None,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]:
         """Create a saved query and run it in one call (async).
@@ -265,7 +393,8 @@ class QueryResultsResource(BaseResource):
                            (default: True for better performance).
             limit: Override result limit (max 10,000 when disable_series=True, 1,000 otherwise).
                    Defaults to 10,000 when disable_series=True, 1,000 when False.
-            poll_interval: Seconds between poll attempts (default: 1.0).
+            poll_interval: Maximum seconds between poll attempts; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -292,20 +421,11 @@ class QueryResultsResource(BaseResource):
         """
         from ..models.query_builder import QueryBuilder
 
-        # Extract dataset based on spec type
-        if isinstance(spec, QueryBuilder):
-            if dataset is not None:
-                raise ValueError(
-                    "dataset parameter not allowed with QueryBuilder. "
-                    "Use .dataset() on the builder instead."
-                )
-            dataset = spec.get_dataset()
-        else:
-            if dataset is None:
-                raise ValueError(
-                    "dataset parameter required when using QuerySpec. "
-                    "Pass dataset='your-dataset' or use QueryBuilder instead."
-                )
+        dataset = _resolve_dataset(spec, dataset)
+        cache_key = self._result_cache_key(spec, dataset, disable_series, limit)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         # Create the saved query
         query = (
@@ -323,9 +443,156 @@ class QueryResultsResource(BaseResource):
             poll_interval=poll_interval,
             timeout=timeout,
         )
+        self._result_cache_put(cache_key, query, result)
 
         return query, result
 
+    async def run_many_async(
+        self,
+        specs: Iterable[QuerySpec | QueryBuilder],
+        *,
+        dataset: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        disable_series: bool = True,
+        limit: int | None = None,
+        poll_interval: float | None = None,
+        timeout: float = 60.0,
+        return_exceptions: bool = False,
+    ) -> list[QueryRun]:
+        """Create and run many queries concurrently (async).
+
+        At most max_concurrency queries are in flight at once, and all pending
+        query results are polled from a single shared loop.
+
+        Args:
+            specs: Query specifications (QueryBuilder or QuerySpec).
+            dataset: Dataset slug for QuerySpec entries (QueryBuilders carry their own).
+            max_concurrency: Maximum number of queries created and polled at once (default: 4).
+            disable_series: If True, disable timeseries data and allow up to 10K results.
+            limit: Override result limit (see create_async()).
+            poll_interval: Maximum seconds between poll attempts (default: the poll
+                strategy's max_delay).
+            timeout: Maximum seconds to wait for each query's results (default: 60.0).
+            return_exceptions: If True, failed runs are returned with QueryRun.error set
+                instead of raising.
+
+        Returns:
+            One QueryRun per spec, in input order.
+
+        Raises:
+            HoneycombTimeoutError: If a query doesn't complete within timeout.
+            ValueError: If dataset parameter is misused.
+
+        Example:
+            >>> runs = await client.query_results.run_many_async(
+            ...     [QueryBuilder().dataset("api").last_1_hour().count() for _ in range(20)],
+            ...     max_concurrency=5,
+            ... )
+            >>> for run in runs:
+            ...     print(run.index, len(run.result.data.rows), f"{run.elapsed:.2f}s")
+        """
+        runs = [
+            run
+            async for run in self.iter_many_async(
+                specs,
+                dataset=dataset,
+                max_concurrency=max_concurrency,
+                disable_series=disable_series,
+                limit=limit,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                return_exceptions=return_exceptions,
+            )
+        ]
+        return sorted(runs, key=lambda run: run.index)
+
+    async def iter_many_async(
+        self,
+        specs: Iterable[QuerySpec | QueryBuilder],
+        *,
+        dataset: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        disable_series: bool = True,
+        limit: int | None = None,
+        poll_interval: float | None = None,
+        timeout: float = 60.0,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[QueryRun]:
+        """Create and run many queries concurrently, yielding runs as they complete.
+
+        Same as run_many_async(), but each QueryRun is yielded as soon as its
+        query finishes. Leaving the loop early cancels the remaining queries.
+
+        Example:
+            >>> async for run in client.query_results.iter_many_async(specs, dataset="api"):
+            ...     print(f"query {run.index} done after {run.elapsed:.2f}s")
+        """
+        from ..exceptions import HoneycombTimeoutError
+        from ..models.query_builder import QueryBuilder
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        # Resolve every dataset up front so argument errors surface before any request
+        jobs = [(spec, _resolve_dataset(spec, dataset)) for spec in specs]
+
+        clock = self._client.poll_strategy._clock
+        semaphore = asyncio.Semaphore(max_concurrency)
+        scheduler: PollScheduler[tuple[str, str], QueryResult] = PollScheduler(
+            lambda key: self._get_with_hint_async(*key),
+            _is_complete,
+            strategy=self._client.poll_strategy,
+            timeout=timeout,
+            max_delay=poll_interval,
+        )
+
+        async def run_one(index: int, spec: QuerySpec | QueryBuilder, ds: str) -> QueryRun:
+            run = QueryRun(index=index, dataset=ds)
+            submitted = clock()
+            async with semaphore:
+                started = clock()
+                run.queue_time = started - submitted
+                try:
+                    cache_key = self._result_cache_key(spec, ds, disable_series, limit)
+                    cached = self._result_cache_get(cache_key)
+                    if cached is not None:
+                        run.query, run.result = cached
+                        return run
+                    run.query = (
+                        await self._client.queries.create_async(spec)
+                        if isinstance(spec, QueryBuilder)
+                        else await self._client.queries.create_async(spec, dataset=ds)
+                    )
+                    result_id = await self.create_async(
+                        ds, run.query.id, disable_series=disable_series, limit=limit
+                    )
+                    created = clock()
+                    run.create_time = created - started
+                    try:
+                        run.result, run.polls = await scheduler.wait((ds, result_id))
+                        self._result_cache_put(cache_key, run.query, run.result)
+                    except TimeoutError as e:
+                        raise HoneycombTimeoutError(
+                            f"Query did not complete within {timeout}s", timeout=timeout
+                        ) from e
+                    finally:
+                        run.poll_time = clock() - created
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    run.error = e
+            return run
+
+        tasks = [
+            asyncio.create_task(run_one(index, spec, ds)) for index, (spec, ds) in enumerate(jobs)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def run_all_async(
         self,
         dataset: str,
@@ -333,9 +600,10 @@ class QueryResultsResource(BaseResource):
         sort_field: str | None = None,
         sort_order: str = "descending",
         max_results: int = DEFAULT_MAX_RESULTS,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
         on_page: Callable[[int, int], None] | None = None,
+        time_shards: int = 1,
     ) -> list[dict]:
         """Paginate through > 10K results using sort-based cursor pagination.
 
@@ -359,9 +627,15 @@ class QueryResultsResource(BaseResource):
                        Must be a calculation alias or breakdown field.
             sort_order: "ascending" or "descending" (default: "descending" for most important first).
             max_results: Maximum total results to return (default: 100,000).
-            poll_interval: Seconds between polls for each query.
+            poll_interval: Maximum seconds between polls for each query (default: the
+                poll strategy's max_delay).
             timeout: Timeout for each individual query execution.
             on_page: Optional callback(page_num, total_rows) called after each page.
+                With time_shards, both counts are summed over all windows (rows before merging).
+            time_shards: Split the time range into this many windows, paginated in
+                parallel and merged (default: 1, no sharding). Requires a breakdown
+                sort_field, no havings, and only COUNT, SUM, MIN and MAX calculations,
+                whose per-window values are combined exactly.
 
         Note:
             Each page returns up to 10,000 rows (limit=10000 passed at execution time).
@@ -395,72 +669,215 @@ class QueryResultsResource(BaseResource):
             The method uses smart stopping: if >50% duplicates detected between
             pages, pagination stops (indicates long tail of identical values).
         """
-        # Validate spec
-        if not spec.calculations:
-            raise ValueError("spec.calculations is required for run_all_async")
+        if time_shards < 1:
+            raise ValueError("time_shards must be >= 1")
+        sort_field_for_access, sort_field_for_orders = self._resolve_sort_field(spec, sort_field)
 
-        # Determine sort field (default to first calculation)
-        if sort_field is None:
-            # Auto-default from first calculation
-            first_calc = spec.calculations[0]
-            alias = _get_calc_attr(first_calc, "alias")
-            if alias:
-                # Alias provided - use it for both orders and access
-                sort_field_for_access = alias
-                sort_field_for_orders = alias
-            else:
-                # No alias - use uppercase op for both (results use uppercase like "COUNT")
-                op = _get_calc_attr(first_calc, "op", "COUNT")
-                sort_field_for_orders = op
-                sort_field_for_access = op
-        else:
-            # User provided sort_field - check if it matches a calculation op
-            matched_calc = None
-            for calc in spec.calculations:
-                # Check if sort_field matches this calculation's op (case-insensitive)
-                calc_op = _get_calc_attr(calc, "op", "")
-                if calc_op.lower() == sort_field.lower():
-                    matched_calc = calc
-                    break
-                # Or matches the alias exactly
-                calc_alias = _get_calc_attr(calc, "alias")
-                if calc_alias == sort_field:
-                    matched_calc = calc
-                    break
-
-            if matched_calc:
-                # Matched a calculation - use uppercase op or alias
-                matched_alias = _get_calc_attr(matched_calc, "alias")
-                if matched_alias:
-                    sort_field_for_access = matched_alias
-                    sort_field_for_orders = matched_alias
-                else:
-                    # No alias - use uppercase op for both
-                    matched_op = _get_calc_attr(matched_calc, "op", "COUNT")
-                    sort_field_for_orders = matched_op
-                    sort_field_for_access = matched_op
-            else:
-                # Assume it's a breakdown field - use as-is
-                sort_field_for_access = sort_field
-                sort_field_for_orders = sort_field
+        # Normalize time range to absolute timestamps
+        start_time, end_time = self._normalize_time_range(spec)
 
-        # Check for conflicting orders
-        if spec.orders:
-            raise ValueError(
-                "spec.orders must be None for run_all_async (sorting is managed automatically). "
-                "Remove orders or use run_async() instead."
+        if time_shards > 1:
+            self._check_shardable(spec, sort_field_for_access)
+            windows = _split_window(start_time, end_time, time_shards)
+            shard_pages = [0] * len(windows)
+            shard_rows = [0] * len(windows)
+
+            def shard_progress(shard: int) -> Callable[[int, int], None]:
+                def report(page_num: int, total_rows: int) -> None:
+                    shard_pages[shard], shard_rows[shard] = page_num, total_rows
+                    if on_page:
+                        on_page(sum(shard_pages), sum(shard_rows))
+
+                return report
+
+            shards = await asyncio.gather(
+                *(
+                    self._paginate_async(
+                        dataset,
+                        spec,
+                        window_start,
+                        window_end,
+                        sort_field_for_access,
+                        sort_field_for_orders,
+                        sort_order,
+                        max_results,
+                        poll_interval,
+                        timeout,
+                        shard_progress(shard),
+                    )
+                    for shard, (window_start, window_end) in enumerate(windows)
+                )
             )
+            return self._merge_shards(shards, spec, sort_field_for_access, sort_order)[:max_results]
 
-        # Normalize time range to absolute timestamps
+        return await self._paginate_async(
+            dataset,
+            spec,
+            start_time,
+            end_time,
+            sort_field_for_access,
+            sort_field_for_orders,
+            sort_order,
+            max_results,
+            poll_interval,
+            timeout,
+            on_page,
+        )
+
+    async def iter_pages_async(
+        self,
+        dataset: str,
+        spec: QuerySpec,
+        sort_field: str | None = None,
+        sort_order: str = "descending",
+        max_results: int = DEFAULT_MAX_RESULTS,
+        poll_interval: float | None = None,
+        timeout: float = 60.0,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream the pages of run_all_async() as they arrive.
+
+        Yields each page's deduplicated rows as soon as the page query completes.
+        Only the keys of rows at the current cursor value are kept for
+        deduplication, so memory stays bounded by one page. Stop iterating to
+        skip the remaining pages.
+
+        Args:
+            dataset: Dataset slug.
+            spec: Query specification (see run_all_async()).
+            sort_field: Field to sort/paginate by. Defaults to first calculation's alias.
+            sort_order: "ascending" or "descending" (default: "descending").
+            max_results: Stop after this many rows (the last page is not truncated).
+            poll_interval: Maximum seconds between polls for each query (default: the
+                poll strategy's max_delay).
+            timeout: Timeout for each individual query execution.
+
+        Yields:
+            Lists of new result rows, one per page.
+
+        Raises:
+            ValueError: If spec has conflicting orders or invalid configuration.
+            HoneycombTimeoutError: If any query times out.
+
+        Example:
+            >>> async for page in client.query_results.iter_pages_async("my-dataset", spec):
+            ...     writer.writerows(page)
+        """
+        sort_field_for_access, sort_field_for_orders = self._resolve_sort_field(spec, sort_field)
         start_time, end_time = self._normalize_time_range(spec)
+        async for page in self._iter_pages_async(
+            dataset,
+            spec,
+            start_time,
+            end_time,
+            sort_field_for_access,
+            sort_field_for_orders,
+            sort_order,
+            max_results,
+            poll_interval,
+            timeout,
+        ):
+            yield page
+
+    async def iter_all_async(
+        self,
+        dataset: str,
+        spec: QuerySpec,
+        sort_field: str | None = None,
+        sort_order: str = "descending",
+        max_results: int = DEFAULT_MAX_RESULTS,
+        poll_interval: float | None = None,
+        timeout: float = 60.0,
+    ) -> AsyncIterator[dict]:
+        """Stream the rows of run_all_async() one at a time.
 
-        # Track all rows and seen keys for deduplication
-        all_rows: list[dict] = []
-        seen_keys: set[tuple] = set()
+        Same as iter_pages_async(), flattened to rows. Breaking out of the loop
+        stops pagination before the next page query is created.
+
+        Yields:
+            Deduplicated result rows, in sort order.
+
+        Example:
+            >>> async for row in client.query_results.iter_all_async("my-dataset", spec):
+            ...     if row["COUNT"] < 10:
+            ...         break
+            ...     sink.write(row)
+        """
+        async for page in self.iter_pages_async(
+            dataset,
+            spec,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            max_results=max_results,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        ):
+            for row in page:
+                yield row
+
+    def rolling(
+        self,
+        spec: QuerySpec | QueryBuilder,
+        *,
+        dataset: str | None = None,
+        window: int | None = None,
+        granularity: int | None = None,
+        refetch_buckets: int = 1,
+    ) -> RollingQuery:
+        """Create an incrementally refreshed rolling-window time-series query.
+
+        Each refresh only queries the granularity buckets completed since the
+        previous one (plus refetch_buckets trailing buckets for late events)
+        and evicts buckets older than the window.
+
+        Args:
+            spec: Time-series query. Its time range is replaced on every refresh.
+            dataset: Dataset slug. Required for QuerySpec, extracted from QueryBuilder.
+            window: Seconds of history to retain (default: spec.time_range or 1 hour).
+            granularity: Bucket size in seconds (default: spec.granularity or 60).
+            refetch_buckets: Trailing buckets to query again on each refresh (default: 1).
+
+        Returns:
+            A RollingQuery; call refresh_async() (or refresh() in sync mode).
+
+        Example:
+            >>> rolling = client.query_results.rolling(
+            ...     QueryBuilder().dataset("api").count(), window=3600, granularity=60
+            ... )
+            >>> series = await rolling.refresh_async()
+        """
+        return RollingQuery(
+            self._client,
+            spec,
+            dataset=dataset,
+            window=window,
+            granularity=granularity,
+            refetch_buckets=refetch_buckets,
+        )
+
+    async def _iter_pages_async(
+        self,
+        dataset: str,
+        spec: QuerySpec,
+        start_time: int,
+        end_time: int,
+        sort_field_for_access: str,
+        sort_field_for_orders: str,
+        sort_order: str,
+        max_results: int,
+        poll_interval: float | None,
+        timeout: float,
+    ) -> AsyncIterator[list[dict]]:
+        """Run the cursor pagination over one absolute time window, yielding new rows per page.
+
+        Only rows sharing the current cursor value can be returned again by the
+        next page, so only their keys are kept for deduplication.
+        """
+        boundary_keys: set[tuple] = set()
         cursor_value: Any | None = None
+        total_rows = 0
         page_num = 0
 
-        while len(all_rows) < max_results:
+        while total_rows < max_results:
             page_num += 1
 
             # Build page spec
@@ -486,7 +903,7 @@ class QueryResultsResource(BaseResource):
                 is_calculation = any(
                     _get_calc_attr(calc, "alias") == sort_field_for_access
                     or _get_calc_attr(calc, "op") == sort_field_for_access
-                    for calc in spec.calculations
+                    for calc in spec.calculations or []
                 )
 
                 if is_calculation:
@@ -519,19 +936,25 @@ class QueryResultsResource(BaseResource):
                 )
 
             # Run the page query (create saved query then run it)
+            cache_key = self._result_cache_key(page_spec, dataset, True, 10000)
+            cached = self._result_cache_get(cache_key)
             try:
-                # Create the saved query (page_spec is QuerySpec, pass dataset explicitly)
-                query = await self._client.queries.create_async(page_spec, dataset=dataset)
-
-                # Run it and poll for results
-                result = await self.run_async(
-                    dataset,
-                    query_id=query.id,
-                    disable_series=True,
-                    limit=10000,  # Override to get max results per page
-                    poll_interval=poll_interval,
-                    timeout=timeout,
-                )
+                if cached is not None:
+                    query, result = cached
+                else:
+                    # Create the saved query (page_spec is QuerySpec, pass dataset explicitly)
+                    query = await self._client.queries.create_async(page_spec, dataset=dataset)
+
+                    # Run it and poll for results
+                    result = await self.run_async(
+                        dataset,
+                        query_id=query.id,
+                        disable_series=True,
+                        limit=10000,  # Override to get max results per page
+                        poll_interval=poll_interval,
+                        timeout=timeout,
+                    )
+                    self._result_cache_put(cache_key, query, result)
             except Exception:
                 # Log the spec that failed for debugging
                 logger.error(f"Failed to create/run query on page {page_num}")
@@ -541,41 +964,202 @@ class QueryResultsResource(BaseResource):
             if not result.data or not result.data.results or len(result.data.results) == 0:
                 break  # No more results
 
-            # Deduplicate and collect new rows (use unwrapped rows)
-            new_rows_count = 0
-            for row in result.data.rows:
+            # Deduplicate new rows (use unwrapped rows)
+            rows = result.data.rows
+            new_rows = []
+            for row in rows:
                 # Build composite unique key from breakdowns + calculations
                 key = self._build_row_key(row, spec)
 
-                if key not in seen_keys:
-                    seen_keys.add(key)
-                    all_rows.append(row)
-                    new_rows_count += 1
+                if key not in boundary_keys:
+                    boundary_keys.add(key)
+                    new_rows.append(row)
 
-            # Progress callback
-            if on_page:
-                on_page(page_num, len(all_rows))
+            total_rows += len(new_rows)
+            yield new_rows
 
             # Smart stopping: if >50% duplicates, we've hit a long tail
-            duplication_rate = 1.0 - (new_rows_count / len(result.data.rows))
+            duplication_rate = 1.0 - (len(new_rows) / len(rows))
             if duplication_rate > DUPLICATION_THRESHOLD:
                 break  # Stop pagination (long tail of identical values)
 
             # Check if this was the last page (less than 10K means no more results)
-            if len(result.data.rows) < 10000:
+            if len(rows) < 10000:
                 break
 
             # Update cursor to last row's sort value
             try:
-                cursor_value = result.data.rows[-1][sort_field_for_access]
+                next_cursor = rows[-1][sort_field_for_access]
             except (KeyError, IndexError) as e:
                 raise ValueError(
                     f"Sort field '{sort_field_for_access}' not found in query results. "
                     "Ensure it's a calculation alias or breakdown field."
                 ) from e
-
+            if next_cursor != cursor_value:
+                # Rows before the new cursor value cannot be returned again
+                boundary_keys = {
+                    self._build_row_key(row, spec)
+                    for row in rows
+                    if row.get(sort_field_for_access) == next_cursor
+                }
+            cursor_value = next_cursor
+
+    async def _paginate_async(
+        self,
+        dataset: str,
+        spec: QuerySpec,
+        start_time: int,
+        end_time: int,
+        sort_field_for_access: str,
+        sort_field_for_orders: str,
+        sort_order: str,
+        max_results: int,
+        poll_interval: float | None,
+        timeout: float,
+        on_page: Callable[[int, int], None] | None,
+    ) -> list[dict]:
+        """Collect the pages of one time window into a list (see _iter_pages_async)."""
+        all_rows: list[dict] = []
+        page_num = 0
+        async for page in self._iter_pages_async(
+            dataset,
+            spec,
+            start_time,
+            end_time,
+            sort_field_for_access,
+            sort_field_for_orders,
+            sort_order,
+            max_results,
+            poll_interval,
+            timeout,
+        ):
+            page_num += 1
+            all_rows.extend(page)
+            # Progress callback
+            if on_page:
+                on_page(page_num, len(all_rows))
         return all_rows
 
+    def _resolve_sort_field(self, spec: QuerySpec, sort_field: str | None) -> tuple[str, str]:
+        """Validate a spec for cursor pagination and resolve its sort field.
+
+        Returns:
+            Tuple of (field name in result rows, field name for spec.orders).
+        """
+        # Validate spec
+        if not spec.calculations:
+            raise ValueError("spec.calculations is required for run_all_async")
+
+        # Determine sort field (default to first calculation)
+        if sort_field is None:
+            # Auto-default from first calculation
+            first_calc = spec.calculations[0]
+            alias = _get_calc_attr(first_calc, "alias")
+            if alias:
+                # Alias provided - use it for both orders and access
+                sort_field_for_access = alias
+                sort_field_for_orders = alias
+            else:
+                # No alias - use uppercase op for both (results use uppercase like "COUNT")
+                op = _get_calc_attr(first_calc, "op", "COUNT")
+                sort_field_for_orders = op
+                sort_field_for_access = op
+        else:
+            # User provided sort_field - check if it matches a calculation op
+            matched_calc = None
+            for calc in spec.calculations:
+                # Check if sort_field matches this calculation's op (case-insensitive)
+                calc_op = _get_calc_attr(calc, "op", "")
+                if calc_op.lower() == sort_field.lower():
+                    matched_calc = calc
+                    break
+                # Or matches the alias exactly
+                calc_alias = _get_calc_attr(calc, "alias")
+                if calc_alias == sort_field:
+                    matched_calc = calc
+                    break
+
+            if matched_calc:
+                # Matched a calculation - use uppercase op or alias
+                matched_alias = _get_calc_attr(matched_calc, "alias")
+                if matched_alias:
+                    sort_field_for_access = matched_alias
+                    sort_field_for_orders = matched_alias
+                else:
+                    # No alias - use uppercase op for both
+                    matched_op = _get_calc_attr(matched_calc, "op", "COUNT")
+                    sort_field_for_orders = matched_op
+                    sort_field_for_access = matched_op
+            else:
+                # Assume it's a breakdown field - use as-is
+                sort_field_for_access = sort_field
+                sort_field_for_orders = sort_field
+
+        # Check for conflicting orders
+        if spec.orders:
+            raise ValueError(
+                "spec.orders must be None for run_all_async (sorting is managed automatically). "
+                "Remove orders or use run_async() instead."
+            )
+
+        return sort_field_for_access, sort_field_for_orders
+
+    def _check_shardable(self, spec: QuerySpec, sort_field: str) -> None:
+        """Raise ValueError if splitting spec's time range would change its results.
+
+        Per-window rows can only be merged back exactly when the cursor is a
+        breakdown (so each window's first N groups include the overall first N),
+        every calculation can be combined across windows, and no HAVING clause
+        filters on per-window values.
+        """
+        if not spec.breakdowns or sort_field not in spec.breakdowns:
+            raise ValueError(
+                "time_shards requires sort_field to be a breakdown field "
+                "(calculation cursors depend on values across the whole time range)"
+            )
+        if spec.havings:
+            raise ValueError("time_shards cannot be used with havings")
+        for calc in spec.calculations or []:
+            op = str(_get_calc_attr(calc, "op", "COUNT")).upper()
+            if op not in _SHARD_MERGES:
+                raise ValueError(
+                    f"time_shards cannot merge {op} across time windows "
+                    f"(supported: {', '.join(_SHARD_MERGES)})"
+                )
+
+    def _merge_shards(
+        self, shards: list[list[dict]], spec: QuerySpec, sort_field: str, sort_order: str
+    ) -> list[dict]:
+        """Combine per-window rows into one row per breakdown group, sorted by sort_field."""
+        fields = [
+            (
+                _get_calc_attr(calc, "alias") or _get_calc_attr(calc, "op", "COUNT"),
+                _SHARD_MERGES[str(_get_calc_attr(calc, "op", "COUNT")).upper()],
+            )
+            for calc in spec.calculations or []
+        ]
+        merged: dict[tuple, dict] = {}
+        for rows in shards:
+            for row in rows:
+                group = tuple(row.get(breakdown) for breakdown in spec.breakdowns or [])
+                existing = merged.get(group)
+                if existing is None:
+                    merged[group] = dict(row)
+                    continue
+                for field, combine in fields:
+                    if row.get(field) is None:
+                        continue
+                    if existing.get(field) is None:
+                        existing[field] = row[field]
+                    else:
+                        existing[field] = combine(existing[field], row[field])
+
+        return sorted(
+            merged.values(),
+            key=lambda row: (row.get(sort_field) is not None, row.get(sort_field)),
+            reverse=sort_order == "descending",
+        )
+
     def _normalize_time_range(self, spec: QuerySpec) -> tuple[int, int]:
         """Convert relative time_range to absolute start/end timestamps.
 
@@ -702,8 +1286,16 @@ class QueryResultsResource(BaseResource):
         """
         if not self._client.is_sync:
             raise RuntimeError("Use get_async() for async mode, or pass sync=True to client")
-        data = self._get_sync(self._build_path(dataset, query_result_id))
-        return self._parse_model(QueryResult, data)
+        result, _ = self._get_with_hint(dataset, query_result_id)
+        return result
+
+    def _get_with_hint(
+        self, dataset: str, query_result_id: str
+    ) -> tuple[QueryResult, float | None]:
+        """Get a query result along with the server's Retry-After hint (if any)."""
+        response = self._client.get_sync(self._build_path(dataset, query_result_id))
+        data = self._client.json_codec.decode(response.content)
+        return self._parse_model(QueryResult, data), self._client._parse_retry_after(response)
 
     def run(
         self,
@@ -711,7 +1303,7 @@ class QueryResultsResource(BaseResource):
         query_id: str,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> QueryResult:
         """Run a saved query and poll for results.
@@ -725,7 +1317,8 @@ class QueryResultsResource(BaseResource):
                            (default: True for better performance).
             limit: Override result limit (max 10,000 when disable_series=True, 1,000 otherwise).
                    Defaults to 10,000 when disable_series=True, 1,000 when False.
-            poll_interval: Seconds between poll attempts (default: 1.0).
+            poll_interval: Maximum seconds between poll attempts; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -741,8 +1334,6 @@ class QueryResultsResource(BaseResource):
         if not self._client.is_sync:
             raise RuntimeError("Use run_async() for async mode, or pass sync=True to client")
 
-        import time
-
         from ..exceptions import HoneycombTimeoutError
 
         # Create the query result
@@ -750,24 +1341,19 @@ class QueryResultsResource(BaseResource):
             dataset, query_id=query_id, disable_series=disable_series, limit=limit
         )
 
-        # Poll for completion
-        start_time = time.time()
-        while True:
-            result = self.get(dataset, result_id)
-
-            # Check if query is complete (has results)
-            if result.data is not None and result.data.results is not None:
-                return result
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise HoneycombTimeoutError(
-                    f"Query did not complete within {timeout}s", timeout=timeout
-                )
-
-            # Wait before next poll
-            time.sleep(poll_interval)
+        # Poll for completion (adaptive: fast first polls, backing off to poll_interval
+        # or, if it is not given, the poll strategy's max_delay)
+        try:
+            return self._client.poll_strategy.poll(
+                lambda: self._get_with_hint(dataset, result_id),
+                _is_complete,
+                timeout=timeout,
+                max_delay=poll_interval,
+            )
+        except TimeoutError as e:
+            raise HoneycombTimeoutError(
+                f"Query did not complete within {timeout}s", timeout=timeout
+            ) from e
 
     @overload
     def create_and_run(
@@ -776,7 +1362,7 @@ class QueryResultsResource(BaseResource):
         *,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]: ...
 
@@ -788,7 +1374,7 @@ class QueryResultsResource(BaseResource):
         dataset: str,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]: ...
 
@@ -799,7 +1385,7 @@ class QueryResultsResource(BaseResource):
         dataset: str | None = None,
         disable_series: bool = True,
         limit: int | None = None,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> tuple[Query, QueryResult]:
         """Create a saved query and run it in one call.
@@ -819,7 +1405,8 @@ class QueryResultsResource(BaseResource):
                            (default: True for better performance).
             limit: Override result limit (max 10,000 when disable_series=True, 1,000 otherwise).
                    Defaults to 10,000 when disable_series=True, 1,000 when False.
-            poll_interval: Seconds between poll attempts (default: 1.0).
+            poll_interval: Maximum seconds between poll attempts; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -851,20 +1438,11 @@ class QueryResultsResource(BaseResource):
 
         from ..models.query_builder import QueryBuilder
 
-        # Extract dataset based on spec type
-        if isinstance(spec, QueryBuilder):
-            if dataset is not None:
-                raise ValueError(
-                    "dataset parameter not allowed with QueryBuilder. "
-                    "Use .dataset() on the builder instead."
-                )
-            dataset = spec.get_dataset()
-        else:
-            if dataset is None:
-                raise ValueError(
-                    "dataset parameter required when using QuerySpec. "
-                    "Pass dataset='your-dataset' or use QueryBuilder instead."
-                )
+        dataset = _resolve_dataset(spec, dataset)
+        cache_key = self._result_cache_key(spec, dataset, disable_series, limit)
+        cached = self._result_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         # Create the saved query
         query = (
@@ -882,5 +1460,6 @@ class QueryResultsResource(BaseResource):
             poll_interval=poll_interval,
             timeout=timeout,
         )
+        self._result_cache_put(cache_key, query, result)
 
         return query, result
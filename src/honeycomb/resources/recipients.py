@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import TYPE_CHECKING, Any, List  # noqa: UP035
 
 from ..models.recipients import Recipient, RecipientCreate
+from ._recipient_utils import RecipientIndex
 from .base import BaseResource
 
 if TYPE_CHECKING:
@@ -34,6 +37,10 @@ class RecipientsResource(BaseResource):
 
     def __init__(self, client: HoneycombClient) -> None:
         super().__init__(client)
+        # Index of existing recipients shared by inline recipient resolution
+        self._index: RecipientIndex | None = None
+        self._index_task: asyncio.Task[RecipientIndex] | None = None
+        self._index_lock = threading.Lock()
 
     def _build_path(self, recipient_id: str | None = None) -> str:
         """Build API path for recipients."""
@@ -55,6 +62,45 @@ class RecipientsResource(BaseResource):
         data = await self._get_async(self._build_path())
         return self._parse_model_list(Recipient, data)
 
+    async def index_async(self, refresh: bool = False) -> RecipientIndex:
+        """Get the cached index of existing recipients by type and target (async).
+
+        The index is built from list_async() and reused for RECIPIENT_INDEX_TTL
+        seconds. Concurrent callers share one list request. Recipients created
+        through this client are added to it; updates and deletes invalidate it.
+
+        Args:
+            refresh: Reload the index even if the cached one is still fresh.
+
+        Returns:
+            RecipientIndex for this client.
+        """
+        index = self._index
+        if index is not None and index.fresh() and not refresh:
+            return index
+        loop = asyncio.get_running_loop()
+        task = self._index_task
+        # A finished load is stale, failed or was invalidated; otherwise join it
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._index_task = loop.create_task(self._load_index_async())
+        return await asyncio.shield(task)
+
+    async def _load_index_async(self) -> RecipientIndex:
+        """List recipients and cache them as the client's index."""
+        index = RecipientIndex(await self.list_async())
+        self._index = index
+        return index
+
+    def invalidate_index(self) -> None:
+        """Drop the cached recipient index so the next lookup lists recipients again."""
+        self._index = None
+        self._index_task = None
+
+    def _index_created(self, recipient: Recipient) -> None:
+        """Add a newly created recipient to the cached index, if any."""
+        if self._index is not None:
+            self._index.add(recipient)
+
     async def get_async(self, recipient_id: str) -> Recipient:
         """Get a specific recipient (async).
 
@@ -77,7 +123,9 @@ class RecipientsResource(BaseResource):
             Created Recipient object.
         """
         data = await self._post_async(self._build_path(), json=recipient.model_dump_for_api())
-        return self._parse_model(Recipient, data)
+        created = self._parse_model(Recipient, data)
+        self._index_created(created)
+        return created
 
     async def update_async(self, recipient_id: str, recipient: RecipientCreate) -> Recipient:
         """Update an existing recipient (async).
@@ -92,6 +140,7 @@ class RecipientsResource(BaseResource):
         data = await self._put_async(
             self._build_path(recipient_id), json=recipient.model_dump_for_api()
         )
+        self.invalidate_index()
         return self._parse_model(Recipient, data)
 
     async def delete_async(self, recipient_id: str) -> None:
@@ -101,6 +150,7 @@ class RecipientsResource(BaseResource):
             recipient_id: Recipient ID.
         """
         await self._delete_async(self._build_path(recipient_id))
+        self.invalidate_index()
 
     async def get_triggers_async(self, recipient_id: str) -> List[dict[str, Any]]:  # noqa: UP006
         """Get all triggers associated with a recipient (async).
@@ -131,6 +181,29 @@ class RecipientsResource(BaseResource):
         data = self._get_sync(self._build_path())
         return self._parse_model_list(Recipient, data)
 
+    def index(self, refresh: bool = False) -> RecipientIndex:
+        """Get the cached index of existing recipients by type and target.
+
+        See index_async(). Threads share one list request.
+
+        Args:
+            refresh: Reload the index even if the cached one is still fresh.
+
+        Returns:
+            RecipientIndex for this client.
+        """
+        if not self._client.is_sync:
+            raise RuntimeError("Use index_async() for async mode, or pass sync=True to client")
+        stale = self._index
+        if stale is not None and stale.fresh() and not refresh:
+            return stale
+        with self._index_lock:
+            # Another thread may have reloaded the index while we waited
+            if self._index is not None and self._index is not stale and self._index.fresh():
+                return self._index
+            self._index = RecipientIndex(self.list())
+            return self._index
+
     def get(self, recipient_id: str) -> Recipient:
         """Get a specific recipient.
 
@@ -157,7 +230,9 @@ class RecipientsResource(BaseResource):
         if not self._client.is_sync:
             raise RuntimeError("Use create_async() for async mode, or pass sync=True to client")
         data = self._post_sync(self._build_path(), json=recipient.model_dump_for_api())
-        return self._parse_model(Recipient, data)
+        created = self._parse_model(Recipient, data)
+        self._index_created(created)
+        return created
 
     def update(self, recipient_id: str, recipient: RecipientCreate) -> Recipient:
         """Update an existing recipient.
@@ -172,6 +247,7 @@ class RecipientsResource(BaseResource):
         if not self._client.is_sync:
             raise RuntimeError("Use update_async() for async mode, or pass sync=True to client")
         data = self._put_sync(self._build_path(recipient_id), json=recipient.model_dump_for_api())
+        self.invalidate_index()
         return self._parse_model(Recipient, data)
 
     def delete(self, recipient_id: str) -> None:
@@ -183,6 +259,7 @@ class RecipientsResource(BaseResource):
         if not self._client.is_sync:
             raise RuntimeError("Use delete_async() for async mode, or pass sync=True to client")
         self._delete_sync(self._build_path(recipient_id))
+        self.invalidate_index()
 
     def get_triggers(self, recipient_id: str) -> List[dict[str, Any]]:  # noqa: UP006
         """Get all triggers associated with a recipient.
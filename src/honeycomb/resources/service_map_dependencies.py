@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlparse
 
@@ -26,6 +24,14 @@ DEFAULT_PAGE_SIZE = 100
 DEFAULT_MAX_PAGES = 640
 
 
+def _is_finished(result: ServiceMapDependencyResult) -> bool:
+    """Return True once a polled request is ready or has failed."""
+    return result.status in (
+        ServiceMapDependencyRequestStatus.READY,
+        ServiceMapDependencyRequestStatus.ERROR,
+    )
+
+
 class ServiceMapDependenciesResource(BaseResource):
     """Resource for querying service map dependencies.
 
@@ -135,6 +141,13 @@ class ServiceMapDependenciesResource(BaseResource):
             The default rate limit is 100 requests per minute per operation.
             Contact Honeycomb support for higher limits: https://www.honeycomb.io/support
         """
+        result, _ = await self._get_result_with_hint_async(request_id, max_pages)
+        return result
+
+    async def _get_result_with_hint_async(
+        self, request_id: str, max_pages: int
+    ) -> tuple[ServiceMapDependencyResult, float | None]:
+        """Fetch a request's results along with the server's Retry-After hint (if any)."""
         all_dependencies: list[ServiceMapDependency] = []
         cursor: str | None = None
         result_status: ServiceMapDependencyRequestStatus = ServiceMapDependencyRequestStatus.PENDING
@@ -143,21 +156,23 @@ class ServiceMapDependenciesResource(BaseResource):
 
         while pages_fetched < max_pages:
             params = self._build_params(cursor=cursor)
-            data = await self._get_async(
+            response = await self._client.get_async(
                 f"/1/maps/dependencies/requests/{request_id}",
                 params=params,
             )
+            data = self._client.json_codec.decode(response.content)
 
             result_status = ServiceMapDependencyRequestStatus(data.get("status", "pending"))
             result_request_id = data.get("request_id", request_id)
 
             # If not ready yet, return current state
             if result_status != ServiceMapDependencyRequestStatus.READY:
-                return ServiceMapDependencyResult(
+                pending = ServiceMapDependencyResult(
                     request_id=result_request_id,
                     status=result_status,
                     dependencies=None,
                 )
+                return pending, self._client._parse_retry_after(response)
 
             # Parse dependencies from this page
             deps = data.get("dependencies") or []
@@ -170,18 +185,19 @@ class ServiceMapDependenciesResource(BaseResource):
             if not cursor:
                 break
 
-        return ServiceMapDependencyResult(
+        result = ServiceMapDependencyResult(
             request_id=result_request_id,
             status=result_status,
             dependencies=all_dependencies,
         )
+        return result, None
 
     async def get_async(
         self,
         request: ServiceMapDependencyRequestCreate,
         limit: int = 10000,
         max_pages: int = DEFAULT_MAX_PAGES,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> ServiceMapDependencyResult:
         """Create and retrieve Service Map Dependencies in one call (async).
@@ -193,7 +209,8 @@ class ServiceMapDependenciesResource(BaseResource):
             request: The dependency query parameters.
             limit: Maximum dependencies to return (default: 10000, max: 64000).
             max_pages: Maximum pages to fetch (default: 640).
-            poll_interval: Seconds between status checks (default: 1.0).
+            poll_interval: Maximum seconds between status checks; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -210,26 +227,20 @@ class ServiceMapDependenciesResource(BaseResource):
         # Create the request
         req = await self.create_async(request, limit=limit)
 
-        # Poll until ready
-        start_time = asyncio.get_event_loop().time()
-        while True:
-            result = await self.get_result_async(req.request_id, max_pages=max_pages)
-
-            if result.status == ServiceMapDependencyRequestStatus.READY:
-                return result
-
-            if result.status == ServiceMapDependencyRequestStatus.ERROR:
-                return result
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
-                raise TimeoutError(
-                    f"Service map dependencies request {req.request_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-
-            await asyncio.sleep(poll_interval)
+        # Poll until ready (adaptive: fast first polls, backing off to poll_interval
+        # or, if it is not given, the poll strategy's max_delay)
+        try:
+            return await self._client.poll_strategy.poll_async(
+                lambda: self._get_result_with_hint_async(req.request_id, max_pages),
+                _is_finished,
+                timeout=timeout,
+                max_delay=poll_interval,
+            )
+        except TimeoutError as e:
+            raise TimeoutError(
+                f"Service map dependencies request {req.request_id} did not complete "
+                f"within {timeout} seconds"
+            ) from e
 
     # -------------------------------------------------------------------------
     # Sync methods
@@ -289,6 +300,13 @@ class ServiceMapDependenciesResource(BaseResource):
         if not self._client.is_sync:
             raise RuntimeError("Use get_result_async() for async mode, or pass sync=True to client")
 
+        result, _ = self._get_result_with_hint(request_id, max_pages)
+        return result
+
+    def _get_result_with_hint(
+        self, request_id: str, max_pages: int
+    ) -> tuple[ServiceMapDependencyResult, float | None]:
+        """Fetch a request's results along with the server's Retry-After hint (if any)."""
         all_dependencies: list[ServiceMapDependency] = []
         cursor: str | None = None
         result_status: ServiceMapDependencyRequestStatus = ServiceMapDependencyRequestStatus.PENDING
@@ -297,21 +315,23 @@ class ServiceMapDependenciesResource(BaseResource):
 
         while pages_fetched < max_pages:
             params = self._build_params(cursor=cursor)
-            data = self._get_sync(
+            response = self._client.get_sync(
                 f"/1/maps/dependencies/requests/{request_id}",
                 params=params,
             )
+            data = self._client.json_codec.decode(response.content)
 
             result_status = ServiceMapDependencyRequestStatus(data.get("status", "pending"))
             result_request_id = data.get("request_id", request_id)
 
             # If not ready yet, return current state
             if result_status != ServiceMapDependencyRequestStatus.READY:
-                return ServiceMapDependencyResult(
+                pending = ServiceMapDependencyResult(
                     request_id=result_request_id,
                     status=result_status,
                     dependencies=None,
                 )
+                return pending, self._client._parse_retry_after(response)
 
             # Parse dependencies from this page
             deps = data.get("dependencies") or []
@@ -324,18 +344,19 @@ class ServiceMapDependenciesResource(BaseResource):
             if not cursor:
                 break
 
-        return ServiceMapDependencyResult(
+        result = ServiceMapDependencyResult(
             request_id=result_request_id,
             status=result_status,
             dependencies=all_dependencies,
         )
+        return result, None
 
     def get(
         self,
         request: ServiceMapDependencyRequestCreate,
         limit: int = 10000,
         max_pages: int = DEFAULT_MAX_PAGES,
-        poll_interval: float = 1.0,
+        poll_interval: float | None = None,
         timeout: float = 60.0,
     ) -> ServiceMapDependencyResult:
         """Create and retrieve Service Map Dependencies in one call.
@@ -347,7 +368,8 @@ class ServiceMapDependenciesResource(BaseResource):
             request: The dependency query parameters.
             limit: Maximum dependencies to return (default: 10000, max: 64000).
             max_pages: Maximum pages to fetch (default: 640).
-            poll_interval: Seconds between status checks (default: 1.0).
+            poll_interval: Maximum seconds between status checks; polling starts faster
+                and backs off up to this interval (default: the poll strategy's max_delay).
             timeout: Maximum seconds to wait for results (default: 60.0).
 
         Returns:
@@ -367,23 +389,17 @@ class ServiceMapDependenciesResource(BaseResource):
         # Create the request
         req = self.create(request, limit=limit)
 
-        # Poll until ready
-        start_time = time.time()
-        while True:
-            result = self.get_result(req.request_id, max_pages=max_pages)
-
-            if result.status == ServiceMapDependencyRequestStatus.READY:
-                return result
-
-            if result.status == ServiceMapDependencyRequestStatus.ERROR:
-                return result
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise TimeoutError(
-                    f"Service map dependencies request {req.request_id} did not complete "
-                    f"within {timeout} seconds"
-                )
-
-            time.sleep(poll_interval)
+        # Poll until ready (adaptive: fast first polls, backing off to poll_interval
+        # or, if it is not given, the poll strategy's max_delay)
+        try:
+            return self._client.poll_strategy.poll(
+                lambda: self._get_result_with_hint(req.request_id, max_pages),
+                _is_finished,
+                timeout=timeout,
+                max_delay=poll_interval,
+            )
+        except TimeoutError as e:
+            raise TimeoutError(
+                f"Service map dependencies request {req.request_id} did not complete "
+                f"within {timeout} seconds"
+            ) from e
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from ..models.burn_alerts import BurnAlertCreate, BurnAlertRecipient
 from ..models.slos import SLO, SLOCreate
@@ -10,7 +13,63 @@ from .base import BaseResource
 
 if TYPE_CHECKING:
     from ..client import HoneycombClient
-    from ..models.slo_builder import SLOBundle
+    from ..models.slo_builder import BurnAlertDefinition, SLOBundle
+
+# Default number of burn alerts create_from_bundle creates at once
+DEFAULT_BUNDLE_CONCURRENCY = 4
+
+
+async def _gather_all(*aws: Awaitable[Any]) -> list[Any]:
+    """Like asyncio.gather, but wait for every awaitable before raising the first error."""
+    outcomes = await asyncio.gather(*aws, return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return outcomes
+
+
+def _derived_column_dataset(bundle: SLOBundle) -> str:
+    """Dataset the bundle's derived column is created in."""
+    # Multi-dataset SLOs need an environment-wide derived column ("__all__")
+    return "__all__" if bundle.derived_column_environment_wide else bundle.datasets[0]
+
+
+def _slo_dataset(bundle: SLOBundle) -> str:
+    """Dataset the bundle's SLO is created in."""
+    # Multi-dataset SLOs are created once via the __all__ endpoint
+    return "__all__" if bundle.slo.dataset_slugs is not None else bundle.datasets[0]
+
+
+def _split_recipients(
+    bundle: SLOBundle, resolved: list[dict[str, Any]]
+) -> list[list[dict[str, Any]]]:
+    """Split recipients resolved for all burn alerts at once back into one list per alert."""
+    split = []
+    offset = 0
+    for alert_def in bundle.burn_alerts:
+        split.append(resolved[offset : offset + len(alert_def.recipients)])
+        offset += len(alert_def.recipients)
+    return split
+
+
+def _burn_alert_create(
+    alert_def: BurnAlertDefinition, slo_id: str, recipients: list[dict[str, Any]]
+) -> BurnAlertCreate:
+    """Build the BurnAlertCreate for a bundle burn alert with resolved recipients."""
+    # Convert budget rate percent to per-million if needed
+    budget_rate_threshold = None
+    if alert_def.budget_rate_decrease_percent is not None:
+        budget_rate_threshold = int(alert_def.budget_rate_decrease_percent * 10000)
+
+    return BurnAlertCreate(
+        alert_type=alert_def.alert_type,
+        slo_id=slo_id,
+        description=alert_def.description,
+        exhaustion_minutes=alert_def.exhaustion_minutes,
+        budget_rate_window_minutes=alert_def.budget_rate_window_minutes,
+        budget_rate_decrease_threshold_per_million=budget_rate_threshold,
+        recipients=[BurnAlertRecipient(**recipient) for recipient in recipients],
+    )
 
 
 class SLOsResource(BaseResource):
@@ -110,7 +169,9 @@ class SLOsResource(BaseResource):
     # SLO Bundle creation helpers (async)
     # -------------------------------------------------------------------------
 
-    async def create_from_bundle_async(self, bundle: SLOBundle) -> dict[str, SLO]:
+    async def create_from_bundle_async(
+        self, bundle: SLOBundle, max_concurrency: int = DEFAULT_BUNDLE_CONCURRENCY
+    ) -> dict[str, SLO]:
         """Create SLO(s) from an SLOBundle with automatic orchestration (async).
 
         This method handles the full orchestration of creating an SLO bundle:
@@ -118,8 +179,14 @@ class SLOsResource(BaseResource):
         2. Creates SLO (single-dataset or multi-dataset)
         3. Creates burn alerts for the SLO (if configured)
 
+        Inline burn alert recipients are resolved once for the whole bundle,
+        while the derived column and SLO are created. Once the SLO exists, its
+        burn alerts are created concurrently. If any step fails, the first
+        error is raised after all in-flight requests have finished.
+
         Args:
             bundle: SLOBundle from SLOBuilder.build()
+            max_concurrency: Maximum burn alerts created at once (default: 4).
 
         Returns:
             Dictionary mapping dataset slugs to created SLO objects.
@@ -142,65 +209,43 @@ class SLOsResource(BaseResource):
             >>> slos = await client.slos.create_from_bundle_async(bundle)
             >>> api_slo = slos["api-logs"]
         """
-        created_slos: dict[str, SLO] = {}
-
-        # Step 1: Create derived column if needed
-        if bundle.derived_column:
-            if bundle.derived_column_environment_wide:
-                # Create as environment-wide derived column (use "__all__" dataset)
-                await self._client.derived_columns.create_async("__all__", bundle.derived_column)
-            else:
-                # Create in first dataset (single-dataset SLO)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        from ._recipient_utils import process_inline_recipients
+
+        async def resolve_recipients() -> list[list[dict[str, Any]]]:
+            inline = [recipient for alert in bundle.burn_alerts for recipient in alert.recipients]
+            if not inline:
+                return [[] for _ in bundle.burn_alerts]
+            return _split_recipients(bundle, await process_inline_recipients(self._client, inline))
+
+        async def create_slo() -> SLO:
+            if bundle.derived_column:
                 await self._client.derived_columns.create_async(
-                    bundle.datasets[0], bundle.derived_column
+                    _derived_column_dataset(bundle), bundle.derived_column
                 )
+            return await self.create_async(_slo_dataset(bundle), bundle.slo)
 
-        # Step 2: Create SLO
-        is_multi_dataset = bundle.slo.dataset_slugs is not None
-        if is_multi_dataset:
-            # Multi-dataset SLO: create once via __all__ endpoint
-            slo = await self.create_async("__all__", bundle.slo)
-            # Add to dict for each dataset
-            for dataset in bundle.datasets:
-                created_slos[dataset] = slo
-        else:
-            # Single-dataset SLO: create in the specified dataset
-            dataset = bundle.datasets[0]
-            slo = await self.create_async(dataset, bundle.slo)
-            created_slos[dataset] = slo
-
-        # Step 3: Create burn alerts for the SLO
-        # For multi-dataset SLOs, create burn alerts in the first dataset
-        burn_alert_dataset = bundle.datasets[0]
-        for alert_def in bundle.burn_alerts:
-            # Process inline recipients with idempotent handling
-            from ._recipient_utils import process_inline_recipients
-
-            processed_recipients = await process_inline_recipients(
-                self._client, alert_def.recipients.copy()
-            )
+        # Recipients are resolved while the derived column and SLO are created
+        recipients_by_alert, slo = await _gather_all(resolve_recipients(), create_slo())
 
-            # Convert recipients to BurnAlertRecipient format
-            recipients = [BurnAlertRecipient(**recipient) for recipient in processed_recipients]
-
-            # Convert budget rate percent to per-million if needed
-            budget_rate_threshold = None
-            if alert_def.budget_rate_decrease_percent is not None:
-                budget_rate_threshold = int(alert_def.budget_rate_decrease_percent * 10000)
-
-            burn_alert = BurnAlertCreate(
-                alert_type=alert_def.alert_type,
-                slo_id=slo.id,
-                description=alert_def.description,
-                exhaustion_minutes=alert_def.exhaustion_minutes,
-                budget_rate_window_minutes=alert_def.budget_rate_window_minutes,
-                budget_rate_decrease_threshold_per_million=budget_rate_threshold,
-                recipients=recipients if recipients else [],
-            )
+        # Burn alerts only depend on the SLO and the recipients
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_burn_alert(burn_alert: BurnAlertCreate) -> None:
+            async with semaphore:
+                await self._client.burn_alerts.create_async(bundle.datasets[0], burn_alert)
 
-            await self._client.burn_alerts.create_async(burn_alert_dataset, burn_alert)
+        await _gather_all(
+            *(
+                create_burn_alert(_burn_alert_create(alert_def, slo.id, recipients))
+                for alert_def, recipients in zip(
+                    bundle.burn_alerts, recipients_by_alert, strict=True
+                )
+            )
+        )
 
-        return created_slos
+        return dict.fromkeys(bundle.datasets, slo)
 
     # -------------------------------------------------------------------------
     # Sync methods
@@ -281,7 +326,9 @@ class SLOsResource(BaseResource):
     # SLO Bundle creation helpers (sync)
     # -------------------------------------------------------------------------
 
-    def create_from_bundle(self, bundle: SLOBundle) -> dict[str, SLO]:
+    def create_from_bundle(
+        self, bundle: SLOBundle, max_concurrency: int = DEFAULT_BUNDLE_CONCURRENCY
+    ) -> dict[str, SLO]:
         """Create SLO(s) from an SLOBundle with automatic orchestration.
 
         This method handles the full orchestration of creating an SLO bundle:
@@ -289,8 +336,12 @@ class SLOsResource(BaseResource):
         2. Creates SLO (single-dataset or multi-dataset)
         3. Creates burn alerts for the SLO (if configured)
 
+        Runs the same steps as create_from_bundle_async() concurrently on a
+        pool of worker threads.
+
         Args:
             bundle: SLOBundle from SLOBuilder.build()
+            max_concurrency: Maximum burn alerts created at once (default: 4).
 
         Returns:
             Dictionary mapping dataset slugs to created SLO objects.
@@ -318,62 +369,40 @@ class SLOsResource(BaseResource):
                 "Use create_from_bundle_async() for async mode, or pass sync=True to client"
             )
 
-        created_slos: dict[str, SLO] = {}
-
-        # Step 1: Create derived column if needed
-        if bundle.derived_column:
-            if bundle.derived_column_environment_wide:
-                # Create as environment-wide derived column (use "__all__" dataset)
-                self._client.derived_columns.create("__all__", bundle.derived_column)
-            else:
-                # Create in first dataset (single-dataset SLO)
-                self._client.derived_columns.create(bundle.datasets[0], bundle.derived_column)
-
-        # Step 2: Create SLO
-        is_multi_dataset = bundle.slo.dataset_slugs is not None
-        if is_multi_dataset:
-            # Multi-dataset SLO: create once via __all__ endpoint
-            slo = self.create("__all__", bundle.slo)
-            # Add to dict for each dataset
-            for dataset in bundle.datasets:
-                created_slos[dataset] = slo
-        else:
-            # Single-dataset SLO: create in the specified dataset
-            dataset = bundle.datasets[0]
-            slo = self.create(dataset, bundle.slo)
-            created_slos[dataset] = slo
-
-        # Step 3: Create burn alerts for the SLO
-        # For multi-dataset SLOs, create burn alerts in the first dataset
-        burn_alert_dataset = bundle.datasets[0]
-        for alert_def in bundle.burn_alerts:
-            # Process inline recipients with idempotent handling
-            import asyncio
-
-            from ._recipient_utils import process_inline_recipients
-
-            processed_recipients = asyncio.run(
-                process_inline_recipients(self._client, alert_def.recipients.copy())
-            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        from ._recipient_utils import process_inline_recipients_sync
 
-            # Convert recipients to BurnAlertRecipient format
-            recipients = [BurnAlertRecipient(**recipient) for recipient in processed_recipients]
-
-            # Convert budget rate percent to per-million if needed
-            budget_rate_threshold = None
-            if alert_def.budget_rate_decrease_percent is not None:
-                budget_rate_threshold = int(alert_def.budget_rate_decrease_percent * 10000)
-
-            burn_alert = BurnAlertCreate(
-                alert_type=alert_def.alert_type,
-                slo_id=slo.id,
-                description=alert_def.description,
-                exhaustion_minutes=alert_def.exhaustion_minutes,
-                budget_rate_window_minutes=alert_def.budget_rate_window_minutes,
-                budget_rate_decrease_threshold_per_million=budget_rate_threshold,
-                recipients=recipients if recipients else [],
-            )
+        def resolve_recipients() -> list[list[dict[str, Any]]]:
+            inline = [recipient for alert in bundle.burn_alerts for recipient in alert.recipients]
+            if not inline:
+                return [[] for _ in bundle.burn_alerts]
+            return _split_recipients(bundle, process_inline_recipients_sync(self._client, inline))
 
-            self._client.burn_alerts.create(burn_alert_dataset, burn_alert)
+        def create_slo() -> SLO:
+            if bundle.derived_column:
+                self._client.derived_columns.create(
+                    _derived_column_dataset(bundle), bundle.derived_column
+                )
+            return self.create(_slo_dataset(bundle), bundle.slo)
+
+        # Same graph as create_from_bundle_async(), run on worker threads. Leaving
+        # the with block waits for every submitted request, even after an error.
+        with ThreadPoolExecutor(max_workers=max(2, max_concurrency)) as pool:
+            recipients_future = pool.submit(resolve_recipients)
+            slo = pool.submit(create_slo).result()
+            recipients_by_alert = recipients_future.result()
+            futures = [
+                pool.submit(
+                    self._client.burn_alerts.create,
+                    bundle.datasets[0],
+                    _burn_alert_create(alert_def, slo.id, recipients),
+                )
+                for alert_def, recipients in zip(
+                    bundle.burn_alerts, recipients_by_alert, strict=True
+                )
+            ]
+            for future in futures:
+                future.result()
 
-        return created_slos
+        return dict.fromkeys(bundle.datasets, slo)
@@ -0,0 +1,178 @@
+"""Incrementally refreshed rolling-window time-series queries.
+
+Monitoring scripts often rerun a "last hour" query every minute, downloading
+the whole hour each time. A RollingQuery keeps the window's granularity
+buckets between refreshes and only queries the buckets that are new since the
+last refresh (plus a few trailing ones, which may still be receiving late
+events), evicting buckets that fell out of the window. The cost of a refresh
+depends on the time since the previous one, not on the window length.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .models.queries import QueryResult, QuerySpec
+from .models.timeseries import TimeSeries, parse_time
+
+if TYPE_CHECKING:
+    from .client import HoneycombClient
+    from .models.query_builder import QueryBuilder
+
+DEFAULT_WINDOW = 3600
+DEFAULT_GRANULARITY = 60
+
+
+class RollingQuery:
+    """A time-series query over a rolling window, refreshed incrementally.
+
+    Each refresh queries only [previous end - refetch_buckets * granularity, now),
+    aligned to granularity, with absolute start_time / end_time. Only complete
+    buckets are fetched.
+
+    Example:
+        >>> rolling = client.query_results.rolling(
+        ...     QueryBuilder().dataset("api").count().group_by("service"),
+        ...     window=3600,
+        ...     granularity=60,
+        ... )
+        >>> while True:
+        ...     series = await rolling.refresh_async()
+        ...     plot(series)
+        ...     await asyncio.sleep(60)
+
+    Args:
+        client: The HoneycombClient to run queries with.
+        spec: Time-series query (its time range is replaced on every refresh).
+        dataset: Dataset slug. Required for QuerySpec, extracted from QueryBuilder.
+        window: Seconds of history to retain (default: spec.time_range or 1 hour).
+        granularity: Bucket size in seconds (default: spec.granularity or 60).
+        refetch_buckets: Already-fetched trailing buckets to query again on each
+            refresh, for events that arrive late (default: 1).
+        clock: Wall clock (for testing).
+    """
+
+    def __init__(
+        self,
+        client: HoneycombClient,
+        spec: QuerySpec | QueryBuilder,
+        *,
+        dataset: str | None = None,
+        window: int | None = None,
+        granularity: int | None = None,
+        refetch_buckets: int = 1,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        from .resources.query_results import _resolve_dataset
+
+        self._client = client
+        self.dataset = _resolve_dataset(spec, dataset)
+        query_spec = spec if isinstance(spec, QuerySpec) else spec.build()
+        self.granularity = granularity or query_spec.granularity or DEFAULT_GRANULARITY
+        self.window = window or query_spec.time_range or DEFAULT_WINDOW
+        if self.granularity <= 0 or self.window < self.granularity:
+            raise ValueError("granularity must be > 0 and window >= granularity")
+        if refetch_buckets < 0:
+            raise ValueError("refetch_buckets must be >= 0")
+        self.refetch_buckets = refetch_buckets
+        self._spec = query_spec
+        self._clock = clock
+        # Bucket start (Unix seconds) -> series entries for that bucket
+        self._buckets: dict[int, list[dict]] = {}
+        self._end: int | None = None
+        self.refreshes = 0
+        self.last_fetched_buckets = 0
+
+    @property
+    def start(self) -> int | None:
+        """Start of the retained window (None before the first refresh)."""
+        return None if self._end is None else self._end - self.window
+
+    @property
+    def end(self) -> int | None:
+        """End of the retained window (None before the first refresh)."""
+        return self._end
+
+    @property
+    def series(self) -> list[dict]:
+        """Retained series entries in time order, each with "time" in Unix seconds."""
+        return [
+            {"time": bucket, **entry}
+            for bucket in sorted(self._buckets)
+            for entry in self._buckets[bucket]
+        ]
+
+    @property
+    def time_series(self) -> TimeSeries:
+        """Retained series as typed arrays (see TimeSeries)."""
+        return TimeSeries.from_series(self.series)
+
+    def _next_range(self) -> tuple[int, int] | None:
+        """Return the [start, end) to query next, or None if no bucket completed."""
+        end = int(self._clock()) // self.granularity * self.granularity
+        start = end - self.window
+        if self._end is not None:
+            start = max(start, self._end - self.refetch_buckets * self.granularity)
+        if start >= end or (self._end is not None and end <= self._end):
+            return None
+        return start, end
+
+    def _range_spec(self, start: int, end: int) -> QuerySpec:
+        spec = self._spec.model_copy(deep=True)
+        spec.start_time = start
+        spec.end_time = end
+        spec.time_range = None
+        spec.granularity = self.granularity
+        return spec
+
+    def _merge(self, start: int, end: int, result: QueryResult) -> list[dict]:
+        """Replace buckets in [start, end) with the result's series and evict old ones."""
+        fetched: dict[int, list[dict]] = {}
+        for entry in (result.data.series if result.data else None) or []:
+            bucket = parse_time(entry.get("time"))
+            if start <= bucket < end:
+                fetched.setdefault(bucket, []).append(entry.get("data", entry))
+
+        for bucket in [b for b in self._buckets if start <= b < end]:
+            del self._buckets[bucket]
+        self._buckets.update(fetched)
+        self._end = end
+        horizon = end - self.window
+        for bucket in [b for b in self._buckets if b < horizon]:
+            del self._buckets[bucket]
+
+        self.refreshes += 1
+        self.last_fetched_buckets = (end - start) // self.granularity
+        return self.series
+
+    async def refresh_async(self) -> list[dict]:
+        """Fetch the buckets completed since the last refresh (async).
+
+        Returns:
+            The retained series (see the series property).
+        """
+        next_range = self._next_range()
+        if next_range is None:
+            return self.series
+        start, end = next_range
+        _, result = await self._client.query_results.create_and_run_async(
+            self._range_spec(start, end), dataset=self.dataset, disable_series=False
+        )
+        return self._merge(start, end, result)
+
+    def refresh(self) -> list[dict]:
+        """Fetch the buckets completed since the last refresh.
+
+        Returns:
+            The retained series (see the series property).
+        """
+        next_range = self._next_range()
+        if next_range is None:
+            return self.series
+        start, end = next_range
+        _, result = self._client.query_results.create_and_run(
+            self._range_spec(start, end), dataset=self.dataset, disable_series=False
+        )
+        return self._merge(start, end, result)
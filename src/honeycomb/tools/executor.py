@@ -4,7 +4,6 @@ This module executes Claude tool calls against the Honeycomb API,
 converting tool inputs to API operations and returning JSON results.
 """
 
-import json
 from typing import TYPE_CHECKING, Any
 
 from honeycomb.models import (
@@ -260,7 +259,7 @@ async def _execute_get_auth(client: "HoneycombClient", tool_input: dict[str, Any
     """Execute honeycomb_get_auth tool."""
     use_v2 = tool_input.get("use_v2")
     result = await client.auth.get_async(use_v2=use_v2)
-    return json.dumps(result.model_dump(), default=str)
+    return client.json_codec.dumps(result.model_dump())
 
 
 # ==============================================================================
@@ -272,13 +271,13 @@ async def _execute_list_api_keys(client: "HoneycombClient", tool_input: dict[str
     """Execute honeycomb_list_api_keys tool."""
     key_type = tool_input.get("key_type")
     keys = await client.api_keys.list_async(key_type=key_type)
-    return json.dumps([k.model_dump() for k in keys], default=str)
+    return client.json_codec.dumps([k.model_dump() for k in keys])
 
 
 async def _execute_get_api_key(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_get_api_key tool."""
     key = await client.api_keys.get_async(key_id=tool_input["key_id"])
-    return json.dumps(key.model_dump(), default=str)
+    return client.json_codec.dumps(key.model_dump())
 
 
 async def _execute_create_api_key(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -292,7 +291,7 @@ async def _execute_create_api_key(client: "HoneycombClient", tool_input: dict[st
         permissions=tool_input.get("permissions"),
     )
     created = await client.api_keys.create_async(api_key=api_key)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_api_key(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -307,13 +306,13 @@ async def _execute_update_api_key(client: "HoneycombClient", tool_input: dict[st
         key_id=tool_input["key_id"],
         api_key=update,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_api_key(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_delete_api_key tool."""
     await client.api_keys.delete_async(key_id=tool_input["key_id"])
-    return json.dumps({"status": "deleted", "key_id": tool_input["key_id"]})
+    return client.json_codec.dumps({"status": "deleted", "key_id": tool_input["key_id"]})
 
 
 # ==============================================================================
@@ -324,7 +323,7 @@ async def _execute_delete_api_key(client: "HoneycombClient", tool_input: dict[st
 async def _execute_list_environments(client: "HoneycombClient", _tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_list_environments tool."""
     envs = await client.environments.list_async()
-    return json.dumps([e.model_dump() for e in envs], default=str)
+    return client.json_codec.dumps([e.model_dump() for e in envs])
 
 
 async def _execute_get_environment(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -362,7 +361,7 @@ async def _execute_get_environment(client: "HoneycombClient", tool_input: dict[s
                     datasets = await api_key_client.datasets.list_async()
                     result["datasets"] = [d.model_dump() for d in datasets]
 
-    return json.dumps(result, default=str)
+    return client.json_codec.dumps(result)
 
 
 async def _execute_create_environment(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -375,7 +374,7 @@ async def _execute_create_environment(client: "HoneycombClient", tool_input: dic
         color=EnvironmentColor(tool_input["color"]) if tool_input.get("color") else None,
     )
     created = await client.environments.create_async(environment=environment)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_environment(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -391,13 +390,13 @@ async def _execute_update_environment(client: "HoneycombClient", tool_input: dic
         env_id=tool_input["env_id"],
         environment=environment,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_environment(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_delete_environment tool."""
     await client.environments.delete_async(env_id=tool_input["env_id"])
-    return json.dumps({"status": "deleted", "env_id": tool_input["env_id"]})
+    return client.json_codec.dumps({"status": "deleted", "env_id": tool_input["env_id"]})
 
 
 # ==============================================================================
@@ -408,7 +407,7 @@ async def _execute_delete_environment(client: "HoneycombClient", tool_input: dic
 async def _execute_list_triggers(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_list_triggers."""
     triggers = await client.triggers.list_async(dataset=tool_input["dataset"])
-    return json.dumps([t.model_dump() for t in triggers], default=str)
+    return client.json_codec.dumps([t.model_dump() for t in triggers])
 
 
 async def _execute_get_trigger(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -417,7 +416,7 @@ async def _execute_get_trigger(client: "HoneycombClient", tool_input: dict[str,
         dataset=tool_input["dataset"],
         trigger_id=tool_input["trigger_id"],
     )
-    return json.dumps(trigger.model_dump(), default=str)
+    return client.json_codec.dumps(trigger.model_dump())
 
 
 async def _execute_create_trigger(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -434,7 +433,7 @@ async def _execute_create_trigger(client: "HoneycombClient", tool_input: dict[st
 
     # Create via bundle (handles recipient orchestration)
     created = await client.triggers.create_from_bundle_async(bundle)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_trigger(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -451,7 +450,7 @@ async def _execute_update_trigger(client: "HoneycombClient", tool_input: dict[st
         trigger_id=trigger_id,
         trigger=bundle.trigger,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_trigger(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -460,7 +459,7 @@ async def _execute_delete_trigger(client: "HoneycombClient", tool_input: dict[st
         dataset=tool_input["dataset"],
         trigger_id=tool_input["trigger_id"],
     )
-    return json.dumps({"success": True, "message": "Trigger deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Trigger deleted"})
 
 
 # ==============================================================================
@@ -471,7 +470,7 @@ async def _execute_delete_trigger(client: "HoneycombClient", tool_input: dict[st
 async def _execute_list_slos(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_list_slos."""
     slos = await client.slos.list_async(dataset=tool_input["dataset"])
-    return json.dumps([s.model_dump() for s in slos], default=str)
+    return client.json_codec.dumps([s.model_dump() for s in slos])
 
 
 async def _execute_get_slo(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -480,7 +479,7 @@ async def _execute_get_slo(client: "HoneycombClient", tool_input: dict[str, Any]
         dataset=tool_input["dataset"],
         slo_id=tool_input["slo_id"],
     )
-    return json.dumps(slo.model_dump(), default=str)
+    return client.json_codec.dumps(slo.model_dump())
 
 
 async def _execute_create_slo(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -498,7 +497,7 @@ async def _execute_create_slo(client: "HoneycombClient", tool_input: dict[str, A
 
     # Return the main SLO (first one created)
     main_slo = list(created_slos.values())[0]
-    return json.dumps(main_slo.model_dump(), default=str)
+    return client.json_codec.dumps(main_slo.model_dump())
 
 
 async def _execute_update_slo(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -512,7 +511,7 @@ async def _execute_update_slo(client: "HoneycombClient", tool_input: dict[str, A
         slo_id=slo_id,
         slo=slo,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_slo(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -521,7 +520,7 @@ async def _execute_delete_slo(client: "HoneycombClient", tool_input: dict[str, A
         dataset=tool_input["dataset"],
         slo_id=tool_input["slo_id"],
     )
-    return json.dumps({"success": True, "message": "SLO deleted"})
+    return client.json_codec.dumps({"success": True, "message": "SLO deleted"})
 
 
 # ==============================================================================
@@ -535,7 +534,7 @@ async def _execute_list_burn_alerts(client: "HoneycombClient", tool_input: dict[
         dataset=tool_input["dataset"],
         slo_id=tool_input["slo_id"],
     )
-    return json.dumps([ba.model_dump() for ba in burn_alerts], default=str)
+    return client.json_codec.dumps([ba.model_dump() for ba in burn_alerts])
 
 
 async def _execute_get_burn_alert(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -544,7 +543,7 @@ async def _execute_get_burn_alert(client: "HoneycombClient", tool_input: dict[st
         dataset=tool_input["dataset"],
         burn_alert_id=tool_input["burn_alert_id"],
     )
-    return json.dumps(burn_alert.model_dump(), default=str)
+    return client.json_codec.dumps(burn_alert.model_dump())
 
 
 async def _execute_create_burn_alert(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -560,7 +559,7 @@ async def _execute_create_burn_alert(client: "HoneycombClient", tool_input: dict
 
     burn_alert = BurnAlertCreate(**tool_input, recipients=recipients)
     created = await client.burn_alerts.create_async(dataset=dataset, burn_alert=burn_alert)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_burn_alert(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -581,7 +580,7 @@ async def _execute_update_burn_alert(client: "HoneycombClient", tool_input: dict
         burn_alert_id=burn_alert_id,
         burn_alert=burn_alert,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_burn_alert(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -590,7 +589,7 @@ async def _execute_delete_burn_alert(client: "HoneycombClient", tool_input: dict
         dataset=tool_input["dataset"],
         burn_alert_id=tool_input["burn_alert_id"],
     )
-    return json.dumps({"success": True, "message": "Burn alert deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Burn alert deleted"})
 
 
 # ==============================================================================
@@ -604,20 +603,20 @@ async def _execute_list_datasets(
 ) -> str:
     """Execute honeycomb_list_datasets."""
     datasets = await client.datasets.list_async()
-    return json.dumps([d.model_dump() for d in datasets], default=str)
+    return client.json_codec.dumps([d.model_dump() for d in datasets])
 
 
 async def _execute_get_dataset(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_get_dataset."""
     dataset = await client.datasets.get_async(slug=tool_input["slug"])
-    return json.dumps(dataset.model_dump(), default=str)
+    return client.json_codec.dumps(dataset.model_dump())
 
 
 async def _execute_create_dataset(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_create_dataset."""
     dataset = DatasetCreate(**tool_input)
     created = await client.datasets.create_async(dataset=dataset)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_dataset(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -625,13 +624,13 @@ async def _execute_update_dataset(client: "HoneycombClient", tool_input: dict[st
     slug = tool_input.pop("slug")
     dataset = DatasetUpdate(**tool_input)
     updated = await client.datasets.update_async(slug=slug, dataset=dataset)
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_dataset(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_delete_dataset."""
     await client.datasets.delete_async(slug=tool_input["slug"])
-    return json.dumps({"success": True, "message": "Dataset deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Dataset deleted"})
 
 
 # ==============================================================================
@@ -642,7 +641,7 @@ async def _execute_delete_dataset(client: "HoneycombClient", tool_input: dict[st
 async def _execute_list_columns(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_list_columns."""
     columns = await client.columns.list_async(dataset=tool_input["dataset"])
-    return json.dumps([c.model_dump() for c in columns], default=str)
+    return client.json_codec.dumps([c.model_dump() for c in columns])
 
 
 async def _execute_get_column(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -651,7 +650,7 @@ async def _execute_get_column(client: "HoneycombClient", tool_input: dict[str, A
         dataset=tool_input["dataset"],
         column_id=tool_input["column_id"],
     )
-    return json.dumps(column.model_dump(), default=str)
+    return client.json_codec.dumps(column.model_dump())
 
 
 async def _execute_create_column(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -659,7 +658,7 @@ async def _execute_create_column(client: "HoneycombClient", tool_input: dict[str
     dataset = tool_input.pop("dataset")
     column = ColumnCreate(**tool_input)
     created = await client.columns.create_async(dataset=dataset, column=column)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_column(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -672,7 +671,7 @@ async def _execute_update_column(client: "HoneycombClient", tool_input: dict[str
         column_id=column_id,
         column=column,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_column(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -681,7 +680,7 @@ async def _execute_delete_column(client: "HoneycombClient", tool_input: dict[str
         dataset=tool_input["dataset"],
         column_id=tool_input["column_id"],
     )
-    return json.dumps({"success": True, "message": "Column deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Column deleted"})
 
 
 # ==============================================================================
@@ -695,20 +694,20 @@ async def _execute_list_recipients(
 ) -> str:
     """Execute honeycomb_list_recipients."""
     recipients = await client.recipients.list_async()
-    return json.dumps([r.model_dump() for r in recipients], default=str)
+    return client.json_codec.dumps([r.model_dump() for r in recipients])
 
 
 async def _execute_get_recipient(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_get_recipient."""
     recipient = await client.recipients.get_async(recipient_id=tool_input["recipient_id"])
-    return json.dumps(recipient.model_dump(), default=str)
+    return client.json_codec.dumps(recipient.model_dump())
 
 
 async def _execute_create_recipient(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_create_recipient."""
     recipient = RecipientCreate(**tool_input)
     created = await client.recipients.create_async(recipient=recipient)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_recipient(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -716,13 +715,13 @@ async def _execute_update_recipient(client: "HoneycombClient", tool_input: dict[
     recipient_id = tool_input.pop("recipient_id")
     recipient = RecipientCreate(**tool_input)
     updated = await client.recipients.update_async(recipient_id=recipient_id, recipient=recipient)
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_recipient(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_delete_recipient."""
     await client.recipients.delete_async(recipient_id=tool_input["recipient_id"])
-    return json.dumps({"success": True, "message": "Recipient deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Recipient deleted"})
 
 
 async def _execute_get_recipient_triggers(
@@ -730,7 +729,7 @@ async def _execute_get_recipient_triggers(
 ) -> str:
     """Execute honeycomb_get_recipient_triggers."""
     triggers = await client.recipients.get_triggers_async(recipient_id=tool_input["recipient_id"])
-    return json.dumps(triggers, default=str)
+    return client.json_codec.dumps(triggers)
 
 
 # ==============================================================================
@@ -743,7 +742,7 @@ async def _execute_list_derived_columns(
 ) -> str:
     """Execute honeycomb_list_derived_columns."""
     derived_columns = await client.derived_columns.list_async(dataset=tool_input["dataset"])
-    return json.dumps([dc.model_dump() for dc in derived_columns], default=str)
+    return client.json_codec.dumps([dc.model_dump() for dc in derived_columns])
 
 
 async def _execute_get_derived_column(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -752,7 +751,7 @@ async def _execute_get_derived_column(client: "HoneycombClient", tool_input: dic
         dataset=tool_input["dataset"],
         column_id=tool_input["derived_column_id"],
     )
-    return json.dumps(derived_column.model_dump(), default=str)
+    return client.json_codec.dumps(derived_column.model_dump())
 
 
 async def _execute_create_derived_column(
@@ -764,7 +763,7 @@ async def _execute_create_derived_column(
     created = await client.derived_columns.create_async(
         dataset=dataset, derived_column=derived_column
     )
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_derived_column(
@@ -779,7 +778,7 @@ async def _execute_update_derived_column(
         column_id=column_id,
         derived_column=derived_column,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_derived_column(
@@ -790,7 +789,7 @@ async def _execute_delete_derived_column(
         dataset=tool_input["dataset"],
         column_id=tool_input["derived_column_id"],
     )
-    return json.dumps({"success": True, "message": "Derived column deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Derived column deleted"})
 
 
 # ==============================================================================
@@ -810,7 +809,7 @@ async def _execute_create_query(client: "HoneycombClient", tool_input: dict[str,
     query_spec = QuerySpec(**tool_input)
     query = await client.queries.create_async(spec=query_spec, dataset=dataset)
 
-    return json.dumps(query.model_dump(), default=str)
+    return client.json_codec.dumps(query.model_dump())
 
 
 async def _execute_get_query(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -819,7 +818,7 @@ async def _execute_get_query(client: "HoneycombClient", tool_input: dict[str, An
         dataset=tool_input["dataset"],
         query_id=tool_input["query_id"],
     )
-    return json.dumps(query.model_dump(), default=str)
+    return client.json_codec.dumps(query.model_dump())
 
 
 async def _execute_run_query(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -837,7 +836,7 @@ async def _execute_run_query(client: "HoneycombClient", tool_input: dict[str, An
         dataset=dataset,
     )
 
-    return json.dumps(result.model_dump(), default=str)
+    return client.json_codec.dumps(result.model_dump())
 
 
 # ==============================================================================
@@ -851,13 +850,13 @@ async def _execute_list_boards(
 ) -> str:
     """Execute honeycomb_list_boards."""
     boards = await client.boards.list_async()
-    return json.dumps([b.model_dump() for b in boards], default=str)
+    return client.json_codec.dumps([b.model_dump() for b in boards])
 
 
 async def _execute_get_board(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_get_board."""
     board = await client.boards.get_async(board_id=tool_input["board_id"])
-    return json.dumps(board.model_dump(), default=str)
+    return client.json_codec.dumps(board.model_dump())
 
 
 async def _execute_create_board(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -872,7 +871,7 @@ async def _execute_create_board(client: "HoneycombClient", tool_input: dict[str,
     # Create board with orchestration (creates inline queries, assembles panels)
     board = await client.boards.create_from_bundle_async(bundle)
 
-    return json.dumps(board.model_dump(), default=str)
+    return client.json_codec.dumps(board.model_dump())
 
 
 async def _execute_update_board(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -885,13 +884,13 @@ async def _execute_update_board(client: "HoneycombClient", tool_input: dict[str,
     board = BoardCreate(**tool_input)
     updated = await client.boards.update_async(board_id=board_id, board=board)
 
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_board(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_delete_board."""
     await client.boards.delete_async(board_id=tool_input["board_id"])
-    return json.dumps({"success": True, "message": "Board deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Board deleted"})
 
 
 # ==============================================================================
@@ -902,7 +901,7 @@ async def _execute_delete_board(client: "HoneycombClient", tool_input: dict[str,
 async def _execute_list_markers(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
     """Execute honeycomb_list_markers."""
     markers = await client.markers.list_async(dataset=tool_input["dataset"])
-    return json.dumps([m.model_dump() for m in markers], default=str)
+    return client.json_codec.dumps([m.model_dump() for m in markers])
 
 
 async def _execute_create_marker(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -912,7 +911,7 @@ async def _execute_create_marker(client: "HoneycombClient", tool_input: dict[str
 
     marker = MarkerCreate(**tool_input)
     created = await client.markers.create_async(dataset=dataset, marker=marker)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_marker(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -922,7 +921,7 @@ async def _execute_update_marker(client: "HoneycombClient", tool_input: dict[str
 
     marker = MarkerCreate(**tool_input)
     updated = await client.markers.update_async(dataset=dataset, marker_id=marker_id, marker=marker)
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_marker(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -930,7 +929,7 @@ async def _execute_delete_marker(client: "HoneycombClient", tool_input: dict[str
     await client.markers.delete_async(
         dataset=tool_input["dataset"], marker_id=tool_input["marker_id"]
     )
-    return json.dumps({"success": True, "message": "Marker deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Marker deleted"})
 
 
 # ==============================================================================
@@ -943,7 +942,7 @@ async def _execute_list_marker_settings(
 ) -> str:
     """Execute honeycomb_list_marker_settings."""
     settings = await client.markers.list_settings_async(dataset=tool_input["dataset"])
-    return json.dumps([s.model_dump() for s in settings], default=str)
+    return client.json_codec.dumps([s.model_dump() for s in settings])
 
 
 async def _execute_get_marker_setting(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -952,7 +951,7 @@ async def _execute_get_marker_setting(client: "HoneycombClient", tool_input: dic
         dataset=tool_input["dataset"],
         setting_id=tool_input["setting_id"],
     )
-    return json.dumps(setting.model_dump(), default=str)
+    return client.json_codec.dumps(setting.model_dump())
 
 
 async def _execute_create_marker_setting(
@@ -962,7 +961,7 @@ async def _execute_create_marker_setting(
     dataset = tool_input.pop("dataset")
     setting = MarkerSettingCreate(**tool_input)
     created = await client.markers.create_setting_async(dataset=dataset, setting=setting)
-    return json.dumps(created.model_dump(), default=str)
+    return client.json_codec.dumps(created.model_dump())
 
 
 async def _execute_update_marker_setting(
@@ -977,7 +976,7 @@ async def _execute_update_marker_setting(
         setting_id=setting_id,
         setting=setting,
     )
-    return json.dumps(updated.model_dump(), default=str)
+    return client.json_codec.dumps(updated.model_dump())
 
 
 async def _execute_delete_marker_setting(
@@ -988,7 +987,7 @@ async def _execute_delete_marker_setting(
         dataset=tool_input["dataset"],
         setting_id=tool_input["setting_id"],
     )
-    return json.dumps({"success": True, "message": "Marker setting deleted"})
+    return client.json_codec.dumps({"success": True, "message": "Marker setting deleted"})
 
 
 # ==============================================================================
@@ -1006,7 +1005,7 @@ async def _execute_send_event(client: "HoneycombClient", tool_input: dict[str, A
     await client.events.send_async(
         dataset=dataset, data=data, timestamp=timestamp, samplerate=samplerate
     )
-    return json.dumps({"success": True, "message": "Event sent"})
+    return client.json_codec.dumps({"success": True, "message": "Event sent"})
 
 
 async def _execute_send_batch_events(client: "HoneycombClient", tool_input: dict[str, Any]) -> str:
@@ -1018,7 +1017,7 @@ async def _execute_send_batch_events(client: "HoneycombClient", tool_input: dict
     events = [BatchEvent(**event) for event in events_data]
 
     results = await client.events.send_batch_async(dataset=dataset, events=events)
-    return json.dumps([r.model_dump() for r in results], default=str)
+    return client.json_codec.dumps([r.model_dump() for r in results])
 
 
 # ==============================================================================
@@ -1042,9 +1041,9 @@ async def _execute_query_service_map(client: "HoneycombClient", tool_input: dict
 
     # Return just the dependencies list
     if result.dependencies:
-        return json.dumps([d.model_dump() for d in result.dependencies], default=str)
+        return client.json_codec.dumps([d.model_dump() for d in result.dependencies])
     else:
-        return json.dumps([], default=str)
+        return client.json_codec.dumps([])
 
 
 # ==============================================================================
@@ -1065,7 +1064,7 @@ async def _execute_search_columns(client: "HoneycombClient", tool_input: dict[st
         limit=min(tool_input.get("limit", 50), 1000),
         offset=tool_input.get("offset", 0),
     )
-    return json.dumps(asdict(result), default=str)
+    return client.json_codec.dumps(asdict(result))
 
 
 async def _execute_get_environment_summary(
@@ -1081,7 +1080,7 @@ async def _execute_get_environment_summary(
         include_sample_columns=tool_input.get("include_sample_columns", True),
         sample_column_count=tool_input.get("sample_column_count", 10),
     )
-    return json.dumps(asdict(result), default=str)
+    return client.json_codec.dumps(asdict(result))
 
 
 __all__ = [
@@ -0,0 +1,395 @@
+"""Background batching transmission for event ingestion.
+
+Modeled on libhoney's transmission: events are queued in memory, grouped
+per dataset, and flushed as ``/1/batch`` requests by a pool of sender
+workers sharing the client's HTTP connection pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .models.events import BatchEvent, BatchEventResult
+from .resources.events import MAX_BATCH_BYTES, _encode_event
+
+if TYPE_CHECKING:
+    from .resources.events import EventsResource
+
+
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_MAX_BATCH_BYTES = MAX_BATCH_BYTES
+DEFAULT_SEND_FREQUENCY = 0.1
+DEFAULT_MAX_CONCURRENT_BATCHES = 10
+DEFAULT_PENDING_WORK_CAPACITY = 10_000
+DEFAULT_RESPONSE_CAPACITY = 10_000
+
+
+class TransmissionOverflowError(Exception):
+    """Raised (via a response) when an event is dropped because the queue is full."""
+
+
+@dataclass
+class TransmissionResponse:
+    """Outcome of sending a single event through a Transmission.
+
+    Attributes:
+        dataset: Dataset slug the event was sent to.
+        event: The event that was sent.
+        result: Per-event result returned by the batch endpoint (None on error).
+        error: Exception raised while sending (None on success).
+        duration: Seconds spent on the batch request that carried this event.
+        metadata: Caller-supplied metadata passed through from add().
+    """
+
+    dataset: str
+    event: BatchEvent
+    result: BatchEventResult | None = None
+    error: Exception | None = None
+    duration: float = 0.0
+    metadata: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the event was accepted by Honeycomb."""
+        return self.error is None and self.result is not None and 200 <= self.result.status < 300
+
+
+@dataclass
+class _PendingEvent:
+    dataset: str
+    event: BatchEvent
+    metadata: Any
+    size: int
+
+
+@dataclass
+class _PendingBatch:
+    dataset: str
+    created_at: float
+    events: list[_PendingEvent]
+    size: int = 0
+
+
+class _Flush:
+    """Queue marker asking the dispatcher to flush every pending batch."""
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+
+
+_STOP = object()
+
+
+class Transmission:
+    """Background batching sender for events.
+
+    Events added with add() or add_async() are buffered in a bounded queue,
+    accumulated per dataset, and sent as a batch once any of the thresholds
+    is hit: ``max_batch_size`` events, ``max_batch_bytes`` of serialized
+    JSON, or ``send_frequency`` seconds since the batch was started.
+    Up to ``max_concurrent_batches`` batch requests are in flight at once.
+
+    Every event produces exactly one TransmissionResponse on the
+    ``responses`` queue. When nobody drains it and ``block_on_response`` is
+    False, responses beyond ``response_capacity`` are discarded.
+
+    Example:
+        >>> async with HoneycombClient(api_key="...") as client:
+        ...     async with client.events.transmission(max_batch_size=100) as tx:
+        ...         for i in range(10_000):
+        ...             tx.add("my-dataset", {"i": i})
+        ...     while not tx.responses.empty():
+        ...         response = tx.responses.get_nowait()
+        ...         if not response.ok:
+        ...             print(response.error or response.result)
+
+    Args:
+        events: The EventsResource used to send batches.
+        max_batch_size: Maximum events per batch request.
+        max_batch_bytes: Maximum serialized JSON bytes per batch request.
+        send_frequency: Maximum seconds an event waits before its batch is sent.
+        max_concurrent_batches: Number of sender workers.
+        pending_work_capacity: Maximum events buffered before add() drops.
+        block_on_send: If True, add_async() waits for queue space instead of dropping.
+        block_on_response: If True, senders wait for room on the responses queue.
+        response_capacity: Maximum undrained responses kept.
+    """
+
+    def __init__(
+        self,
+        events: EventsResource,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        send_frequency: float = DEFAULT_SEND_FREQUENCY,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+        pending_work_capacity: int = DEFAULT_PENDING_WORK_CAPACITY,
+        block_on_send: bool = False,
+        block_on_response: bool = False,
+        response_capacity: int = DEFAULT_RESPONSE_CAPACITY,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be at least 1")
+
+        self._events = events
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._send_frequency = send_frequency
+        self._max_concurrent_batches = max_concurrent_batches
+        self._pending_work_capacity = pending_work_capacity
+        self._block_on_send = block_on_send
+        self._block_on_response = block_on_response
+
+        self._responses: asyncio.Queue[TransmissionResponse] = asyncio.Queue(
+            maxsize=response_capacity
+        )
+
+        # Created on start() so they bind to the running event loop
+        self._queue: asyncio.Queue[Any] | None = None
+        self._batches: asyncio.Queue[list[_PendingEvent] | None] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._closed = False
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    @property
+    def responses(self) -> asyncio.Queue[TransmissionResponse]:
+        """Queue of per-event TransmissionResponse objects."""
+        return self._responses
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if the background workers have been started."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the dispatcher and sender workers.
+
+        Called automatically by the first add(). Must be called from within
+        a running event loop.
+        """
+        if self._closed:
+            raise RuntimeError("Transmission is closed")
+        if self._tasks:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._pending_work_capacity)
+        self._batches = asyncio.Queue(maxsize=self._max_concurrent_batches)
+        self._tasks.append(asyncio.create_task(self._dispatch()))
+        for _ in range(self._max_concurrent_batches):
+            self._tasks.append(asyncio.create_task(self._send_loop()))
+
+    async def flush(self) -> None:
+        """Send everything added so far and wait for the requests to finish."""
+        if not self._tasks:
+            return
+        assert self._queue is not None and self._batches is not None
+
+        marker = _Flush()
+        await self._queue.put(marker)
+        await marker.done.wait()
+        await self._batches.join()
+
+    async def close(self) -> None:
+        """Flush pending events and stop the background workers."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._tasks:
+            return
+        assert self._queue is not None and self._batches is not None
+
+        await self._queue.put(_STOP)
+        await self._tasks[0]
+        for _ in range(self._max_concurrent_batches):
+            await self._batches.put(None)
+        await asyncio.gather(*self._tasks[1:])
+        self._tasks = []
+
+    async def __aenter__(self) -> Transmission:
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    # -------------------------------------------------------------------------
+    # Enqueueing
+    # -------------------------------------------------------------------------
+
+    def add(
+        self,
+        dataset: str,
+        event: BatchEvent | dict[str, Any],
+        *,
+        metadata: Any = None,
+    ) -> bool:
+        """Queue an event without waiting.
+
+        Args:
+            dataset: Dataset slug.
+            event: A BatchEvent, or a plain dict used as the event's data.
+            metadata: Arbitrary value echoed back on the event's response.
+
+        Returns:
+            True if queued, False if dropped because the queue is full.
+            Dropped events still produce an error response.
+        """
+        item = self._prepare(dataset, event, metadata)
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._respond_nowait(
+                TransmissionResponse(
+                    dataset=dataset,
+                    event=item.event,
+                    error=TransmissionOverflowError("event dropped: queue overflow"),
+                    metadata=metadata,
+                )
+            )
+            return False
+        return True
+
+    async def add_async(
+        self,
+        dataset: str,
+        event: BatchEvent | dict[str, Any],
+        *,
+        metadata: Any = None,
+    ) -> bool:
+        """Queue an event, waiting for space if ``block_on_send`` is set.
+
+        Returns:
+            True if queued, False if dropped because the queue is full.
+        """
+        if not self._block_on_send:
+            return self.add(dataset, event, metadata=metadata)
+        item = self._prepare(dataset, event, metadata)
+        assert self._queue is not None
+        await self._queue.put(item)
+        return True
+
+    def _prepare(
+        self, dataset: str, event: BatchEvent | dict[str, Any], metadata: Any
+    ) -> _PendingEvent:
+        if self._closed:
+            raise RuntimeError("Transmission is closed")
+        self.start()
+        if not isinstance(event, BatchEvent):
+            event = BatchEvent(data=event)
+        size = len(_encode_event(event, self._events._client.json_codec))
+        return _PendingEvent(dataset=dataset, event=event, metadata=metadata, size=size)
+
+    # -------------------------------------------------------------------------
+    # Background workers
+    # -------------------------------------------------------------------------
+
+    async def _dispatch(self) -> None:
+        """Accumulate queued events into per-dataset batches."""
+        assert self._queue is not None and self._batches is not None
+        loop = asyncio.get_running_loop()
+        pending: dict[str, _PendingBatch] = {}
+
+        while True:
+            timeout = None
+            if pending:
+                oldest = min(batch.created_at for batch in pending.values())
+                timeout = max(oldest + self._send_frequency - loop.time(), 0.0)
+
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                now = loop.time()
+                for dataset in [
+                    d for d, b in pending.items() if now - b.created_at >= self._send_frequency
+                ]:
+                    await self._batches.put(pending.pop(dataset).events)
+                continue
+
+            if item is _STOP or isinstance(item, _Flush):
+                for pending_batch in pending.values():
+                    await self._batches.put(pending_batch.events)
+                pending.clear()
+                if isinstance(item, _Flush):
+                    item.done.set()
+                    continue
+                return
+
+            batch: _PendingBatch | None = pending.get(item.dataset)
+            if batch is not None and batch.size + item.size + 2 > self._max_batch_bytes:
+                await self._batches.put(pending.pop(item.dataset).events)
+                batch = None
+            if batch is None:
+                batch = pending[item.dataset] = _PendingBatch(
+                    dataset=item.dataset, created_at=loop.time(), events=[]
+                )
+            batch.events.append(item)
+            batch.size += item.size + 1
+
+            if len(batch.events) >= self._max_batch_size:
+                await self._batches.put(pending.pop(item.dataset).events)
+
+    async def _send_loop(self) -> None:
+        """Send batches handed over by the dispatcher."""
+        assert self._batches is not None
+        while True:
+            batch = await self._batches.get()
+            try:
+                if batch is None:
+                    return
+                await self._send(batch)
+            finally:
+                self._batches.task_done()
+
+    async def _send(self, batch: list[_PendingEvent]) -> None:
+        dataset = batch[0].dataset
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            results = await self._events.send_batch_async(dataset, [p.event for p in batch])
+        except Exception as e:
+            duration = loop.time() - start
+            for pending in batch:
+                await self._respond(
+                    TransmissionResponse(
+                        dataset=dataset,
+                        event=pending.event,
+                        error=e,
+                        duration=duration,
+                        metadata=pending.metadata,
+                    )
+                )
+            return
+
+        duration = loop.time() - start
+        for i, pending in enumerate(batch):
+            response = TransmissionResponse(
+                dataset=dataset,
+                event=pending.event,
+                duration=duration,
+                metadata=pending.metadata,
+            )
+            if i < len(results):
+                response.result = results[i]
+            else:
+                response.error = ValueError("batch response missing result for event")
+            await self._respond(response)
+
+    async def _respond(self, response: TransmissionResponse) -> None:
+        if self._block_on_response:
+            await self._responses.put(response)
+        else:
+            self._respond_nowait(response)
+
+    def _respond_nowait(self, response: TransmissionResponse) -> None:
+        # Match libhoney: responses nobody is reading are discarded
+        with suppress(asyncio.QueueFull):
+            self._responses.put_nowait(response)
@@ -0,0 +1,620 @@
+"""Tests for the declarative apply engine."""
+
+import asyncio
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from honeycomb import (
+    ApplyAction,
+    BoardBuilder,
+    BurnAlertBuilder,
+    BurnAlertType,
+    DesiredState,
+    HoneycombClient,
+    QueryBuilder,
+    SLOBuilder,
+    TriggerBuilder,
+)
+from honeycomb.apply import BOARD_HASH_TAG, BOARD_OWNER_TAG, _board_fingerprint, content_hash
+
+
+class _Api:
+    """In-memory triggers, SLOs, burn alerts, derived columns and boards API that records writes."""
+
+    def __init__(self, respx_mock, fail=()):
+        self.objects = {
+            "triggers": {},
+            "slos": {},
+            "burn_alerts": {},
+            "derived_columns": {},
+            "boards": {},
+        }
+        self.writes = []
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_at_delete = []
+        self._ids = 0
+        base = "https://api.honeycomb.io/1"
+        for kind in ("triggers", "slos", "burn_alerts", "derived_columns"):
+            respx_mock.get(url__regex=rf"{base}/{kind}/[^/]+$").mock(side_effect=self._list)
+            respx_mock.post(url__regex=rf"{base}/{kind}/[^/]+$").mock(side_effect=self._create)
+            respx_mock.put(url__regex=rf"{base}/{kind}/[^/]+/[^/]+$").mock(side_effect=self._update)
+            respx_mock.delete(url__regex=rf"{base}/{kind}/[^/]+/[^/]+$").mock(
+                side_effect=self._delete
+            )
+        respx_mock.get(f"{base}/boards").mock(side_effect=self._list)
+        respx_mock.post(f"{base}/boards").mock(side_effect=self._create)
+        respx_mock.put(url__regex=rf"{base}/boards/[^/]+$").mock(side_effect=self._update)
+        respx_mock.delete(url__regex=rf"{base}/boards/[^/]+$").mock(side_effect=self._delete)
+        respx_mock.post(url__regex=rf"{base}/(queries|query_annotations)/[^/]+$").mock(
+            side_effect=self._create_query
+        )
+        respx_mock.get(f"{base}/recipients").mock(return_value=Response(200, json=[]))
+
+    def seed(self, kind, body, dataset=None):
+        """Add an existing object, returning its ID."""
+        self._ids += 1
+        obj_id = f"{kind}-{self._ids}"
+        self.objects[kind][obj_id] = (dataset, self._stored(kind, obj_id, dataset, body))
+        return obj_id
+
+    @staticmethod
+    def _stored(kind, obj_id, dataset, body):
+        """The object as the API returns it."""
+        if kind == "triggers":
+            return {"id": obj_id, "dataset_slug": dataset, "triggered": False, **body}
+        return {"id": obj_id, **body}
+
+    def _parts(self, request):
+        parts = request.url.path.split("/")[2:]
+        return parts[0], parts[1:]
+
+    async def _write(self, request):
+        kind, rest = self._parts(request)
+        self.writes.append((request.method, kind, rest))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        body = json.loads(request.content) if request.content else {}
+        if body.get("name") in self.fail:
+            return Response(400, json={"error": f"bad {kind}"})
+        return None
+
+    def _list(self, request):
+        kind, rest = self._parts(request)
+        dataset = rest[0] if rest else None
+        found = [body for ds, body in self.objects[kind].values() if ds == dataset]
+        if kind == "burn_alerts":
+            slo_id = request.url.params["slo_id"]
+            found = [body for body in found if body["slo"]["id"] == slo_id]
+        if kind == "derived_columns" and "alias" in request.url.params:
+            # Looking up one alias returns the column itself, or 404
+            alias = request.url.params["alias"]
+            matches = [body for body in found if body["alias"] == alias]
+            if not matches:
+                return Response(404, json={"error": "derived column not found"})
+            return Response(200, json=matches[0])
+        return Response(200, json=found)
+
+    async def _create(self, request):
+        error = await self._write(request)
+        if error:
+            return error
+        kind, rest = self._parts(request)
+        obj_id = self.seed(kind, json.loads(request.content), rest[0] if rest else None)
+        return Response(201, json=self.objects[kind][obj_id][1])
+
+    async def _create_query(self, request):
+        await self._write(request)
+        return Response(200, json={"id": "q-1", **json.loads(request.content)})
+
+    async def _update(self, request):
+        error = await self._write(request)
+        if error:
+            return error
+        kind, rest = self._parts(request)
+        dataset = rest[0] if len(rest) == 2 else None
+        body = json.loads(request.content)
+        self.objects[kind][rest[-1]] = (dataset, self._stored(kind, rest[-1], dataset, body))
+        return Response(200, json=self.objects[kind][rest[-1]][1])
+
+    async def _delete(self, request):
+        self.in_flight_at_delete.append(self.in_flight)
+        await self._write(request)
+        kind, rest = self._parts(request)
+        del self.objects[kind][rest[-1]]
+        return Response(204)
+
+
+# Objects as the API returns them, with server-side and null fields
+RECIPIENT_RESPONSE = {
+    "id": "r-email",
+    "type": "email",
+    "details": {"email_address": "oncall@example.com"},
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+TRIGGER_RESPONSE = {
+    "id": "t-1",
+    "dataset_slug": "api",
+    "name": "High Errors",
+    "description": "",
+    "threshold": {"op": ">", "value": 100, "exceeded_limit": 1},
+    "frequency": 900,
+    "alert_type": "on_change",
+    "disabled": False,
+    "triggered": True,
+    "evaluation_schedule_type": "frequency",
+    "query_id": "q-saved",
+    "query": {
+        "time_range": 1800,
+        "granularity": 0,
+        "calculations": [{"op": "COUNT"}],
+        "filters": [],
+        "breakdowns": [],
+        "filter_combination": "AND",
+    },
+    "baseline_details": None,
+    "recipients": [
+        {"id": "r-slack", "type": "slack", "target": "#alerts"},
+        {"id": "r-email", "type": "email", "target": "oncall@example.com"},
+    ],
+    "tags": [],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-02-01T00:00:00Z",
+}
+
+SLO_RESPONSE = {
+    "id": "s-1",
+    "name": "Availability",
+    "description": "",
+    "sli": {"alias": "sli_ok"},
+    "time_period_days": 30,
+    "target_per_million": 999000,
+    "dataset_slugs": ["api"],
+    "tags": [],
+    "reset_at": None,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-02-01T00:00:00Z",
+}
+
+BURN_ALERT_RESPONSE = {
+    "id": "ba-1",
+    "alert_type": "exhaustion_time",
+    "description": "",
+    "exhaustion_minutes": 60,
+    "budget_rate_window_minutes": None,
+    "budget_rate_decrease_threshold_per_million": None,
+    "triggered": False,
+    "slo": {"id": "s-1"},
+    "recipients": [
+        {"id": "r-email", "type": "email", "target": "oncall@example.com", "details": None}
+    ],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+DERIVED_COLUMN_RESPONSE = {
+    "id": "dc-1",
+    "alias": "sli_ok",
+    "expression": "LT($status_code, 500)",
+    "description": "",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+
+def _trigger(name, threshold=100, dataset="api"):
+    return (
+        TriggerBuilder(name)
+        .dataset(dataset)
+        .last_30_minutes()
+        .count()
+        .threshold_gt(threshold)
+        .build()
+    )
+
+
+def _slo(name, percentage=99.9, dataset="api", expression=None, alert_minutes=None):
+    builder = (
+        SLOBuilder(name)
+        .dataset(dataset)
+        .target_percentage(percentage)
+        .sli(alias="sli_ok", expression=expression)
+    )
+    if alert_minutes is not None:
+        builder.exhaustion_alert(
+            BurnAlertBuilder(BurnAlertType.EXHAUSTION_TIME)
+            .exhaustion_minutes(alert_minutes)
+            .recipient_id("r-1")
+        )
+    return builder.build()
+
+
+def _board(name, limit=10):
+    return (
+        BoardBuilder(name)
+        .auto_layout()
+        .query(QueryBuilder("Errors").dataset("api").last_1_hour().count().limit(limit))
+        .build()
+    )
+
+
+class TestContentHash:
+    """Tests for content_hash()."""
+
+    def test_independent_of_key_order(self):
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+
+    def test_detects_changes(self):
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+    def test_rejects_non_json_values(self):
+        with pytest.raises(TypeError):
+            content_hash({"a": object()})
+
+
+def _manual_board(text="notes", width=6):
+    return (
+        BoardBuilder("Ops")
+        .manual_layout()
+        .query("q-1", "a-1", position=(0, 0, width, 4))
+        .slo("slo-1", position=(6, 0, 6, 4))
+        .text(text, position=(0, 4, 12, 2))
+        .build()
+    )
+
+
+class TestBoardFingerprint:
+    """Tests for the content hash apply records on boards."""
+
+    def test_equal_specs_hash_equal(self):
+        assert _board_fingerprint(_manual_board()) == _board_fingerprint(_manual_board())
+
+    def test_detects_panel_changes(self):
+        fingerprint = _board_fingerprint(_manual_board())
+        assert _board_fingerprint(_manual_board(text="other")) != fingerprint
+        assert _board_fingerprint(_manual_board(width=8)) != fingerprint
+
+
+@pytest.mark.asyncio
+class TestApply:
+    """Tests for HoneycombClient.plan_async() / apply_async()."""
+
+    @respx.mock
+    async def test_creates_then_leaves_unchanged(self, respx_mock):
+        """A second apply of the same state makes no writes."""
+        api = _Api(respx_mock)
+        desired = DesiredState(
+            triggers=[_trigger("High Errors"), _trigger("Slow", dataset="web")],
+            slos=[_slo("Availability")],
+            boards=[_board("Ops")],
+        )
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(desired)
+            assert result.ok
+            assert [item.action for item in result.succeeded] == [ApplyAction.CREATE] * 4
+
+            api.writes.clear()
+            again = await client.apply_async(desired)
+
+        assert not again.plan
+        assert again.plan.unchanged == 4
+        assert api.writes == []
+
+    @respx.mock
+    async def test_updates_only_changed_objects(self, respx_mock):
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(
+                DesiredState(
+                    triggers=[_trigger("A"), _trigger("B")],
+                    slos=[_slo("Availability")],
+                    boards=[_board("Ops")],
+                )
+            )
+            api.writes.clear()
+            result = await client.apply_async(
+                DesiredState(
+                    triggers=[_trigger("A"), _trigger("B", threshold=500)],
+                    slos=[_slo("Availability", percentage=99.5)],
+                    boards=[_board("Ops", limit=20)],
+                )
+            )
+
+        assert result.ok
+        assert [str(item) for item in result.plan.items] == [
+            "~ trigger api/B",
+            "~ slo api/Availability",
+            "~ board Ops",
+        ]
+        assert result.plan.unchanged == 1
+        assert [
+            (method, kind) for method, kind, _ in api.writes if not kind.startswith("quer")
+        ] == [
+            ("PUT", "triggers"),
+            ("PUT", "slos"),
+            ("PUT", "boards"),
+        ]
+        (board,) = [body for _, body in api.objects["boards"].values()]
+        assert {"key": BOARD_HASH_TAG, "value": board["tags"][0]["value"]} in board["tags"]
+
+    @respx.mock
+    async def test_burn_alert_change_updates_slo(self, respx_mock):
+        """A change to a burn alert alone is planned and applied."""
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(slos=[_slo("Availability", alert_minutes=60)]))
+            (old_alert_id,) = api.objects["burn_alerts"]
+
+            changed = DesiredState(slos=[_slo("Availability", alert_minutes=120)])
+            plan = await client.plan_async(changed)
+            result = await client.apply_async(changed)
+            again = await client.plan_async(changed)
+
+        assert [str(item) for item in plan.items] == ["~ slo api/Availability"]
+        assert result.ok
+        (alert,) = [body for _, body in api.objects["burn_alerts"].values()]
+        assert alert["exhaustion_minutes"] == 120
+        assert old_alert_id not in api.objects["burn_alerts"]
+        assert len(api.objects["slos"]) == 1
+        assert not again
+
+    @respx.mock
+    async def test_sli_expression_change_updates_derived_column(self, respx_mock):
+        """A change to the SLI derived column alone is planned and applied."""
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(
+                DesiredState(slos=[_slo("Availability", expression="LT($status, 500)")])
+            )
+            api.writes.clear()
+
+            changed = DesiredState(slos=[_slo("Availability", expression="LT($status, 400)")])
+            plan = await client.plan_async(changed)
+            result = await client.apply_async(changed)
+            again = await client.plan_async(changed)
+
+        assert [str(item) for item in plan.items] == ["~ slo api/Availability"]
+        assert result.ok
+        assert [(method, kind) for method, kind, _ in api.writes] == [
+            ("PUT", "derived_columns"),
+            ("PUT", "slos"),
+        ]
+        (column,) = [body for _, body in api.objects["derived_columns"].values()]
+        assert column["expression"] == "LT($status, 400)"
+        assert not again
+
+    @respx.mock
+    async def test_prune_deletes_undeclared_objects(self, respx_mock):
+        api = _Api(respx_mock)
+        api.seed("triggers", _trigger("Old").trigger.model_dump_for_api(), "api")
+        api.seed("triggers", _trigger("Elsewhere").trigger.model_dump_for_api(), "other")
+        api.seed("boards", {"name": "Hand-made", "type": "flexible"})
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(boards=[_board("Managed")], owner="ops"))
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("New")], prune=True, owner="ops")
+            )
+
+        assert [str(item) for item in result.plan.items] == [
+            "+ trigger api/New",
+            "- trigger api/Old",
+            "- board Managed",
+        ]
+        names = {body["name"] for _, body in api.objects["triggers"].values()}
+        assert names == {"New", "Elsewhere"}
+        assert [body["name"] for _, body in api.objects["boards"].values()] == ["Hand-made"]
+
+    @respx.mock
+    async def test_prune_only_deletes_boards_of_the_same_owner(self, respx_mock):
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(boards=[_board("Ops")], owner="team/ops"))
+            await client.apply_async(DesiredState(boards=[_board("Web")], owner="team/web"))
+            await client.apply_async(DesiredState(boards=[_board("Unowned")]))
+
+            unowned = await client.apply_async(DesiredState(prune=True))
+            result = await client.apply_async(DesiredState(prune=True, owner="team/web"))
+
+        assert not unowned.plan
+        assert [str(item) for item in result.plan.items] == ["- board Web"]
+        remaining = {body["name"]: body["tags"] for _, body in api.objects["boards"].values()}
+        assert set(remaining) == {"Ops", "Unowned"}
+        assert {"key": BOARD_OWNER_TAG, "value": "team/ops"} in remaining["Ops"]
+        assert BOARD_OWNER_TAG not in {tag["key"] for tag in remaining["Unowned"]}
+
+    @respx.mock
+    async def test_owner_change_updates_board(self, respx_mock):
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(boards=[_board("Ops")]))
+            plan = await client.plan_async(DesiredState(boards=[_board("Ops")], owner="ops"))
+
+        assert [str(item) for item in plan.items] == ["~ board Ops"]
+        assert len(api.objects["boards"]) == 1
+
+    async def test_invalid_owner_rejected(self):
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(ValueError, match="Invalid DesiredState.owner 'Ops'"):
+                await client.plan_async(DesiredState(owner="Ops"))
+
+    @respx.mock
+    async def test_objects_as_returned_by_the_api_are_unchanged(self, respx_mock):
+        """Fields the API adds, nulls or normalises don't make objects look changed."""
+        api = _Api(respx_mock)
+        respx_mock.get("https://api.honeycomb.io/1/recipients").mock(
+            return_value=Response(200, json=[RECIPIENT_RESPONSE])
+        )
+        api.objects["triggers"]["t-1"] = ("api", TRIGGER_RESPONSE)
+        api.objects["slos"]["s-1"] = ("api", SLO_RESPONSE)
+        api.objects["burn_alerts"]["ba-1"] = ("api", BURN_ALERT_RESPONSE)
+        api.objects["derived_columns"]["dc-1"] = ("api", DERIVED_COLUMN_RESPONSE)
+        desired = DesiredState(
+            triggers=[
+                TriggerBuilder("High Errors")
+                .dataset("api")
+                .last_30_minutes()
+                .count()
+                .threshold_gt(100)
+                .recipient_id("r-slack")
+                .email("oncall@example.com")
+                .build()
+            ],
+            slos=[
+                SLOBuilder("Availability")
+                .dataset("api")
+                .target_percentage(99.9)
+                .sli(alias="sli_ok", expression="LT($status_code, 500)")
+                .exhaustion_alert(
+                    BurnAlertBuilder(BurnAlertType.EXHAUSTION_TIME)
+                    .exhaustion_minutes(60)
+                    .email("oncall@example.com")
+                )
+                .build()
+            ],
+        )
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(desired)
+
+        assert not result.plan
+        assert result.plan.unchanged == 2
+        assert api.writes == []
+
+    @respx.mock
+    async def test_recipients_without_id_treated_as_changed(self, respx_mock):
+        api = _Api(respx_mock)
+        api.seed("triggers", _trigger("A").trigger.model_dump_for_api(), "api")
+        bundle = _trigger("A")
+        bundle.trigger.recipients = [{"type": "email", "target": "a@example.com"}, {"id": "r-1"}]
+        async with HoneycombClient(api_key="test-key") as client:
+            plan = await client.plan_async(DesiredState(triggers=[bundle]))
+
+        assert [str(item) for item in plan.items] == ["~ trigger api/A"]
+
+    @respx.mock
+    async def test_dry_run_makes_no_writes(self, respx_mock):
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("A")], boards=[_board("Ops")]), dry_run=True
+            )
+
+        assert result.dry_run
+        assert result.succeeded == []
+        assert api.writes == []
+        assert result.plan.format() == (
+            "+ trigger api/A\n"
+            "+ board Ops\n"
+            "Plan: 2 to create, 0 to update, 0 to delete, 0 unchanged."
+        )
+
+    @respx.mock
+    async def test_failures_reported_per_item(self, respx_mock):
+        api = _Api(respx_mock, fail={"Bad"})
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("Good"), _trigger("Bad"), _trigger("Fine")])
+            )
+
+        assert not result.ok
+        assert [item.name for item in result.succeeded] == ["Good", "Fine"]
+        ((item, error),) = result.failed
+        assert item.name == "Bad"
+        assert error.status_code == 400
+        assert {body["name"] for _, body in api.objects["triggers"].values()} == {"Good", "Fine"}
+
+    @respx.mock
+    async def test_writes_bounded_by_max_concurrency(self, respx_mock):
+        api = _Api(respx_mock)
+        desired = DesiredState(triggers=[_trigger(f"T{i}") for i in range(10)])
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(desired, max_concurrency=3)
+
+        assert len(result.succeeded) == 10
+        assert 1 < api.max_in_flight <= 3
+
+    @respx.mock
+    async def test_board_requests_share_the_bound(self, respx_mock):
+        """Board queries, views and writes count towards max_concurrency."""
+        api = _Api(respx_mock)
+        respx_mock.post(url__regex=r".*/boards/[^/]+/views$").mock(side_effect=api._create_query)
+        boards = [
+            BoardBuilder(f"B{i}")
+            .auto_layout()
+            .query(QueryBuilder("A").dataset("api").last_1_hour().count())
+            .query(QueryBuilder("B").dataset("api").last_1_hour().count())
+            .add_view("Errors", [{"column": "error", "operation": "exists"}])
+            .build()
+            for i in range(4)
+        ]
+        async with HoneycombClient(api_key="test-key") as client:
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("T")], slos=[_slo("S")], boards=boards),
+                max_concurrency=2,
+            )
+            assert result.ok
+            assert api.max_in_flight == 2
+
+            api.writes.clear()
+            api.max_in_flight = 0
+            result = await client.apply_async(
+                DesiredState(boards=[_board(f"B{i}", limit=5) for i in range(4)]),
+                max_concurrency=2,
+            )
+
+        assert result.ok
+        assert api.max_in_flight == 2
+        assert [method for method, kind, _ in api.writes if kind == "boards"] == ["PUT"] * 4
+
+    @respx.mock
+    async def test_deletes_run_after_creates_and_updates(self, respx_mock):
+        api = _Api(respx_mock)
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(triggers=[_trigger("Old"), _trigger("Keep")]))
+            api.writes.clear()
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("Keep", threshold=5), _trigger("New")], prune=True),
+                max_concurrency=8,
+            )
+
+        assert result.ok
+        assert [method for method, _, _ in api.writes] == ["PUT", "POST", "DELETE"]
+        assert api.in_flight_at_delete == [0]
+
+    @respx.mock
+    async def test_deletes_skipped_when_a_change_fails(self, respx_mock):
+        api = _Api(respx_mock, fail={"Bad"})
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.apply_async(DesiredState(triggers=[_trigger("Old")]))
+            result = await client.apply_async(
+                DesiredState(triggers=[_trigger("Bad"), _trigger("Good")], prune=True)
+            )
+
+        assert not result.ok
+        assert [item.name for item in result.succeeded] == ["Good"]
+        assert [item.name for item, _ in result.failed] == ["Bad"]
+        assert [str(item) for item in result.skipped] == ["- trigger api/Old"]
+        assert {body["name"] for _, body in api.objects["triggers"].values()} == {"Old", "Good"}
+
+    async def test_duplicate_names_rejected(self):
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(ValueError, match="Duplicate trigger name 'A' in api"):
+                await client.plan_async(DesiredState(triggers=[_trigger("A"), _trigger("A")]))
+
+    async def test_slo_builder_panels_rejected(self):
+        board = (
+            BoardBuilder("Ops")
+            .auto_layout()
+            .slo(SLOBuilder("Availability").dataset("api").target_percentage(99.9).sli("ok"))
+            .build()
+        )
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(ValueError, match="SLOBuilder panels"):
+                await client.plan_async(DesiredState(boards=[board]))
@@ -1,10 +1,13 @@
 """Tests for boards resource (board views CRUD operations)."""
 
+import asyncio
+import json
+
 import pytest
 import respx
 from httpx import Response
 
-from honeycomb import HoneycombClient
+from honeycomb import BoardBuilder, HoneycombAPIError, HoneycombClient, QueryBuilder, SLOBuilder
 from honeycomb.models.boards import BoardViewCreate, BoardViewFilter
 from honeycomb.models.query_builder import FilterOp
 
@@ -180,3 +183,150 @@ class TestBoardViewsResourceSync:
             view_create = BoardViewCreate(name="New View", filters=[])
             view = client.boards.create_view(board_id="board-1", view=view_create)
             assert view.id == "view-new"
+
+
+class _BundleApi:
+    """Mocks query, annotation, board and view creation, tracking requests in flight."""
+
+    def __init__(self, respx_mock, fail_view=None):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.query_datasets = []
+        self.board = None
+        self.fail_view = fail_view
+        respx_mock.post(url__regex=r"/1/queries/[^/]+$").mock(side_effect=self._create_query)
+        respx_mock.post(url__regex=r"/1/query_annotations/[^/]+$").mock(
+            side_effect=self._create_annotation
+        )
+        respx_mock.post("https://api.honeycomb.io/1/boards").mock(side_effect=self._create_board)
+        respx_mock.post("https://api.honeycomb.io/1/boards/board-1/views").mock(
+            side_effect=self._create_view
+        )
+
+    async def _slow(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def _create_query(self, request):
+        dataset = request.url.path.rsplit("/", 1)[1]
+        self.query_datasets.append(dataset)
+        await self._slow()
+        # Later panels finish first
+        await asyncio.sleep(0.01 * (10 - len(self.query_datasets)))
+        return Response(200, json={"id": f"q-{dataset}-{json.loads(request.content)['limit']}"})
+
+    async def _create_annotation(self, request):
+        await self._slow()
+        body = json.loads(request.content)
+        return Response(200, json={"id": f"a-{body['query_id']}", **body})
+
+    def _create_board(self, request):
+        self.board = json.loads(request.content)
+        return Response(200, json={"id": "board-1", **self.board})
+
+    async def _create_view(self, request):
+        await self._slow()
+        name = json.loads(request.content)["name"]
+        if name == self.fail_view:
+            return Response(400, json={"error": "bad view"})
+        return Response(200, json={"id": f"view-{name}", "name": name, "filters": []})
+
+
+@pytest.mark.asyncio
+class TestCreateFromBundleAsync:
+    """Tests for concurrent board bundle creation."""
+
+    @respx.mock
+    async def test_panels_created_concurrently_in_bundle_order(self, respx_mock):
+        """Query panels are created in parallel but keep their bundle order."""
+        api = _BundleApi(respx_mock)
+        builder = BoardBuilder("Dashboard").auto_layout()
+        for i in range(6):
+            builder.query(
+                QueryBuilder(f"Panel {i}").dataset("api").last_1_hour().count().limit(i + 1)
+            )
+        builder.text("notes")
+
+        async with HoneycombClient(api_key="test-key") as client:
+            board = await client.boards.create_from_bundle_async(builder.build(), max_concurrency=3)
+
+        assert board.id == "board-1"
+        assert api.max_in_flight == 3
+        query_ids = [p["query_panel"]["query_id"] for p in api.board["panels"][:6]]
+        assert query_ids == [f"q-api-{i + 1}" for i in range(6)]
+        assert api.board["panels"][6]["type"] == "text"
+
+    @respx.mock
+    async def test_dataset_override_does_not_mutate_shared_builder(self, respx_mock):
+        """Each override applies to its own panel only, even when run concurrently."""
+        api = _BundleApi(respx_mock)
+        shared = QueryBuilder("Errors").dataset("api").last_1_hour().count().limit(1)
+        bundle = (
+            BoardBuilder("Dashboard")
+            .auto_layout()
+            .query(shared, dataset="web")
+            .query(shared, dataset="worker")
+            .query(shared)
+            .build()
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.boards.create_from_bundle_async(bundle)
+
+        assert sorted(api.query_datasets) == ["api", "web", "worker"]
+        assert shared.get_dataset() == "api"
+        query_ids = [p["query_panel"]["query_id"] for p in api.board["panels"]]
+        assert query_ids == ["q-web-1", "q-worker-1", "q-api-1"]
+
+    @respx.mock
+    async def test_failed_view_warns(self, respx_mock):
+        """View failures are reported as warnings; the other views are still created."""
+        _BundleApi(respx_mock, fail_view="Broken")
+        bundle = (
+            BoardBuilder("Dashboard")
+            .auto_layout()
+            .text("notes")
+            .add_view("Broken", [])
+            .add_view("Fine", [])
+            .build()
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.warns(UserWarning, match="Failed to create view 'Broken'"):
+                board = await client.boards.create_from_bundle_async(bundle)
+
+        assert board.id == "board-1"
+
+    @respx.mock
+    async def test_failed_panel_deletes_created_slos(self, respx_mock):
+        """A failed panel skips queued panels and deletes the SLOs already created."""
+        created = []
+
+        async def create_slo(request):
+            await asyncio.sleep(0.02)
+            created.append(json.loads(request.content)["name"])
+            body = json.loads(request.content)
+            return Response(200, json={"id": f"slo-{len(created)}", **body})
+
+        async def fail_query(_request):
+            await asyncio.sleep(0.01)
+            return Response(400, json={"error": "bad query"})
+
+        respx_mock.post(url__regex=r"/1/queries/[^/]+$").mock(side_effect=fail_query)
+        respx_mock.post("https://api.honeycomb.io/1/slos/api").mock(side_effect=create_slo)
+        delete = respx_mock.delete(url__regex=r"/1/slos/api/[^/]+$").mock(
+            return_value=Response(204)
+        )
+        builder = BoardBuilder("Dashboard").auto_layout()
+        builder.query(QueryBuilder("Errors").dataset("api").last_1_hour().count())
+        for name in ("First", "Second"):
+            builder.slo(SLOBuilder(name).dataset("api").target_percentage(99.9).sli("ok"))
+
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(HoneycombAPIError, match="bad query"):
+                await client.boards.create_from_bundle_async(builder.build(), max_concurrency=2)
+
+        assert created == ["First"]
+        assert [call.request.url.path for call in delete.calls] == ["/1/slos/api/slo-1"]
@@ -0,0 +1,232 @@
+"""Tests for the concurrent, incremental `boards export-all` CLI command."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import respx
+from httpx import Response
+from typer.testing import CliRunner
+
+from honeycomb.cli.boards import MANIFEST_FILE
+from honeycomb.cli.boards import app as boards_app
+
+runner = CliRunner()
+
+BASE = "https://api.honeycomb.io/1"
+
+
+def _board(board_id, name, updated_at="2024-01-01T00:00:00Z"):
+    return {
+        "id": board_id,
+        "name": name,
+        "type": "flexible",
+        "updated_at": updated_at,
+        "panels": [
+            {
+                "type": "query",
+                "query_panel": {
+                    "query_id": f"q-{board_id}",
+                    "query_annotation_id": f"a-{board_id}",
+                    "dataset": "api",
+                },
+            },
+            {"type": "text", "text_panel": {"content": "notes"}},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("HONEYCOMB_API_KEY", "test-key")
+    monkeypatch.setenv("HONEYCOMB_NO_CACHE", "1")
+
+
+class _BoardsApi:
+    """Mocks listing boards and fetching their views and queries."""
+
+    def __init__(self, respx_mock, boards, fail=()):
+        self.boards = boards
+        self.fail = set(fail)
+        self.views = {}
+        self.view_requests = []
+        self.query_requests = []
+        respx_mock.get(f"{BASE}/boards").mock(side_effect=lambda _request: self._list())
+        respx_mock.get(url__regex=rf"{BASE}/boards/[^/]+/views$").mock(side_effect=self._views)
+        respx_mock.get(url__regex=rf"{BASE}/queries/[^/]+/[^/]+$").mock(side_effect=self._query)
+
+    def _list(self):
+        return Response(200, json=self.boards)
+
+    def _views(self, request):
+        board_id = request.url.path.split("/")[3]
+        self.view_requests.append(board_id)
+        if board_id in self.fail:
+            return Response(404, json={"error": "board not found"})
+        default = [{"id": f"v-{board_id}", "name": "Errors", "filters": []}]
+        return Response(200, json=self.views.get(board_id, default))
+
+    def _query(self, request):
+        _, _, _, dataset, query_id = request.url.path.split("/")
+        self.query_requests.append((dataset, query_id))
+        return Response(200, json={"id": query_id, "calculations": [{"op": "COUNT"}]})
+
+
+class TestExportAll:
+    @respx.mock
+    def test_exports_boards_with_views_and_manifest(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "API Overview"), _board("b2", "Errors")])
+
+        result = runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert sorted(api.view_requests) == ["b1", "b2"]
+        assert api.query_requests == []
+        data = json.loads((tmp_path / "api-overview.json").read_text())
+        assert data["name"] == "API Overview"
+        assert "id" not in data and "updated_at" not in data
+        assert data["views"] == [{"name": "Errors", "filters": []}]
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        entry = manifest["boards"]["b2"]
+        assert entry.pop("views").startswith("sha256:")
+        assert entry == {
+            "name": "Errors",
+            "file": "errors.json",
+            "version": "2024-01-01T00:00:00Z",
+            "options": {"views": True, "queries": False},
+        }
+
+    @respx.mock
+    def test_includes_query_specs(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "Overview")])
+
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--queries", "--no-views"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert api.view_requests == []
+        assert api.query_requests == [("api", "q-b1")]
+        data = json.loads((tmp_path / "overview.json").read_text())
+        assert data["queries"] == {"q-b1": {"dataset": "api", "calculations": [{"op": "COUNT"}]}}
+
+    @respx.mock
+    def test_incremental_skips_unchanged_boards(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One"), _board("b2", "Two")])
+        runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+        api.view_requests.clear()
+        api.boards[1] = _board("b2", "Two", updated_at="2024-02-01T00:00:00Z")
+
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental"]
+        )
+
+        assert result.exit_code == 0, result.output
+        # b1's views are listed to compare them, b2's to export them
+        assert sorted(api.view_requests) == ["b1", "b2"]
+        assert "Exported 'One'" not in result.output
+        assert "Exported 'Two'" in result.output
+        assert "(1 unchanged)" in result.output
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        assert manifest["boards"]["b1"]["version"] == "2024-01-01T00:00:00Z"
+        assert manifest["boards"]["b2"]["version"] == "2024-02-01T00:00:00Z"
+
+    @respx.mock
+    def test_incremental_reexports_boards_with_changed_views(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One"), _board("b2", "Two")])
+        runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+        api.views["b1"] = [{"id": "v-b1", "name": "Slow", "filters": []}]
+
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Exported 'One'" in result.output
+        assert "(1 unchanged)" in result.output
+        data = json.loads((tmp_path / "one.json").read_text())
+        assert data["views"] == [{"name": "Slow", "filters": []}]
+
+    @respx.mock
+    def test_incremental_without_views_makes_no_board_requests(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One")])
+        args = ["export-all", "--output-dir", str(tmp_path), "--no-views"]
+        runner.invoke(boards_app, args)
+
+        result = runner.invoke(boards_app, [*args, "--incremental"])
+
+        assert result.exit_code == 0, result.output
+        assert api.view_requests == []
+        assert "(1 unchanged)" in result.output
+
+    @respx.mock
+    def test_incremental_reexports_when_options_change(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One")])
+        runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path), "--no-views"])
+
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental", "--queries"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "(0 unchanged)" in result.output
+        assert api.query_requests == [("api", "q-b1")]
+        data = json.loads((tmp_path / "one.json").read_text())
+        assert "views" in data and "queries" in data
+
+    @respx.mock
+    def test_corrupt_manifest_falls_back_to_full_export(self, respx_mock, tmp_path):
+        _BoardsApi(respx_mock, [_board("b1", "One")])
+        (tmp_path / MANIFEST_FILE).write_text("{not json")
+
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Ignoring unreadable manifest" in result.output
+        assert "Exported 'One'" in result.output
+        assert "b1" in json.loads((tmp_path / MANIFEST_FILE).read_text())["boards"]
+
+    @respx.mock
+    def test_incremental_reexports_missing_files(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One")])
+        runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+        (tmp_path / "one.json").unlink()
+        api.view_requests.clear()
+
+        runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental"])
+
+        assert api.view_requests == ["b1"]
+        assert (tmp_path / "one.json").exists()
+
+    @respx.mock
+    def test_failed_board_reported_and_retried(self, respx_mock, tmp_path):
+        api = _BoardsApi(respx_mock, [_board("b1", "One"), _board("b2", "Two")], fail={"b2"})
+
+        result = runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Failed to export 'Two'" in result.output
+        assert (tmp_path / "one.json").exists()
+        assert not (tmp_path / "two.json").exists()
+        assert "b2" not in json.loads((tmp_path / MANIFEST_FILE).read_text())["boards"]
+
+        api.fail.clear()
+        result = runner.invoke(
+            boards_app, ["export-all", "--output-dir", str(tmp_path), "--incremental"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Exported 'One'" not in result.output
+        assert "Exported 'Two'" in result.output
+
+    @respx.mock
+    def test_duplicate_names_get_distinct_files(self, respx_mock, tmp_path):
+        _BoardsApi(respx_mock, [_board("b1", "Same"), _board("b2", "Same")])
+
+        result = runner.invoke(boards_app, ["export-all", "--output-dir", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "same-b1.json").exists()
+        assert (tmp_path / "same-b2.json").exists()
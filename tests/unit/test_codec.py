@@ -0,0 +1,194 @@
+"""Tests for pluggable JSON codecs."""
+
+import json
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum, IntEnum
+from uuid import UUID
+
+import pytest
+import respx
+from httpx import Response
+
+from honeycomb import (
+    DatasetCreate,
+    HoneycombClient,
+    HoneycombNotFoundError,
+    JSONCodec,
+    create_json_codec,
+)
+from honeycomb.codec import MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+from honeycomb.tools import execute_tool
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Shape(Enum):
+    SQUARE = "square"
+
+
+class Level(IntEnum):
+    HIGH = 3
+
+
+@dataclass
+class Window:
+    start: datetime
+    minutes: int
+
+
+class CountingCodec(StdlibJSONCodec):
+    """Stdlib codec that records how often it is used."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, obj):
+        self.encoded += 1
+        return super().encode(obj)
+
+    def decode(self, data):
+        self.decoded += 1
+        return super().decode(data)
+
+
+def _available_codecs():
+    codecs = [StdlibJSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        with suppress(ImportError):
+            codecs.append(codec_class())
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda c: c.name)
+class TestCodecs:
+    """Behavior shared by every codec backend."""
+
+    def test_roundtrip(self, codec: JSONCodec):
+        """Plain JSON values survive encode/decode."""
+        value = {"a": [1, 2.5, None, True], "b": {"c": "ünïcode"}}
+        assert codec.decode(codec.encode(value)) == value
+        assert codec.decode(codec.encode(value).decode()) == value
+
+    def test_output_is_compact_utf8(self, codec: JSONCodec):
+        """Output is compact and interoperable with the stdlib parser."""
+        encoded = codec.encode({"k": "ü"})
+        assert encoded == '{"k":"ü"}'.encode()
+        assert json.loads(encoded) == {"k": "ü"}
+
+    def test_unsupported_values_raise(self, codec: JSONCodec):
+        """Unknown objects raise TypeError instead of being sent as their repr."""
+        with pytest.raises(TypeError):
+            codec.encode({"payload": object()})
+
+    def test_dumps_returns_str(self, codec: JSONCodec):
+        """dumps() returns text for tool results."""
+        assert codec.dumps({"k": 1}) == '{"k":1}'
+
+
+def test_codecs_encode_identically():
+    """Every installed backend produces the same bytes for the same payload."""
+    utc = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    payload = {
+        "name": "ünïcode \u2028 <tag>",
+        "values": [1, -2, 2.5, 0.1, None, True, False],
+        "nested": {"empty": {}, "list": [[], {"k": "v"}]},
+        "enums": [Color.RED, Shape.SQUARE, Level.HIGH],
+        "times": [
+            utc,
+            datetime(2024, 1, 1, 12, 30, 0, 123456),
+            datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+            date(2024, 1, 2),
+        ],
+        "id": UUID(int=1),
+        "window": Window(start=utc, minutes=15),
+        1: "int key",
+    }
+
+    encoded = {codec.name: codec.encode(payload) for codec in _available_codecs()}
+
+    assert len(set(encoded.values())) == 1, encoded
+    decoded = json.loads(encoded["stdlib"])
+    assert decoded["enums"] == ["red", "square", 3]
+    assert decoded["times"][0] == "2024-01-01T12:30:00Z"
+    assert decoded["times"][2] == "2024-01-01T00:00:00-05:30"
+    assert decoded["window"] == {"start": "2024-01-01T12:30:00Z", "minutes": 15}
+
+
+class TestCreateJsonCodec:
+    """Tests for codec selection."""
+
+    def test_stdlib(self):
+        assert create_json_codec("stdlib").name == "stdlib"
+
+    def test_auto_prefers_fast_backends(self):
+        """auto picks orjson/msgspec when installed, stdlib otherwise."""
+        available = {c.name for c in _available_codecs()}
+        expected = next(n for n in ("orjson", "msgspec", "stdlib") if n in available)
+        assert create_json_codec().name == expected
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            create_json_codec("simplejson")
+
+    def test_client_accepts_name_or_instance(self):
+        assert HoneycombClient(api_key="k", json_codec="stdlib").json_codec.name == "stdlib"
+        codec = CountingCodec()
+        assert HoneycombClient(api_key="k", json_codec=codec).json_codec is codec
+
+
+class TestClientUsesCodec:
+    """All request/response bodies route through the client's codec."""
+
+    @respx.mock
+    async def test_requests_and_responses(self):
+        """Request bodies are encoded and response bodies decoded by the codec."""
+        route = respx.post("https://api.honeycomb.io/1/datasets").mock(
+            return_value=Response(201, json={"name": "New", "slug": "new"})
+        )
+        codec = CountingCodec()
+
+        async with HoneycombClient(api_key="test-key", json_codec=codec) as client:
+            dataset = await client.datasets.create_async(DatasetCreate(name="New"))
+
+        assert dataset.slug == "new"
+        assert codec.encoded == 1
+        assert codec.decoded == 1
+        assert route.calls[0].request.headers["Content-Type"] == "application/json"
+        assert json.loads(route.calls[0].request.content)["name"] == "New"
+
+    @respx.mock
+    def test_sync_error_body_decoded(self):
+        """Error bodies are parsed with the codec as well."""
+        respx.get("https://api.honeycomb.io/1/datasets/missing").mock(
+            return_value=Response(404, json={"error": "Dataset not found"})
+        )
+        codec = CountingCodec()
+
+        with (
+            HoneycombClient(api_key="test-key", sync=True, json_codec=codec) as client,
+            pytest.raises(HoneycombNotFoundError, match="Dataset not found"),
+        ):
+            client.datasets.get("missing")
+
+        assert codec.decoded == 1
+
+    @respx.mock
+    async def test_tool_results(self):
+        """Tool executor results are serialized by the client's codec."""
+        respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=Response(200, json=[{"name": "A", "slug": "a"}])
+        )
+        codec = CountingCodec()
+
+        async with HoneycombClient(api_key="test-key", json_codec=codec) as client:
+            result = await execute_tool(client, "honeycomb_list_datasets", {})
+
+        assert json.loads(result)[0]["slug"] == "a"
+        assert codec.encoded == 1
@@ -0,0 +1,116 @@
+"""Tests for the columnar view of query results."""
+
+import array
+import math
+
+import pytest
+
+from honeycomb import ColumnarResult, QueryResult
+
+
+def _result(rows):
+    return QueryResult.model_validate({"data": {"results": [{"data": row} for row in rows]}})
+
+
+class TestColumnarResult:
+    """Tests for ColumnarResult construction and access."""
+
+    def test_typed_columns(self):
+        columns = ColumnarResult.from_rows(
+            [
+                {"service": "api", "COUNT": 3, "P99": 12.5, "flag": True},
+                {"service": "api", "COUNT": 1, "P99": 4, "flag": False},
+            ]
+        )
+
+        assert columns.names == ["service", "COUNT", "P99", "flag"]
+        assert columns["COUNT"] == array.array("q", [3, 1])
+        assert columns["P99"] == array.array("d", [12.5, 4.0])
+        # Booleans are not packed into numeric arrays
+        assert columns["flag"] == [True, False]
+        assert len(columns) == 2
+
+    def test_breakdown_strings_are_interned(self):
+        rows = [{"service": "".join(["ap", "i"])} for _ in range(3)]
+        service = ColumnarResult.from_rows(rows)["service"]
+        assert service[0] is service[1] is service[2]
+
+    def test_missing_values(self):
+        columns = ColumnarResult.from_rows([{"a": 1}, {"a": 2, "b": 7}, {"b": None}])
+
+        assert columns["a"].typecode == "d"
+        assert math.isnan(columns["a"][2])
+        assert columns["b"].typecode == "d"
+        assert math.isnan(columns["b"][0])
+
+    def test_large_ints_fall_back_to_float(self):
+        assert ColumnarResult.from_rows([{"n": 2**70}])["n"].typecode == "d"
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="same length"):
+            ColumnarResult({"a": [1], "b": [1, 2]})
+
+    def test_iter_rows_round_trip(self):
+        rows = [{"service": "api", "COUNT": 3}, {"service": "db", "COUNT": 5}]
+        assert list(ColumnarResult.from_rows(rows).iter_rows()) == rows
+
+
+class TestQueryResultColumns:
+    """Tests for QueryResultData.columns and compact()."""
+
+    def test_columns_are_cached(self):
+        result = _result([{"service": "api", "COUNT": 3}])
+        assert result.data.columns is result.data.columns
+
+    def test_compact_releases_row_dicts(self):
+        result = _result([{"service": "api", "COUNT": 3}, {"service": "db", "COUNT": 5}])
+        columns = result.data.compact()
+
+        assert result.data.results is None
+        assert result.data.rows == [{"service": "api", "COUNT": 3}, {"service": "db", "COUNT": 5}]
+        assert result.data.columns is columns
+
+    def test_empty_result(self):
+        result = _result([])
+        assert len(result.data.columns) == 0
+        assert result.data.columns.names == []
+
+
+class TestExport:
+    """Tests for NumPy / Arrow export."""
+
+    def test_to_numpy_shares_memory(self):
+        np = pytest.importorskip("numpy")
+        columns = ColumnarResult.from_rows([{"service": "api", "COUNT": 3}])
+        arrays = columns.to_numpy()
+
+        assert arrays["COUNT"].dtype == np.int64
+        columns["COUNT"][0] = 42
+        assert arrays["COUNT"][0] == 42
+        assert arrays["service"].dtype == object
+
+    def test_to_arrow(self):
+        pytest.importorskip("pyarrow")
+        table = ColumnarResult.from_rows(
+            [{"service": "api", "P99": 1.5}, {"service": "api", "P99": 2.5}]
+        ).to_arrow()
+
+        assert table.column_names == ["service", "P99"]
+        assert table.column("P99").to_pylist() == [1.5, 2.5]
+
+    def test_missing_optional_dependency(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name in ("numpy", "pyarrow"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        columns = ColumnarResult.from_rows([{"a": 1}])
+        with pytest.raises(ImportError, match="pip install numpy"):
+            columns.to_numpy()
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            columns.to_arrow()
@@ -0,0 +1,94 @@
+"""Tests for HTTP connection pool configuration and shared HTTP clients."""
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import HoneycombClient, PoolConfig
+
+
+class TestPoolConfig:
+    """Tests for PoolConfig."""
+
+    def test_defaults_match_httpx(self):
+        """Default pool settings are httpx's defaults."""
+        assert PoolConfig().limits() == httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+        )
+
+    def test_limits_applied_to_owned_client(self):
+        """Pool settings configure the client's own connection pool."""
+        client = HoneycombClient(
+            api_key="test-key",
+            pool=PoolConfig(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5),
+        )
+        pool = client._get_async_client()._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 1.5
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Enabling HTTP/2 without h2 installed fails early."""
+        monkeypatch.setattr("importlib.util.find_spec", lambda _name: None)
+        with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+            PoolConfig(http2=True)
+
+
+class TestExternalHttpClient:
+    """Tests for externally-owned httpx clients and transports."""
+
+    @respx.mock
+    async def test_shared_async_client(self):
+        """Several clients share one httpx client, each with its own auth and base URL."""
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        async with httpx.AsyncClient() as shared:
+            async with (
+                HoneycombClient(api_key="key-a", http_client=shared) as a,
+                HoneycombClient(api_key="key-b", http_client=shared) as b,
+            ):
+                await a.datasets.list_async()
+                await b.datasets.list_async()
+
+            # Closing the Honeycomb clients leaves the shared client open
+            assert not shared.is_closed
+
+        keys = [call.request.headers["X-Honeycomb-Team"] for call in route.calls]
+        assert keys == ["key-a", "key-b"]
+
+    @respx.mock
+    def test_shared_sync_client(self):
+        """Sync clients accept a shared httpx.Client."""
+        respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        with httpx.Client() as shared:
+            with HoneycombClient(api_key="key-a", sync=True, http_client=shared) as client:
+                assert client.datasets.list() == []
+            assert not shared.is_closed
+
+    def test_client_mode_mismatch(self):
+        """An httpx client of the wrong flavor is rejected."""
+        with pytest.raises(TypeError, match="AsyncClient"):
+            HoneycombClient(api_key="test-key", http_client=httpx.Client())
+
+    async def test_shared_transport_left_open(self):
+        """A shared transport serves several clients and survives their close."""
+        transport = httpx.MockTransport(lambda _request: httpx.Response(200, json=[]))
+
+        async with HoneycombClient(api_key="key-a", transport=transport) as a:
+            await a.datasets.list_async()
+        async with HoneycombClient(api_key="key-b", transport=transport) as b:
+            assert await b.datasets.list_async() == []
+
+    def test_http_client_and_transport_are_exclusive(self):
+        """Only one of http_client and transport may be given."""
+        with pytest.raises(ValueError, match="either http_client or transport"):
+            HoneycombClient(
+                api_key="test-key",
+                http_client=httpx.AsyncClient(),
+                transport=httpx.AsyncHTTPTransport(),
+            )
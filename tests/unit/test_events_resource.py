@@ -0,0 +1,292 @@
+"""Tests for EventsResource request encoding and batch splitting."""
+
+import gzip
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from honeycomb import BatchEvent, CompressionConfig, HoneycombAuthError, HoneycombClient
+from honeycomb.resources.events import MAX_EVENT_BYTES, _split_batches
+
+
+class TestCompressionConfig:
+    """Tests for CompressionConfig validation and codecs."""
+
+    def test_defaults(self):
+        """Default config uses gzip with a 1KB threshold."""
+        config = CompressionConfig()
+        assert config.codec == "gzip"
+        assert config.level is None
+        assert config.min_size == 1024
+
+    def test_invalid_codec(self):
+        """Unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression codec"):
+            CompressionConfig(codec="brotli")
+
+    def test_gzip_roundtrip(self):
+        """gzip output decompresses to the original body."""
+        body = b'{"data":{"k":"v"}}' * 100
+        assert gzip.decompress(CompressionConfig(level=1).compress(body)) == body
+
+
+class TestEventCompression:
+    """Tests for compressed event ingestion."""
+
+    @respx.mock
+    async def test_batch_uncompressed_by_default(self):
+        """Without a CompressionConfig the body is plain JSON."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(200, json=[{"status": 202}])
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.events.send_batch_async("ds", [BatchEvent(data={"k": "v"})])
+
+        request = route.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == [{"data": {"k": "v"}}]
+
+    @respx.mock
+    async def test_batch_gzip_above_threshold(self):
+        """Bodies above min_size are gzip compressed."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(200, json=[{"status": 202}] * 50)
+        )
+        events = [BatchEvent(data={"endpoint": "/api/users", "i": i}) for i in range(50)]
+
+        async with HoneycombClient(
+            api_key="test-key", compression=CompressionConfig(min_size=100)
+        ) as client:
+            results = await client.events.send_batch_async("ds", events)
+
+        assert len(results) == 50
+        request = route.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(request.content))
+        assert payload == [e.model_dump_for_api() for e in events]
+
+    @respx.mock
+    async def test_small_body_skips_compression(self):
+        """Bodies below min_size are sent uncompressed."""
+        route = respx.post("https://api.honeycomb.io/1/events/ds").mock(return_value=Response(200))
+
+        async with HoneycombClient(
+            api_key="test-key", compression=CompressionConfig(min_size=10_000)
+        ) as client:
+            await client.events.send_async("ds", {"k": "v"}, samplerate=10)
+
+        request = route.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert request.headers["X-Honeycomb-Samplerate"] == "10"
+        assert json.loads(request.content) == {"k": "v"}
+
+    @respx.mock
+    def test_sync_single_event_gzip(self):
+        """Sync single-event sends honor compression too."""
+        route = respx.post("https://api.honeycomb.io/1/events/ds").mock(return_value=Response(200))
+
+        with HoneycombClient(
+            api_key="test-key", sync=True, compression=CompressionConfig(min_size=0)
+        ) as client:
+            client.events.send("ds", {"k": "v"})
+
+        request = route.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == {"k": "v"}
+
+
+def _accept_all(request):
+    """Respond 202 for every event in the posted batch."""
+    return Response(200, json=[{"status": 202} for _ in json.loads(request.content)])
+
+
+class TestBatchSplitting:
+    """Tests for size-aware batch splitting."""
+
+    def test_split_respects_body_size(self):
+        """Chunks never exceed max_batch_bytes, including brackets and commas."""
+        encoded = [b'{"data":{"i":%d}}' % i for i in range(100)]
+        chunks, oversized = _split_batches(encoded, max_batch_bytes=200)
+
+        assert oversized == []
+        assert [i for chunk in chunks for i in chunk] == list(range(100))
+        for chunk in chunks:
+            body = b"[" + b",".join(encoded[i] for i in chunk) + b"]"
+            assert len(body) <= 200
+
+    def test_split_exact_fit(self):
+        """An event that exactly fills the body stays in the chunk."""
+        encoded = [b"x" * 4, b"y" * 3]  # [xxxx,yyy] == 10 bytes
+        chunks, _ = _split_batches(encoded, max_batch_bytes=10)
+        assert chunks == [[0, 1]]
+
+    def test_split_flags_oversized_events(self):
+        """Events over max_event_bytes are reported, not chunked."""
+        encoded = [b"a" * 10, b"b" * 50, b"c" * 10]
+        chunks, oversized = _split_batches(encoded, max_batch_bytes=1000, max_event_bytes=20)
+        assert chunks == [[0, 2]]
+        assert oversized == [1]
+
+    @respx.mock
+    async def test_large_batch_is_split_and_stitched_in_order(self):
+        """Results from concurrent chunk requests come back in input order."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            side_effect=lambda request: Response(
+                200,
+                json=[{"status": 202, "i": e["data"]["i"]} for e in json.loads(request.content)],
+            )
+        )
+        events = [BatchEvent(data={"i": i, "pad": "x" * 50}) for i in range(40)]
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_async("ds", events, max_batch_bytes=500)
+
+        assert route.call_count > 1
+        assert [r.model_extra["i"] for r in results] == list(range(40))
+
+    @respx.mock
+    async def test_oversized_event_is_rejected_locally(self):
+        """An event above the per-event limit gets a 413 result without being sent."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+        events = [
+            BatchEvent(data={"n": 1}),
+            BatchEvent(data={"blob": "x" * (MAX_EVENT_BYTES + 1)}),
+            BatchEvent(data={"n": 3}),
+        ]
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_async("ds", events)
+
+        assert [r.status for r in results] == [202, 413, 202]
+        assert len(json.loads(route.calls[0].request.content)) == 2
+
+    @respx.mock
+    def test_sync_batch_split(self):
+        """Sync send_batch splits too."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+        events = [BatchEvent(data={"i": i}) for i in range(10)]
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            results = client.events.send_batch("ds", events, max_batch_bytes=60)
+
+        assert route.call_count > 1
+        assert len(results) == 10
+
+    @respx.mock
+    async def test_short_response_fills_missing_results(self):
+        """A response with fewer entries than events still yields one result per event."""
+        respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(200, json=[{"status": 202}])
+        )
+        events = [BatchEvent(data={"i": i}) for i in range(3)]
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_async("ds", events)
+
+        assert [r.status for r in results] == [202, 0, 0]
+        assert "no result" in results[1].error
+
+    @respx.mock
+    async def test_failed_chunk_keeps_accepted_results(self):
+        """A failed chunk gets error results; the other chunks' results are kept in order."""
+
+        def respond(request):
+            body = json.loads(request.content)
+            if any(e["data"]["i"] == 0 for e in body):
+                return Response(400, json={"error": "bad chunk"})
+            return Response(200, json=[{"status": 202} for _ in body])
+
+        respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=respond)
+        events = [BatchEvent(data={"i": i, "pad": "x" * 50}) for i in range(20)]
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_async("ds", events, max_batch_bytes=500)
+
+        assert len(results) == 20
+        assert results[0].status == 400
+        assert "bad chunk" in results[0].error
+        assert results[-1].status == 202
+
+    @respx.mock
+    def test_sync_all_chunks_failed_raises(self):
+        """If no chunk is accepted the request error is raised, as for a single request."""
+        respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(401, json={"error": "unknown API key"})
+        )
+        events = [BatchEvent(data={"i": i}) for i in range(10)]
+
+        with (
+            HoneycombClient(api_key="test-key", sync=True) as client,
+            pytest.raises(HoneycombAuthError),
+        ):
+            client.events.send_batch("ds", events, max_batch_bytes=60)
+
+
+class TestRawBatch:
+    """Tests for the pre-serialized batch fast path."""
+
+    @respx.mock
+    async def test_raw_bytes_are_concatenated(self):
+        """Encoded events are sent byte-for-byte inside the JSON array."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+        records = [b'{"data":{"a":1}}', b'{"data":{"b":2},"samplerate":5}']
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_raw_async("ds", records)
+
+        assert [r.status for r in results] == [202, 202]
+        assert (
+            route.calls[0].request.content == b'[{"data":{"a":1}},{"data":{"b":2},"samplerate":5}]'
+        )
+
+    @respx.mock
+    async def test_raw_accepts_dicts_and_generators(self):
+        """API-shaped dicts from any iterable are serialized directly."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+
+        async with HoneycombClient(api_key="test-key") as client:
+            results = await client.events.send_batch_raw_async(
+                "ds", ({"data": {"i": i}} for i in range(3))
+            )
+
+        assert len(results) == 3
+        assert json.loads(route.calls[0].request.content) == [{"data": {"i": i}} for i in range(3)]
+
+    @respx.mock
+    async def test_raw_is_split_and_compressed(self):
+        """The raw path shares splitting and compression with send_batch_async."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            side_effect=lambda request: Response(
+                200, json=[{"status": 202} for _ in json.loads(gzip.decompress(request.content))]
+            )
+        )
+        records = [b'{"data":{"i":%d}}' % i for i in range(20)]
+
+        async with HoneycombClient(
+            api_key="test-key", compression=CompressionConfig(min_size=0)
+        ) as client:
+            results = await client.events.send_batch_raw_async("ds", records, max_batch_bytes=100)
+
+        assert route.call_count > 1
+        assert len(results) == 20
+
+    @respx.mock
+    def test_sync_raw(self):
+        """Sync send_batch_raw sends the same body."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            results = client.events.send_batch_raw("ds", [b'{"data":{"a":1}}'])
+
+        assert results[0].status == 202
+        assert route.calls[0].request.content == b'[{"data":{"a":1}}]'
+
+    def test_sync_raw_requires_sync_mode(self):
+        """send_batch_raw raises in async mode."""
+        client = HoneycombClient(api_key="test-key")
+        with pytest.raises(RuntimeError, match="send_batch_raw_async"):
+            client.events.send_batch_raw("ds", [])
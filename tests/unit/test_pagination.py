@@ -941,3 +941,177 @@ class TestRunAllAsync:
                         orders=[{"op": "COUNT", "order": "ascending"}],
                     ),
                 )
+
+
+class TestRunAllTimeShards:
+    """Tests for run_all_async(time_shards=...)."""
+
+    @staticmethod
+    def _mock_windows(rows_by_start):
+        """Serve rows per time window, keyed by the saved query's start_time."""
+        import json
+
+        starts = []
+
+        def create_query(request):
+            start = json.loads(request.content)["start_time"]
+            starts.append(start)
+            return Response(200, json={"id": f"q-{start}"})
+
+        def create_result(request):
+            return Response(200, json={"id": f"r-{json.loads(request.content)['query_id'][2:]}"})
+
+        def get_result(request):
+            start = int(request.url.path.rsplit("r-", 1)[1])
+            return Response(200, json={"data": {"results": rows_by_start[start], "series": []}})
+
+        respx.post("https://api.honeycomb.io/1/queries/my-dataset").mock(side_effect=create_query)
+        respx.post("https://api.honeycomb.io/1/query_results/my-dataset").mock(
+            side_effect=create_result
+        )
+        respx.get(url__regex=r"/1/query_results/my-dataset/r-\d+$").mock(side_effect=get_result)
+        return starts
+
+    @respx.mock
+    async def test_windows_run_in_parallel_and_merge(self):
+        """Per-window rows merge into one row per group with combined aggregates."""
+        from honeycomb.models import QuerySpec
+
+        starts = self._mock_windows(
+            {
+                1000: [
+                    {"service": "api", "COUNT": 3, "MAX": 10},
+                    {"service": "db", "COUNT": 1, "MAX": 5},
+                ],
+                1500: [
+                    {"service": "api", "COUNT": 2, "MAX": 40},
+                    {"service": "web", "COUNT": 7, "MAX": 1},
+                ],
+            }
+        )
+
+        async with HoneycombClient(api_key="test-api-key") as client:
+            rows = await client.query_results.run_all_async(
+                dataset="my-dataset",
+                spec=QuerySpec(
+                    start_time=1000,
+                    end_time=2000,
+                    calculations=[{"op": "COUNT"}, {"op": "MAX", "column": "duration_ms"}],
+                    breakdowns=["service"],
+                ),
+                sort_field="service",
+                sort_order="ascending",
+                time_shards=2,
+            )
+
+        assert sorted(starts) == [1000, 1500]
+        assert rows == [
+            {"service": "api", "COUNT": 5, "MAX": 40},
+            {"service": "db", "COUNT": 1, "MAX": 5},
+            {"service": "web", "COUNT": 7, "MAX": 1},
+        ]
+
+    async def test_refuses_specs_sharding_would_change(self):
+        import pytest
+
+        from honeycomb.models import QuerySpec
+
+        cases = [
+            ({"calculations": [{"op": "COUNT"}], "breakdowns": ["service"]}, None, "breakdown"),
+            (
+                {"calculations": [{"op": "P99", "column": "d"}], "breakdowns": ["service"]},
+                "service",
+                "cannot merge P99",
+            ),
+            (
+                {
+                    "calculations": [{"op": "COUNT"}],
+                    "breakdowns": ["service"],
+                    "havings": [{"calculate_op": "COUNT", "op": ">", "value": 1}],
+                },
+                "service",
+                "havings",
+            ),
+        ]
+        async with HoneycombClient(api_key="test-api-key") as client:
+            for spec_kwargs, sort_field, message in cases:
+                with pytest.raises(ValueError, match=message):
+                    await client.query_results.run_all_async(
+                        dataset="my-dataset",
+                        spec=QuerySpec(time_range=3600, **spec_kwargs),
+                        sort_field=sort_field,
+                        time_shards=4,
+                    )
+
+    def test_split_window(self):
+        from honeycomb.resources.query_results import _split_window
+
+        assert _split_window(0, 10, 3) == [(0, 3), (3, 6), (6, 10)]
+        assert _split_window(0, 2, 5) == [(0, 1), (1, 2)]
+
+
+class TestIterAllAsync:
+    """Tests for streaming pagination with iter_all_async / iter_pages_async."""
+
+    @staticmethod
+    def _mock_pages(pages):
+        respx.post("https://api.honeycomb.io/1/queries/my-dataset").mock(
+            side_effect=[Response(200, json={"id": f"q{i}"}) for i in range(len(pages))]
+        )
+        respx.post("https://api.honeycomb.io/1/query_results/my-dataset").mock(
+            side_effect=[Response(200, json={"id": f"r{i}"}) for i in range(len(pages))]
+        )
+        for i, rows in enumerate(pages):
+            respx.get(f"https://api.honeycomb.io/1/query_results/my-dataset/r{i}").mock(
+                return_value=Response(200, json={"data": {"results": rows, "series": []}})
+            )
+
+    @staticmethod
+    def _spec():
+        from honeycomb.models import QuerySpec
+
+        return QuerySpec(time_range=3600, calculations=[{"op": "COUNT"}], breakdowns=["service"])
+
+    @respx.mock
+    async def test_pages_stream_with_boundary_dedup(self):
+        """Rows repeated at the cursor value are yielded once."""
+        first = [{"service": f"s{i}", "COUNT": 10_000 - i // 2} for i in range(10_000)]
+        boundary = first[-2:]  # both rows share the last COUNT value
+        second = [*boundary, {"service": "tail", "COUNT": 1}]
+        self._mock_pages([first, second])
+
+        async with HoneycombClient(api_key="test-api-key") as client:
+            pages = [
+                page
+                async for page in client.query_results.iter_pages_async("my-dataset", self._spec())
+            ]
+
+        assert [len(page) for page in pages] == [10_000, 1]
+        assert pages[1] == [{"service": "tail", "COUNT": 1}]
+
+    @respx.mock
+    async def test_early_termination_skips_remaining_pages(self):
+        first = [{"service": f"s{i}", "COUNT": 10_000 - i} for i in range(10_000)]
+        self._mock_pages([first, [{"service": "next", "COUNT": 1}]])
+
+        async with HoneycombClient(api_key="test-api-key") as client:
+            seen = []
+            async for row in client.query_results.iter_all_async("my-dataset", self._spec()):
+                seen.append(row)
+                if len(seen) == 3:
+                    break
+
+        assert [row["service"] for row in seen] == ["s0", "s1", "s2"]
+        assert respx.calls.call_count == 3  # one query, one result, one poll
+
+    async def test_validates_before_requests(self):
+        import pytest
+
+        from honeycomb.models import QuerySpec
+
+        async with HoneycombClient(api_key="test-api-key") as client:
+            with pytest.raises(ValueError, match="calculations is required"):
+                async for _ in client.query_results.iter_all_async(
+                    "my-dataset", QuerySpec(time_range=3600)
+                ):
+                    pass
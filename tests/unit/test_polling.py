@@ -0,0 +1,177 @@
+"""Tests for adaptive polling of query results and service map dependencies."""
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import HoneycombClient, HoneycombTimeoutError, PollStrategy, QuerySpec
+from honeycomb.models.service_map_dependencies import ServiceMapDependencyRequestCreate
+
+
+class FakeClock:
+    """Clock advanced by the (patched) sleep function."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def sleep_async(self, seconds):
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("honeycomb.polling.time.sleep", clock.sleep)
+    monkeypatch.setattr("honeycomb.polling.asyncio.sleep", clock.sleep_async)
+    return clock
+
+
+class TestPollStrategy:
+    """Tests for the poll schedule."""
+
+    def test_geometric_backoff_capped(self):
+        strategy = PollStrategy(initial_delay=0.1, multiplier=2.0, max_delay=0.5)
+        assert [strategy.delay(n) for n in range(5)] == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_per_loop_cap(self):
+        strategy = PollStrategy(initial_delay=0.1, multiplier=2.0, max_delay=5.0)
+        assert strategy.delay(10, max_delay=0.3) == 0.3
+
+    def test_per_loop_cap_above_strategy_max(self):
+        """An explicit poll_interval longer than the strategy's max_delay is honored."""
+        strategy = PollStrategy(initial_delay=0.1, multiplier=2.0, max_delay=1.0)
+        assert strategy.delay(10, max_delay=5.0) == 5.0
+        assert strategy.delay(10) == 1.0
+
+    def test_retry_after_takes_precedence(self):
+        strategy = PollStrategy(max_delay=1.0)
+        assert strategy.delay(0, retry_after=3) == 3.0
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"initial_delay": 0}, {"max_delay": -1}, {"multiplier": 0.5}]
+    )
+    def test_invalid_config(self, kwargs):
+        with pytest.raises(ValueError):
+            PollStrategy(**kwargs)
+
+    def test_poll_records_stats(self, clock):
+        strategy = PollStrategy(initial_delay=0.1, multiplier=2.0, clock=clock)
+        results = iter([(None, None), (None, None), ("done", None)])
+
+        assert strategy.poll(lambda: next(results), lambda r: r is not None, timeout=10) == "done"
+        assert clock.sleeps == pytest.approx([0.1, 0.2])
+        assert (strategy.stats.loops, strategy.stats.polls) == (1, 3)
+        assert strategy.stats.last_wall_time == pytest.approx(0.3)
+
+    async def test_poll_async_times_out_without_oversleeping(self, clock):
+        strategy = PollStrategy(initial_delay=1.0, multiplier=1.0, clock=clock)
+
+        async def pending():
+            return None, None
+
+        with pytest.raises(TimeoutError):
+            await strategy.poll_async(pending, lambda r: r is not None, timeout=2.5)
+        assert clock.now == pytest.approx(2.5)
+        assert strategy.stats.polls == 4
+
+
+class TestClientPolling:
+    """Tests for resources polling through the client's strategy."""
+
+    @respx.mock
+    async def test_query_run_backs_off_and_honors_retry_after(self, clock):
+        respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            return_value=httpx.Response(200, json={"id": "q1"})
+        )
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(
+            return_value=httpx.Response(201, json={"id": "r1", "complete": False})
+        )
+        respx.get("https://api.honeycomb.io/1/query_results/ds/r1").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": "r1", "complete": False}),
+                httpx.Response(
+                    200, json={"id": "r1", "complete": False}, headers={"Retry-After": "2"}
+                ),
+                httpx.Response(200, json={"id": "r1", "complete": True, "data": {"results": []}}),
+            ]
+        )
+        strategy = PollStrategy(initial_delay=0.1, clock=clock)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=strategy) as client:
+            _, result = await client.query_results.create_and_run_async(
+                QuerySpec(time_range=3600), dataset="ds", poll_interval=1.0
+            )
+
+        assert result.data.results == []
+        assert clock.sleeps == pytest.approx([0.1, 2.0])
+        assert client.poll_strategy.stats.polls == 3
+
+    @respx.mock
+    async def test_client_strategy_max_delay_applies_without_poll_interval(self, clock):
+        """A client-level max_delay above 1s is the cap when no poll_interval is passed."""
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(
+            return_value=httpx.Response(201, json={"id": "r1"})
+        )
+        respx.get("https://api.honeycomb.io/1/query_results/ds/r1").mock(
+            side_effect=[
+                *(httpx.Response(200, json={"id": "r1", "complete": False}) for _ in range(5)),
+                httpx.Response(200, json={"id": "r1", "complete": True, "data": {"results": []}}),
+            ]
+        )
+        strategy = PollStrategy(initial_delay=1.0, multiplier=2.0, max_delay=5.0, clock=clock)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=strategy) as client:
+            await client.query_results.run_async("ds", query_id="q1")
+
+        assert clock.sleeps == pytest.approx([1.0, 2.0, 4.0, 5.0, 5.0])
+
+    @respx.mock
+    def test_query_run_timeout_raises_honeycomb_error(self, clock):
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(
+            return_value=httpx.Response(201, json={"id": "r1"})
+        )
+        respx.get("https://api.honeycomb.io/1/query_results/ds/r1").mock(
+            return_value=httpx.Response(200, json={"id": "r1", "complete": False})
+        )
+
+        with (
+            HoneycombClient(
+                api_key="test-key", sync=True, poll_strategy=PollStrategy(clock=clock)
+            ) as client,
+            pytest.raises(HoneycombTimeoutError) as exc_info,
+        ):
+            client.query_results.run("ds", query_id="q1", timeout=3.0)
+
+        assert exc_info.value.timeout == 3.0
+        assert sum(clock.sleeps) == pytest.approx(3.0)
+
+    @respx.mock
+    async def test_service_map_polls_until_ready(self, clock):
+        respx.post("https://api.honeycomb.io/1/maps/dependencies/requests").mock(
+            return_value=httpx.Response(200, json={"request_id": "m1", "status": "pending"})
+        )
+        respx.get("https://api.honeycomb.io/1/maps/dependencies/requests/m1").mock(
+            side_effect=[
+                httpx.Response(200, json={"request_id": "m1", "status": "pending"}),
+                httpx.Response(
+                    200, json={"request_id": "m1", "status": "ready", "dependencies": []}
+                ),
+            ]
+        )
+        strategy = PollStrategy(initial_delay=0.05, clock=clock)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=strategy) as client:
+            result = await client.service_map_dependencies.get_async(
+                ServiceMapDependencyRequestCreate()
+            )
+
+        assert result.dependencies == []
+        assert clock.sleeps == pytest.approx([0.05])
@@ -7,8 +7,15 @@ import httpx
 import pytest
 import respx
 
-from honeycomb import HoneycombClient, RateLimitInfo, RetryConfig
-from honeycomb.exceptions import HoneycombNotFoundError, HoneycombRateLimitError
+from honeycomb import HoneycombClient, RateLimiter, RateLimitInfo, RetryConfig
+from honeycomb.exceptions import (
+    HoneycombCircuitOpenError,
+    HoneycombNotFoundError,
+    HoneycombRateLimitError,
+    HoneycombServerError,
+)
+from honeycomb.rate_limit import endpoint_family
+from honeycomb.resilience import CircuitBreaker, RetryBudget
 
 
 class TestRateLimitInfo:
@@ -340,3 +347,258 @@ def test_sync_retry_behavior():
             response = client.get_sync("/test")
             assert response.status_code == 200
             assert route.call_count == 2
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter:
+    """Tests for the client-side token bucket limiter."""
+
+    def test_endpoint_family(self):
+        """Paths are grouped by the segment after the API version (and team)."""
+        assert endpoint_family("/1/boards/abc") == "boards"
+        assert endpoint_family("/1/query_results/ds/123?x=1") == "query_results"
+        assert endpoint_family("/2/teams/my-team/api-keys/k1") == "api-keys"
+        assert endpoint_family("/1/auth") == "auth"
+
+    def test_unlimited_until_headers_seen(self):
+        """Without rate limit information requests are never delayed."""
+        limiter = RateLimiter(clock=FakeClock())
+        assert all(limiter.reserve("/1/boards") == 0 for _ in range(100))
+
+    def test_waits_for_reset_when_exhausted(self):
+        """Once remaining is spent, requests wait for the window reset."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.update("/1/boards", RateLimitInfo(limit=10, remaining=2, reset=30))
+
+        assert limiter.reserve("/1/boards/a") == 0
+        assert limiter.reserve("/1/boards/b") == 0
+        assert limiter.reserve("/1/boards/c") == 30
+        # Other endpoint families are unaffected
+        assert limiter.reserve("/1/markers/ds") == 0
+
+        clock.now += 30
+        # The waiting request already took one slot of the new window
+        assert limiter.get_info("/1/boards").remaining == 9
+
+    def test_debt_spread_over_later_windows(self):
+        """Requests beyond one window's capacity wait for later windows, not the next reset."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.update("/1/boards", RateLimitInfo(limit=2, remaining=0, reset=10))
+
+        delays = [limiter.reserve("/1/boards") for _ in range(5)]
+        assert delays == [10, 10, 20, 20, 30]
+
+        # Two windows later only the last reservation is still outstanding
+        clock.now += 20
+        assert limiter.get_info("/1/boards").remaining == 0
+        assert limiter.reserve("/1/boards") == 10
+
+    def test_static_limits_refill(self):
+        """Configured limits refill continuously."""
+        clock = FakeClock()
+        limiter = RateLimiter(limits={"query_results": (2, 10.0)}, clock=clock)
+
+        assert limiter.reserve("/1/query_results/ds") == 0
+        assert limiter.reserve("/1/query_results/ds") == 0
+        assert limiter.reserve("/1/query_results/ds") == pytest.approx(5.0)
+        clock.now += 5
+        assert limiter.reserve("/1/query_results/ds") == pytest.approx(5.0)
+
+    def test_penalize_blocks_family(self):
+        """A 429 blocks the whole family until Retry-After has passed."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.penalize("/1/columns/ds", 12)
+
+        assert limiter.reserve("/1/columns/other") == 12
+        clock.now += 12
+        assert limiter.reserve("/1/columns/other") == 0
+
+    def test_epoch_reset(self):
+        """Reset values given as Unix timestamps are converted to delays."""
+        limiter = RateLimiter(clock=FakeClock())
+        reset = int(datetime.now(timezone.utc).timestamp()) + 60
+        limiter.update("/1/boards", RateLimitInfo(remaining=0, reset=reset))
+        assert 55 <= limiter.reserve("/1/boards") <= 61
+
+
+class TestClientRateLimiting:
+    """Tests for rate limiter integration in the request loop."""
+
+    def test_default_and_disabled(self):
+        """Clients get their own limiter by default; False disables it."""
+        assert isinstance(HoneycombClient(api_key="k").rate_limiter, RateLimiter)
+        assert HoneycombClient(api_key="k", rate_limiter=False).rate_limiter is None
+
+    @respx.mock
+    async def test_shared_limiter_learns_from_headers(self):
+        """Headers seen by one client pace requests from another sharing the limiter."""
+        respx.get("https://api.honeycomb.io/1/boards").mock(
+            return_value=httpx.Response(
+                200,
+                json=[],
+                headers={"RateLimit": "limit=100, remaining=0, reset=60"},
+            )
+        )
+        limiter = RateLimiter()
+
+        async with (
+            HoneycombClient(api_key="test-key", rate_limiter=limiter) as a,
+            HoneycombClient(api_key="test-key", rate_limiter=limiter) as b,
+        ):
+            await a.get_async("/1/boards")
+            assert b.rate_limiter is limiter
+            info = limiter.get_info("/1/boards")
+            assert info.limit == 100
+            assert info.remaining == 0
+            assert 59 <= info.reset <= 60
+
+    @respx.mock
+    def test_sync_429_penalizes_family(self, monkeypatch):
+        """A 429 on the sync path empties the bucket until Retry-After."""
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        respx.get("https://api.honeycomb.io/1/boards").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "5"}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            client.get_sync("/1/boards")
+        # Backoff honors Retry-After; with time.sleep patched out no time passes,
+        # so the limiter then holds the retry until the window opens
+        assert sleeps[0] == 5
+        assert sleeps[1] == pytest.approx(5, abs=0.5)
+
+
+class TestJitter:
+    """Tests for randomized backoff."""
+
+    def test_invalid_jitter(self):
+        with pytest.raises(ValueError, match="Unsupported jitter mode"):
+            RetryConfig(jitter="equal")
+
+    def test_full_jitter_bounded_by_exponential_delay(self):
+        """Full jitter spreads delays between 0 and the exponential delay."""
+        client = HoneycombClient(api_key="test-key", retry_config=RetryConfig(jitter="full"))
+        delays = [client._calculate_backoff(2) for _ in range(200)]
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_decorrelated_jitter_grows_from_previous(self):
+        """Decorrelated jitter draws from [base_delay, 3 * previous], capped at max_delay."""
+        config = RetryConfig(jitter="decorrelated", base_delay=1.0, max_delay=5.0)
+        client = HoneycombClient(api_key="test-key", retry_config=config)
+        for _ in range(100):
+            assert 1.0 <= client._calculate_backoff(0) <= 3.0
+            assert 1.0 <= client._calculate_backoff(3, previous=2.0) <= 5.0
+
+    def test_retry_after_is_not_jittered(self):
+        client = HoneycombClient(api_key="test-key", retry_config=RetryConfig(jitter="full"))
+        assert client._calculate_backoff(0, retry_after=7) == 7.0
+
+
+class TestRetryBudget:
+    """Tests for the retry budget."""
+
+    def test_min_retries_then_ratio(self):
+        """Retries beyond min_retries are limited to ratio * requests."""
+        clock = FakeClock()
+        budget = RetryBudget(0.5, min_retries=2, clock=clock)
+
+        assert budget.try_retry()
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+        for _ in range(10):
+            budget.record_request()
+        assert sum(budget.try_retry() for _ in range(10)) == 3  # 5 allowed, 2 used
+
+    def test_window_expires(self):
+        """Old requests and retries leave the window."""
+        clock = FakeClock()
+        budget = RetryBudget(0.0, min_retries=1, window=10, clock=clock)
+        assert budget.try_retry()
+        assert not budget.try_retry()
+        clock.now += 10
+        assert budget.try_retry()
+
+    @respx.mock
+    async def test_exhausted_budget_stops_retrying(self):
+        """When the budget is spent, retryable errors are raised immediately."""
+        route = respx.get("https://budget.example.com/test").mock(
+            return_value=httpx.Response(503, json={"error": "unavailable"})
+        )
+        config = RetryConfig(retry_budget=0.0, retry_budget_min=1, base_delay=0.0)
+
+        async with HoneycombClient(
+            api_key="test-key", base_url="https://budget.example.com", retry_config=config
+        ) as client:
+            with pytest.raises(HoneycombServerError):
+                await client.get_async("/test")
+
+        # One original request plus the single retry the budget allows
+        assert route.call_count == 2
+
+
+class TestCircuitBreaker:
+    """Tests for the per-host circuit breaker."""
+
+    def test_opens_after_threshold_and_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.before_request() is None
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.before_request() == 10
+
+        clock.now += 10
+        assert breaker.before_request() is None  # probe
+        assert breaker.state == "half_open"
+        assert breaker.before_request() is not None  # only one probe
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        clock.now += 10
+        assert breaker.before_request() is None
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    @respx.mock
+    async def test_client_fails_fast_when_open(self):
+        """Once open, requests to the host are rejected without being sent."""
+        route = respx.get("https://breaker.example.com/test").mock(
+            return_value=httpx.Response(500, json={"error": "boom"})
+        )
+        config = RetryConfig(max_retries=0, circuit_breaker_threshold=2)
+
+        async with HoneycombClient(
+            api_key="test-key",
+            base_url="https://breaker.example.com",
+            max_retries=0,
+            retry_config=config,
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(HoneycombServerError):
+                    await client.get_async("/test")
+            with pytest.raises(HoneycombCircuitOpenError) as exc_info:
+                await client.get_async("/test")
+
+        assert route.call_count == 2
+        assert exc_info.value.host == "breaker.example.com"
+        assert exc_info.value.retry_in > 0
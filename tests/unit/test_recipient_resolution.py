@@ -0,0 +1,188 @@
+"""Tests for indexed, cached inline recipient resolution."""
+
+import asyncio
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from honeycomb import HoneycombClient, RecipientType
+from honeycomb.exceptions import HoneycombAPIError
+from honeycomb.models.recipients import Recipient
+from honeycomb.resources._recipient_utils import (
+    RecipientIndex,
+    process_inline_recipients,
+    process_inline_recipients_sync,
+)
+
+EXISTING = [
+    {"id": "r-slack", "type": "slack", "details": {"slack_channel": "#alerts"}},
+    {"id": "r-email", "type": "email", "details": {"email_address": "oncall@example.com"}},
+    {"id": "r-email-dup", "type": "email", "details": {"email_address": "oncall@example.com"}},
+]
+
+
+class _RecipientsApi:
+    """Mocks listing and creating recipients."""
+
+    def __init__(self, respx_mock, existing=EXISTING, conflict=(), sync=False):
+        self.existing = list(existing)
+        self.conflict = set(conflict)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.list_route = respx_mock.get("https://api.honeycomb.io/1/recipients").mock(
+            side_effect=self._list
+        )
+        self.create_route = respx_mock.post("https://api.honeycomb.io/1/recipients").mock(
+            side_effect=self._create if sync else self._create_async
+        )
+
+    def _list(self, _request):
+        return Response(200, json=self.existing)
+
+    async def _create_async(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self._create(request)
+
+    def _create(self, request):
+        body = json.loads(request.content)
+        target = next(iter(body["details"].values()))
+        recipient = {"id": f"new-{target}", **body}
+        if target in self.conflict:
+            # Created concurrently by someone else
+            self.existing.append(recipient)
+            return Response(409, json={"error": "recipient already exists"})
+        return Response(201, json=recipient)
+
+
+class TestRecipientIndex:
+    """Tests for RecipientIndex lookups and aging."""
+
+    def test_lookup_by_type_and_target(self):
+        index = RecipientIndex([Recipient.model_validate(r) for r in EXISTING])
+
+        assert index.get(RecipientType.SLACK, "#alerts") == "r-slack"
+        # First listed recipient wins for duplicate targets
+        assert index.get(RecipientType.EMAIL, "oncall@example.com") == "r-email"
+        assert index.get(RecipientType.SLACK, "oncall@example.com") is None
+        assert len(index) == 2
+
+    def test_fresh(self):
+        now = [0.0]
+        index = RecipientIndex([], clock=lambda: now[0])
+        assert index.fresh(ttl=60)
+        now[0] = 60
+        assert not index.fresh(ttl=60)
+
+
+@pytest.mark.asyncio
+class TestProcessInlineRecipients:
+    """Tests for process_inline_recipients with the client's cached index."""
+
+    @respx.mock
+    async def test_index_is_cached_per_client(self, respx_mock):
+        api = _RecipientsApi(respx_mock)
+
+        async with HoneycombClient(api_key="test-key") as client:
+            first, second = await asyncio.gather(
+                process_inline_recipients(client, [{"type": "slack", "target": "#alerts"}]),
+                process_inline_recipients(
+                    client, [{"type": "email", "target": "oncall@example.com"}, {"id": "keep"}]
+                ),
+            )
+            third = await process_inline_recipients(
+                client, [{"type": "slack", "target": "#alerts"}]
+            )
+
+        assert first == third == [{"id": "r-slack"}]
+        assert second == [{"id": "r-email"}, {"id": "keep"}]
+        assert api.list_route.call_count == 1
+
+    @respx.mock
+    async def test_missing_recipients_created_concurrently_once(self, respx_mock):
+        api = _RecipientsApi(respx_mock)
+        inline = [
+            {"type": "email", "target": "a@example.com"},
+            {"type": "email", "target": "b@example.com"},
+            {"type": "email", "target": "a@example.com"},
+        ]
+
+        async with HoneycombClient(api_key="test-key") as client:
+            resolved = await process_inline_recipients(client, inline)
+            # Created recipients are added to the cached index
+            again = await process_inline_recipients(client, inline[:1])
+
+        assert resolved == [
+            {"id": "new-a@example.com"},
+            {"id": "new-b@example.com"},
+            {"id": "new-a@example.com"},
+        ]
+        assert again == [{"id": "new-a@example.com"}]
+        assert api.create_route.call_count == 2
+        assert api.max_in_flight == 2
+        assert api.list_route.call_count == 1
+
+    @respx.mock
+    async def test_conflict_reloads_index(self, respx_mock):
+        api = _RecipientsApi(respx_mock, conflict={"#race"})
+
+        async with HoneycombClient(api_key="test-key") as client:
+            resolved = await process_inline_recipients(
+                client, [{"type": "slack", "target": "#race"}]
+            )
+
+        assert resolved == [{"id": "new-#race"}]
+        assert api.list_route.call_count == 2
+
+    @respx.mock
+    async def test_unresolved_conflict_raises(self, respx_mock):
+        respx_mock.get("https://api.honeycomb.io/1/recipients").mock(
+            return_value=Response(200, json=[])
+        )
+        respx_mock.post("https://api.honeycomb.io/1/recipients").mock(
+            return_value=Response(409, json={"error": "conflict"})
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(HoneycombAPIError):
+                await process_inline_recipients(client, [{"type": "slack", "target": "#x"}])
+
+    @respx.mock
+    async def test_delete_invalidates_index(self, respx_mock):
+        api = _RecipientsApi(respx_mock)
+        respx_mock.delete("https://api.honeycomb.io/1/recipients/r-slack").mock(
+            return_value=Response(204)
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.recipients.index_async()
+            await client.recipients.delete_async("r-slack")
+            await client.recipients.index_async()
+
+        assert api.list_route.call_count == 2
+
+
+class TestProcessInlineRecipientsSync:
+    """Tests for process_inline_recipients_sync."""
+
+    @respx.mock
+    def test_sync_resolution(self, respx_mock):
+        api = _RecipientsApi(respx_mock, sync=True)
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            resolved = process_inline_recipients_sync(
+                client,
+                [
+                    {"type": "slack", "target": "#alerts"},
+                    {"type": "email", "target": "new@example.com"},
+                ],
+            )
+            client.recipients.index()
+
+        assert resolved == [{"id": "r-slack"}, {"id": "new-new@example.com"}]
+        assert api.list_route.call_count == 1
+        assert api.create_route.call_count == 1
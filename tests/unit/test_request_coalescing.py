@@ -0,0 +1,125 @@
+"""Tests for single-flight coalescing of identical GET requests."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import HoneycombClient, HoneycombServerError
+
+
+def _slow_response(payload, status=200):
+    """Return a respx side effect that keeps the request in flight briefly."""
+
+    async def respond(_request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(status, json=payload)
+
+    return respond
+
+
+class TestRequestCoalescing:
+    """Tests for coalesce_requests=True."""
+
+    @respx.mock
+    async def test_identical_gets_share_one_request(self):
+        """Concurrent identical GETs are served by a single network call."""
+        route = respx.get("https://api.honeycomb.io/1/recipients").mock(
+            side_effect=_slow_response([{"id": "r1", "type": "email"}])
+        )
+
+        async with HoneycombClient(api_key="test-key", coalesce_requests=True) as client:
+            responses = await asyncio.gather(
+                *(client.get_async("/1/recipients") for _ in range(10))
+            )
+
+        assert route.call_count == 1
+        assert all(r.json() == [{"id": "r1", "type": "email"}] for r in responses)
+
+    @respx.mock
+    async def test_different_params_are_not_merged(self):
+        """Requests differing in params are sent separately."""
+        route = respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            side_effect=_slow_response([])
+        )
+
+        async with HoneycombClient(api_key="test-key", coalesce_requests=True) as client:
+            await asyncio.gather(
+                client.get_async("/1/columns/ds", params={"key_name": "a"}),
+                client.get_async("/1/columns/ds", params={"key_name": "b"}),
+                client.get_async("/1/columns/ds", params={"key_name": "a"}),
+            )
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_sequential_gets_are_not_cached(self):
+        """Only in-flight requests are merged; later calls hit the API again."""
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        async with HoneycombClient(api_key="test-key", coalesce_requests=True) as client:
+            await client.get_async("/1/datasets")
+            await client.get_async("/1/datasets")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_writes_are_never_merged(self):
+        """Non-GET requests are always sent individually."""
+        route = respx.post("https://api.honeycomb.io/1/markers/ds").mock(
+            side_effect=_slow_response({"id": "m1"}, status=201)
+        )
+
+        async with HoneycombClient(api_key="test-key", coalesce_requests=True) as client:
+            await asyncio.gather(
+                *(client.post_async("/1/markers/ds", json={"message": "x"}) for _ in range(3))
+            )
+
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_errors_fan_out_to_all_waiters(self):
+        """Every waiter sees the shared request's error."""
+        route = respx.get("https://api.honeycomb.io/1/boards").mock(
+            side_effect=_slow_response({"error": "nope"}, status=500)
+        )
+
+        async with HoneycombClient(
+            api_key="test-key", coalesce_requests=True, max_retries=0
+        ) as client:
+            results = await asyncio.gather(
+                *(client.get_async("/1/boards") for _ in range(3)), return_exceptions=True
+            )
+
+        assert route.call_count == 1
+        assert all(isinstance(r, HoneycombServerError) for r in results)
+
+    @respx.mock
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Cancelling one waiter leaves the shared request running for the rest."""
+        respx.get("https://api.honeycomb.io/1/datasets").mock(side_effect=_slow_response([]))
+
+        async with HoneycombClient(api_key="test-key", coalesce_requests=True) as client:
+            first = asyncio.create_task(client.get_async("/1/datasets"))
+            second = asyncio.create_task(client.get_async("/1/datasets"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert (await second).status_code == 200
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+    @respx.mock
+    async def test_disabled_by_default(self):
+        """Without coalesce_requests every call is sent."""
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            side_effect=_slow_response([])
+        )
+
+        async with HoneycombClient(api_key="test-key") as client:
+            await asyncio.gather(*(client.get_async("/1/datasets") for _ in range(3)))
+
+        assert route.call_count == 3
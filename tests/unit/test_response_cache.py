@@ -0,0 +1,457 @@
+"""Tests for the metadata response cache."""
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import (
+    CacheConfig,
+    ColumnCreate,
+    HoneycombClient,
+    QueryResultCacheConfig,
+    ResponseCache,
+)
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(payload, **headers):
+    return httpx.Response(
+        200, json=payload, headers=headers, request=httpx.Request("GET", "https://x")
+    )
+
+
+class TestResponseCache:
+    """Tests for ResponseCache TTL, LRU and invalidation."""
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ResponseCache(CacheConfig(ttls={"columns": 60}), clock=clock)
+        cache.store("/1/columns/ds", None, _response([]))
+
+        assert cache.get("/1/columns/ds") is not None
+        clock.now += 60
+        assert cache.get("/1/columns/ds") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_uncached_families_are_ignored(self):
+        cache = ResponseCache(CacheConfig(ttls={"columns": 60}))
+        assert cache.store("/1/triggers/ds", None, _response([])) is None
+        assert cache.get("/1/triggers/ds") is None
+        assert len(cache) == 0
+
+    def test_params_are_part_of_the_key(self):
+        cache = ResponseCache()
+        cache.store("/1/columns/ds", {"key_name": "a"}, _response({"key_name": "a"}))
+        assert cache.get("/1/columns/ds", {"key_name": "b"}) is None
+        assert cache.get("/1/columns/ds", {"key_name": "a"}) is not None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(CacheConfig(max_entries=2))
+        cache.store("/1/columns/a", None, _response([]))
+        cache.store("/1/columns/b", None, _response([]))
+        cache.get("/1/columns/a")
+        cache.store("/1/columns/c", None, _response([]))
+
+        assert cache.get("/1/columns/b") is None
+        assert cache.get("/1/columns/a") is not None
+        assert cache.get("/1/columns/c") is not None
+
+    def test_invalidate_by_family_and_prefix(self):
+        cache = ResponseCache()
+        for path in ("/1/columns/a", "/1/columns/b", "/1/recipients"):
+            cache.store(path, None, _response([]))
+
+        assert cache.invalidate("/1/columns/a") == 1
+        assert cache.invalidate("columns") == 1
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+    def test_dataset_writes_cascade(self):
+        """Writes to datasets invalidate dataset-scoped families too."""
+        cache = ResponseCache()
+        cache.store("/1/columns/ds", None, _response([]))
+        cache.store("/1/datasets", None, _response([]))
+        cache.invalidate_for_write("/1/datasets/ds")
+        assert len(cache) == 0
+
+    def test_stale_response_not_stored_after_invalidation(self):
+        """A response fetched before a write is discarded."""
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate_for_write("/1/columns/ds")
+        cache.store("/1/columns/ds", None, _response([]), generation=generation)
+        assert len(cache) == 0
+
+    def test_uncached_family_writes_do_not_invalidate(self):
+        """Writes to families that are never cached keep concurrent fetches of others."""
+        cache = ResponseCache()
+        cache.store("/1/columns/ds", None, _response([]))
+        generation = cache.generation
+        for path in ("/1/batch/ds", "/1/triggers/ds", "/1/queries/ds", "/1/boards"):
+            assert cache.invalidate_for_write(path) == 0
+        assert cache.generation == generation
+        cache.store("/1/recipients", None, _response([]), generation=generation)
+        assert len(cache) == 2
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            CacheConfig(max_entries=0)
+
+
+class TestClientCaching:
+    """Tests for response caching through HoneycombClient."""
+
+    @respx.mock
+    async def test_repeated_lists_hit_cache(self):
+        route = respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            return_value=httpx.Response(
+                200, json=[{"id": "c1", "key_name": "duration_ms", "type": "float"}]
+            )
+        )
+
+        async with HoneycombClient(api_key="test-key", cache=CacheConfig()) as client:
+            first = await client.columns.list_async("ds")
+            second = await client.columns.list_async("ds")
+
+        assert route.call_count == 1
+        assert first == second
+        assert client.cache.hits == 1
+
+    @respx.mock
+    async def test_write_invalidates_family(self):
+        """Creating a column refetches the column list."""
+        list_route = respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx.post("https://api.honeycomb.io/1/columns/ds").mock(
+            return_value=httpx.Response(201, json={"id": "c2", "key_name": "new", "type": "string"})
+        )
+
+        async with HoneycombClient(api_key="test-key", cache=CacheConfig()) as client:
+            await client.columns.list_async("ds")
+            await client.columns.create_async("ds", ColumnCreate(key_name="new"))
+            await client.columns.list_async("ds")
+
+        assert list_route.call_count == 2
+
+    @respx.mock
+    def test_sync_cache_and_explicit_invalidation(self):
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        with HoneycombClient(api_key="test-key", sync=True, cache=CacheConfig()) as client:
+            client.datasets.list()
+            client.datasets.list()
+            client.cache.invalidate("datasets")
+            client.datasets.list()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_uncached_families_bypass_cache(self):
+        triggers = respx.get("https://api.honeycomb.io/1/triggers/ds").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        async with HoneycombClient(api_key="test-key", cache=CacheConfig()) as client:
+            await client.triggers.list_async("ds")
+            await client.triggers.list_async("ds")
+
+        assert triggers.call_count == 2
+
+    def test_disabled_by_default(self):
+        assert HoneycombClient(api_key="test-key").cache is None
+
+
+class TestPersistentCache:
+    """Tests for the on-disk cache and conditional revalidation."""
+
+    @respx.mock
+    def test_new_client_starts_warm(self, tmp_path):
+        """A second client (process) with the same credentials reads from disk."""
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[{"name": "A", "slug": "a"}])
+        )
+        config = CacheConfig(directory=tmp_path)
+
+        with HoneycombClient(api_key="test-key", sync=True, cache=config) as client:
+            client.datasets.list()
+        with HoneycombClient(api_key="test-key", sync=True, cache=config) as client:
+            datasets = client.datasets.list()
+
+        assert route.call_count == 1
+        assert datasets[0].slug == "a"
+
+    @respx.mock
+    def test_namespaced_by_credentials(self, tmp_path):
+        """Entries written for one API key are not served to another."""
+        route = respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        config = CacheConfig(directory=tmp_path)
+
+        for key in ("key-a", "key-b"):
+            with HoneycombClient(api_key=key, sync=True, cache=config) as client:
+                client.datasets.list()
+
+        assert route.call_count == 2
+        assert len(list(tmp_path.iterdir())) == 2
+        assert not any("key-" in p.name for p in tmp_path.iterdir())
+
+    @respx.mock
+    async def test_only_persistent_families_hit_disk(self, tmp_path):
+        respx.get("https://api.honeycomb.io/1/recipients").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        async with HoneycombClient(
+            api_key="test-key", cache=CacheConfig(directory=tmp_path)
+        ) as client:
+            await client.get_async("/1/recipients")
+
+        assert not list(tmp_path.rglob("*.json"))
+
+    @respx.mock
+    async def test_stale_entry_revalidated_with_etag(self, tmp_path):
+        """An expired entry with an ETag is revalidated; 304 serves the cached body."""
+        route = respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json=[{"id": "c1", "key_name": "duration_ms", "type": "float"}],
+                    headers={"ETag": '"v1"'},
+                ),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        config = CacheConfig(ttls={"columns": 0}, directory=tmp_path)
+
+        async with HoneycombClient(api_key="test-key", cache=config) as client:
+            await client.columns.list_async("ds")
+            columns = await client.columns.list_async("ds")
+
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert columns[0].key_name == "duration_ms"
+
+    @respx.mock
+    def test_invalidation_removes_disk_entries(self, tmp_path):
+        respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        with HoneycombClient(
+            api_key="test-key", sync=True, cache=CacheConfig(directory=tmp_path)
+        ) as client:
+            client.columns.list("ds")
+            assert client.cache.invalidate("columns") == 1
+
+        assert not list(tmp_path.rglob("*.json"))
+
+    @respx.mock
+    def test_disk_entries_partitioned_by_family(self, tmp_path, monkeypatch):
+        """Invalidating a family only reads that family's files on disk."""
+        from honeycomb.cache import DiskCache
+
+        respx.get("https://api.honeycomb.io/1/columns/ds").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx.get("https://api.honeycomb.io/1/datasets").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        read = []
+        original = DiskCache._read
+        monkeypatch.setattr(
+            DiskCache,
+            "_read",
+            lambda self, file: read.append(file.parent.name) or original(self, file),
+        )
+
+        with HoneycombClient(
+            api_key="test-key", sync=True, cache=CacheConfig(directory=tmp_path)
+        ) as client:
+            client.columns.list("ds")
+            client.get_sync("/1/datasets")
+            read.clear()
+            assert client.cache.invalidate("columns") == 1
+            assert client.cache.invalidate("recipients") == 0
+
+        assert read == ["columns"]
+        assert [p.parent.name for p in tmp_path.rglob("*.json")] == ["datasets"]
+
+
+class TestCliCache:
+    """Tests for the CLI cache configuration."""
+
+    def test_cli_client_uses_persistent_cache(self, monkeypatch, tmp_path):
+        from honeycomb.cli.config import get_client
+
+        monkeypatch.setenv("HONEYCOMB_CACHE_DIR", str(tmp_path))
+        client = get_client(api_key="test-key")
+        assert client.cache is not None
+        assert client.cache.config.directory == tmp_path
+
+    def test_cli_cache_can_be_disabled(self, monkeypatch):
+        from honeycomb.cli.config import get_client
+
+        monkeypatch.setenv("HONEYCOMB_NO_CACHE", "1")
+        assert get_client(api_key="test-key").cache is None
+
+
+class TestSavedQueryReuse:
+    """Tests for reusing saved queries created from identical specs."""
+
+    def test_spec_hash_is_canonical(self):
+        from honeycomb.cache import spec_hash
+
+        a = spec_hash("ds", {"time_range": 60, "calculations": [{"op": "COUNT"}]})
+        b = spec_hash("ds", {"calculations": [{"op": "COUNT"}], "time_range": 60})
+        assert a == b
+        assert spec_hash("other", {"time_range": 60, "calculations": [{"op": "COUNT"}]}) != a
+
+    @respx.mock
+    async def test_identical_specs_create_once(self):
+        from honeycomb import QueryBuilder, QuerySpec
+
+        route = respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            return_value=httpx.Response(200, json={"id": "q1"})
+        )
+
+        async with HoneycombClient(api_key="test-key", cache=CacheConfig()) as client:
+            first = await client.queries.create_async(
+                QueryBuilder().dataset("ds").last_1_hour().count()
+            )
+            second = await client.queries.create_async(
+                QuerySpec(time_range=3600, calculations=[{"op": "COUNT"}]), dataset="ds"
+            )
+            await client.queries.create_async(QuerySpec(time_range=60), dataset="ds")
+
+        assert first.id == second.id == "q1"
+        assert route.call_count == 2
+        assert client.cache.queries.hits == 1
+
+    @respx.mock
+    def test_persisted_across_clients(self, tmp_path):
+        from honeycomb import QuerySpec
+
+        route = respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            return_value=httpx.Response(200, json={"id": "q1"})
+        )
+        config = CacheConfig(directory=tmp_path)
+
+        for _ in range(2):
+            with HoneycombClient(api_key="test-key", sync=True, cache=config) as client:
+                query = client.queries.create(QuerySpec(time_range=60), dataset="ds")
+
+        assert query.id == "q1"
+        assert route.call_count == 1
+        assert client.cache.queries.clear() == 1
+
+    @respx.mock
+    async def test_reuse_can_be_disabled(self):
+        from honeycomb import QuerySpec
+
+        route = respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            return_value=httpx.Response(200, json={"id": "q1"})
+        )
+
+        async with HoneycombClient(
+            api_key="test-key", cache=CacheConfig(reuse_queries=False)
+        ) as client:
+            for _ in range(2):
+                await client.queries.create_async(QuerySpec(time_range=60), dataset="ds")
+
+        assert route.call_count == 2
+
+
+class TestQueryResultCache:
+    """Tests for the query result cache."""
+
+    def test_ttl_by_time_window(self):
+        from honeycomb.cache import QueryResultCache
+
+        clock = FakeClock()
+        cache = QueryResultCache(
+            QueryResultCacheConfig(open_ttl=30, settled_ttl=86400, ingestion_delay=300),
+            clock=clock,
+        )
+        now = int(clock.now)
+
+        assert cache.ttl_for({"time_range": 3600}) == 30
+        assert cache.ttl_for({"start_time": now - 3600, "end_time": now - 600}) == 86400
+        # Ended, but within the ingestion delay
+        assert cache.ttl_for({"start_time": now - 3600, "end_time": now - 60}) == 30
+        assert cache.ttl_for({"start_time": now - 7200, "time_range": 3600}) == 86400
+
+    def test_memory_bounded_by_size(self):
+        from honeycomb.cache import QueryResultCache
+
+        cache = QueryResultCache(QueryResultCacheConfig(max_bytes=25))
+        for name in "abc":
+            cache.put(name, {"time_range": 60}, b"x" * 10)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == b"x" * 10
+        assert cache.size_bytes == 20
+
+    @staticmethod
+    def _mock_run():
+        create = respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            return_value=httpx.Response(200, json={"id": "q1"})
+        )
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(
+            return_value=httpx.Response(201, json={"id": "r1"})
+        )
+        respx.get("https://api.honeycomb.io/1/query_results/ds/r1").mock(
+            return_value=httpx.Response(
+                200, json={"id": "r1", "complete": True, "data": {"results": [{"data": {"n": 1}}]}}
+            )
+        )
+        return create
+
+    @respx.mock
+    async def test_repeat_runs_skip_the_api(self):
+        from honeycomb import QuerySpec
+
+        create = self._mock_run()
+        async with HoneycombClient(
+            api_key="test-key", result_cache=QueryResultCacheConfig()
+        ) as client:
+            for _ in range(3):
+                query, result = await client.query_results.create_and_run_async(
+                    QuerySpec(time_range=600), dataset="ds"
+                )
+
+        assert create.call_count == 1
+        assert (query.id, result.data.rows) == ("q1", [{"n": 1}])
+        assert client.result_cache.hits == 2
+
+    @respx.mock
+    def test_settled_results_persist(self, tmp_path):
+        import time
+
+        from honeycomb import QuerySpec
+
+        create = self._mock_run()
+        end = int(time.time()) - 3600
+        settled = QuerySpec(start_time=end - 600, end_time=end)
+        config = QueryResultCacheConfig(directory=tmp_path)
+
+        for _ in range(2):
+            with HoneycombClient(api_key="test-key", sync=True, result_cache=config) as client:
+                client.query_results.create_and_run(settled, dataset="ds")
+                client.query_results.create_and_run(QuerySpec(time_range=600), dataset="ds")
+
+        # The relative query ran once per process, the settled one only once
+        assert create.call_count == 3
+        assert len(list(tmp_path.rglob("*.json"))) == 1
@@ -0,0 +1,147 @@
+"""Tests for incrementally refreshed rolling-window queries."""
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import HoneycombClient, PollStrategy, QueryBuilder, QuerySpec, RollingQuery
+
+FAST = PollStrategy(initial_delay=0.01)
+
+
+class _SeriesApi:
+    """Mocks query runs and returns one series entry per requested bucket."""
+
+    def __init__(self, granularity=60):
+        self.granularity = granularity
+        self.ranges = []
+        self.counts = {}
+        respx.post("https://api.honeycomb.io/1/queries/ds").mock(side_effect=self._create_query)
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(
+            side_effect=self._create_result
+        )
+        respx.get(url__regex=r"/1/query_results/ds/r\d+$").mock(side_effect=self._get_result)
+
+    def _create_query(self, request):
+        body = json.loads(request.content)
+        assert "time_range" not in body
+        assert body["granularity"] == self.granularity
+        self.ranges.append((body["start_time"], body["end_time"]))
+        return httpx.Response(200, json={"id": f"q{len(self.ranges) - 1}"})
+
+    def _create_result(self, request):
+        body = json.loads(request.content)
+        assert body["disable_series"] is False
+        return httpx.Response(201, json={"id": body["query_id"].replace("q", "r")})
+
+    def _get_result(self, request):
+        start, end = self.ranges[int(request.url.path.rsplit("/r", 1)[1])]
+        series = []
+        for bucket in range(start, end, self.granularity):
+            value = self.counts.get(bucket, bucket)
+            time = datetime.fromtimestamp(bucket, timezone.utc).isoformat().replace("+00:00", "Z")
+            series.append({"time": time, "data": {"COUNT": value}})
+        return httpx.Response(
+            200, json={"complete": True, "data": {"results": [], "series": series}}
+        )
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestRollingQuery:
+    """Tests for RollingQuery refreshes."""
+
+    @respx.mock
+    async def test_refresh_fetches_only_new_buckets(self):
+        api = _SeriesApi()
+        clock = FakeClock(6000 + 30)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            rolling = RollingQuery(
+                client,
+                QuerySpec(calculations=[{"op": "COUNT"}]),
+                dataset="ds",
+                window=600,
+                granularity=60,
+                clock=clock,
+            )
+            series = await rolling.refresh_async()
+            assert api.ranges == [(5400, 6000)]
+            assert [entry["time"] for entry in series] == list(range(5400, 6000, 60))
+
+            # Two buckets later: only those plus one trailing bucket are queried
+            clock.now += 120
+            api.counts[5940] = -1
+            series = await rolling.refresh_async()
+
+        assert api.ranges[1] == (5940, 6120)
+        assert rolling.last_fetched_buckets == 3
+        assert (rolling.start, rolling.end) == (5520, 6120)
+        assert [entry["time"] for entry in series] == list(range(5520, 6120, 60))
+        assert series[-3] == {"time": 5940, "COUNT": -1}
+
+    @respx.mock
+    async def test_no_request_until_a_bucket_completes(self):
+        api = _SeriesApi()
+        clock = FakeClock(6000)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            rolling = client.query_results.rolling(
+                QueryBuilder().dataset("ds").count().time_range(600).granularity(60),
+            )
+            rolling._clock = clock
+            await rolling.refresh_async()
+            clock.now += 59
+            series = await rolling.refresh_async()
+
+        assert len(api.ranges) == 1
+        assert rolling.refreshes == 1
+        assert len(series) == 10
+
+    @respx.mock
+    async def test_long_gap_refetches_whole_window(self):
+        api = _SeriesApi()
+        clock = FakeClock(6000)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            rolling = RollingQuery(
+                client, QuerySpec(), dataset="ds", window=300, granularity=60, clock=clock
+            )
+            await rolling.refresh_async()
+            clock.now += 3600
+            series = await rolling.refresh_async()
+
+        assert api.ranges[1] == (9300, 9600)
+        assert [entry["time"] for entry in series] == list(range(9300, 9600, 60))
+
+    @respx.mock
+    def test_sync_refresh(self):
+        api = _SeriesApi(granularity=300)
+
+        with HoneycombClient(api_key="test-key", sync=True, poll_strategy=FAST) as client:
+            rolling = RollingQuery(
+                client,
+                QuerySpec(granularity=300, time_range=3600),
+                dataset="ds",
+                clock=FakeClock(7200),
+            )
+            series = rolling.refresh()
+
+        assert api.ranges == [(3600, 7200)]
+        assert len(series) == 12
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"granularity": 120, "window": 60}, {"refetch_buckets": -1}]
+    )
+    def test_invalid_config(self, kwargs):
+        with pytest.raises(ValueError):
+            RollingQuery(None, QuerySpec(), dataset="ds", **kwargs)
@@ -0,0 +1,150 @@
+"""Tests for running many queries concurrently with a shared poll loop."""
+
+import asyncio
+import itertools
+import json
+
+import httpx
+import pytest
+import respx
+
+from honeycomb import HoneycombClient, HoneycombTimeoutError, PollStrategy, QuerySpec
+from honeycomb.polling import PollScheduler
+
+FAST = PollStrategy(initial_delay=0.01, multiplier=1.0, max_delay=0.01)
+
+
+class _FakeApi:
+    """Mocks query creation and makes query result i complete after `polls[i]` polls."""
+
+    def __init__(self, polls):
+        self.polls = polls
+        self.seen = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        ids = itertools.count()
+        respx.post("https://api.honeycomb.io/1/queries/ds").mock(
+            side_effect=lambda _request: httpx.Response(200, json={"id": f"q{next(ids)}"})
+        )
+        respx.post("https://api.honeycomb.io/1/query_results/ds").mock(side_effect=self._create)
+        respx.get(url__regex=r"/1/query_results/ds/r\d+$").mock(side_effect=self._poll)
+
+    def _create(self, request):
+        index = int(json.loads(request.content)["query_id"].removeprefix("q"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return httpx.Response(201, json={"id": f"r{index}"})
+
+    def _poll(self, request):
+        index = int(request.url.path.rsplit("/r", 1)[1])
+        self.seen[index] = self.seen.get(index, 0) + 1
+        if self.seen[index] < self.polls[index]:
+            return httpx.Response(200, json={"id": f"r{index}", "complete": False})
+        self.in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "id": f"r{index}",
+                "complete": True,
+                "data": {"results": [{"data": {"i": index}}]},
+            },
+        )
+
+
+class TestRunMany:
+    """Tests for query_results.run_many_async / iter_many_async."""
+
+    @respx.mock
+    async def test_results_in_input_order_with_timing(self):
+        api = _FakeApi(polls=[3, 1, 2])
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            runs = await client.query_results.run_many_async(
+                [QuerySpec(time_range=60)] * 3, dataset="ds"
+            )
+
+        assert [run.index for run in runs] == [0, 1, 2]
+        assert [run.result.data.rows[0]["i"] for run in runs] == [0, 1, 2]
+        assert [run.polls for run in runs] == [3, 1, 2]
+        assert all(run.elapsed >= run.poll_time > 0 for run in runs)
+        assert api.max_in_flight == 3
+
+    @respx.mock
+    async def test_concurrency_is_bounded(self):
+        api = _FakeApi(polls=[2] * 6)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            runs = await client.query_results.run_many_async(
+                [QuerySpec(time_range=60)] * 6, dataset="ds", max_concurrency=2
+            )
+
+        assert len(runs) == 6
+        assert api.max_in_flight == 2
+        assert max(run.queue_time for run in runs) > 0
+
+    @respx.mock
+    async def test_iter_yields_as_completed(self):
+        _FakeApi(polls=[5, 1, 3])
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            order = [
+                run.index
+                async for run in client.query_results.iter_many_async(
+                    [QuerySpec(time_range=60)] * 3, dataset="ds"
+                )
+            ]
+
+        assert order == [1, 2, 0]
+
+    @respx.mock
+    async def test_timeouts_and_return_exceptions(self):
+        _FakeApi(polls=[1, 10_000] * 2)
+
+        async with HoneycombClient(api_key="test-key", poll_strategy=FAST) as client:
+            runs = await client.query_results.run_many_async(
+                [QuerySpec(time_range=60)] * 2,
+                dataset="ds",
+                timeout=0.1,
+                return_exceptions=True,
+            )
+            assert runs[0].error is None
+            assert isinstance(runs[1].error, HoneycombTimeoutError)
+
+            with pytest.raises(HoneycombTimeoutError):
+                await client.query_results.run_many_async(
+                    [QuerySpec(time_range=60)] * 2, dataset="ds", timeout=0.1
+                )
+
+    async def test_dataset_validated_before_requests(self):
+        async with HoneycombClient(api_key="test-key") as client:
+            with pytest.raises(ValueError, match="dataset parameter required"):
+                await client.query_results.run_many_async([QuerySpec(time_range=60)])
+
+
+class TestPollScheduler:
+    """Tests for the shared poll loop."""
+
+    async def test_single_loop_polls_all_pending(self):
+        calls = []
+
+        async def poll(key):
+            calls.append(key)
+            return calls.count(key) >= key, None
+
+        scheduler = PollScheduler(
+            poll, lambda done: done, strategy=PollStrategy(initial_delay=0.01), timeout=5
+        )
+        results = await asyncio.gather(*(scheduler.wait(n) for n in (1, 2, 3)))
+
+        assert results == [(True, 1), (True, 2), (True, 3)]
+        # Keys due at the same time were polled in the same round
+        assert calls[:3] == [1, 2, 3]
+        assert calls[3:] == [2, 3, 3]
+
+    async def test_poll_errors_reach_the_waiter(self):
+        async def poll(_key):
+            raise RuntimeError("boom")
+
+        scheduler = PollScheduler(poll, lambda _result: True, strategy=PollStrategy(), timeout=5)
+        with pytest.raises(RuntimeError, match="boom"):
+            await scheduler.wait("k")
@@ -220,3 +220,124 @@ class TestSLOsResourceBundleAsync:
             ]
 
             assert slos["api-logs"].id == "slo-1"
+
+
+def _mock_bundle_api(respx_mock):
+    """Mock SLO, recipient and burn alert creation; returns (routes, concurrency stats)."""
+    import asyncio
+    import json
+
+    stats = {"in_flight": 0, "max_in_flight": 0}
+
+    async def create_burn_alert(request):
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        await asyncio.sleep(0.01)
+        stats["in_flight"] -= 1
+        return Response(200, json={"id": "ba", **json.loads(request.content)})
+
+    routes = {
+        "slo": respx_mock.post("https://api.honeycomb.io/1/slos/api-logs").mock(
+            return_value=Response(
+                200,
+                json={
+                    "id": "slo-1",
+                    "name": "API SLO",
+                    "sli": {"alias": "success_rate"},
+                    "target_per_million": 999000,
+                    "time_period_days": 30,
+                },
+            )
+        ),
+        "list_recipients": respx_mock.get("https://api.honeycomb.io/1/recipients").mock(
+            return_value=Response(
+                200,
+                json=[{"id": "r-slack", "type": "slack", "details": {"slack_channel": "#alerts"}}],
+            )
+        ),
+        "create_recipient": respx_mock.post("https://api.honeycomb.io/1/recipients").mock(
+            return_value=Response(
+                201,
+                json={
+                    "id": "r-email",
+                    "type": "email",
+                    "details": {"email_address": "oncall@example.com"},
+                },
+            )
+        ),
+        "burn_alert": respx_mock.post("https://api.honeycomb.io/1/burn_alerts/api-logs").mock(
+            side_effect=create_burn_alert
+        ),
+    }
+    return routes, stats
+
+
+def _bundle_with_alerts():
+    builder = (
+        SLOBuilder("API SLO").dataset("api-logs").target_percentage(99.9).sli(alias="success_rate")
+    )
+    for minutes in (30, 60, 120):
+        builder.exhaustion_alert(
+            BurnAlertBuilder(BurnAlertType.EXHAUSTION_TIME)
+            .exhaustion_minutes(minutes)
+            .email("oncall@example.com")
+            .slack("#alerts")
+        )
+    return builder.build()
+
+
+def _alert_recipient_ids(route):
+    import json
+
+    return [
+        [r["id"] for r in json.loads(call.request.content)["recipients"]] for call in route.calls
+    ]
+
+
+@pytest.mark.asyncio
+class TestSLOsResourceBundleConcurrency:
+    """Tests for resolving recipients once and creating burn alerts concurrently."""
+
+    @respx.mock
+    async def test_recipients_resolved_once_per_bundle(self, respx_mock):
+        routes, stats = _mock_bundle_api(respx_mock)
+
+        async with HoneycombClient(api_key="test-key") as client:
+            slos = await client.slos.create_from_bundle_async(_bundle_with_alerts())
+
+        assert slos["api-logs"].id == "slo-1"
+        assert routes["list_recipients"].call_count == 1
+        assert routes["create_recipient"].call_count == 1
+        assert routes["burn_alert"].call_count == 3
+        assert _alert_recipient_ids(routes["burn_alert"]) == [["r-email", "r-slack"]] * 3
+        assert stats["max_in_flight"] == 3
+
+    @respx.mock
+    async def test_max_concurrency(self, respx_mock):
+        _, stats = _mock_bundle_api(respx_mock)
+
+        async with HoneycombClient(api_key="test-key") as client:
+            await client.slos.create_from_bundle_async(_bundle_with_alerts(), max_concurrency=1)
+
+        assert stats["max_in_flight"] == 1
+
+
+class TestSLOsResourceBundleSync:
+    """Tests for SLO bundle creation (sync)."""
+
+    @respx.mock
+    def test_sync_bundle_resolves_recipients_once(self, respx_mock):
+        routes, _ = _mock_bundle_api(respx_mock)
+        routes["burn_alert"].mock(
+            side_effect=lambda _request: Response(
+                200, json={"id": "ba", "alert_type": "exhaustion_time"}
+            )
+        )
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            slos = client.slos.create_from_bundle(_bundle_with_alerts())
+
+        assert slos["api-logs"].id == "slo-1"
+        assert routes["list_recipients"].call_count == 1
+        assert routes["create_recipient"].call_count == 1
+        assert sorted(_alert_recipient_ids(routes["burn_alert"])) == [["r-email", "r-slack"]] * 3
@@ -0,0 +1,106 @@
+"""Tests for parsed query result time series."""
+
+import array
+import math
+
+import pytest
+
+from honeycomb import QueryResult, TimeSeries
+
+
+def _entry(time, **data):
+    return {"time": time, "data": data}
+
+
+SERIES = [
+    _entry("2024-04-09T14:00:00Z", service="api", COUNT=3, P99=12.5),
+    _entry("2024-04-09T14:00:00Z", service="db", COUNT=1, P99=4),
+    _entry("2024-04-09T14:01:00Z", service="api", COUNT=5, P99=10),
+]
+T0 = 1712671200
+
+
+class TestTimeSeries:
+    """Tests for TimeSeries parsing and access."""
+
+    def test_from_series(self):
+        ts = TimeSeries.from_series(SERIES)
+
+        assert ts.timestamps == array.array("q", [T0, T0 + 60])
+        assert ts.breakdowns == ["service"]
+        assert ts.calculations == ["COUNT", "P99"]
+        assert ts.groups == [("api",), ("db",)]
+        assert ts["COUNT", "api"] == array.array("d", [3, 5])
+        assert ts["P99", ("api",)] == array.array("d", [12.5, 10])
+        assert math.isnan(ts["COUNT", "db"][1])
+        assert ("COUNT", "cache") not in ts
+
+    def test_ungrouped_and_numeric_times(self):
+        ts = TimeSeries.from_series([{"time": 120, "count": 2}, {"time": 60, "count": 1}])
+
+        assert ts.timestamps == array.array("q", [60, 120])
+        assert ts["count"] == array.array("d", [1, 2])
+
+    def test_explicit_numeric_breakdown(self):
+        ts = TimeSeries.from_series(
+            [_entry(0, status=200, COUNT=9), _entry(0, status=500, COUNT=1)], breakdowns=["status"]
+        )
+        assert ts.groups == [(200,), (500,)]
+        assert ts["COUNT", 500][0] == 1
+
+    def test_query_result_accessor_is_cached(self):
+        result = QueryResult.model_validate({"data": {"results": [], "series": SERIES}})
+        assert result.data.time_series is result.data.time_series
+        assert len(result.data.time_series) == 2
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="same length"):
+            TimeSeries(array.array("q", [0]), {("COUNT", ()): array.array("d", [1, 2])})
+
+
+class TestTransforms:
+    """Tests for resampling and alignment."""
+
+    def test_resample(self):
+        ts = TimeSeries.from_series(
+            [{"time": t, "COUNT": t // 60} for t in range(0, 240, 60)] + [{"time": 240}]
+        )
+
+        hourly = ts.resample(120, how="sum")
+        assert hourly.timestamps == array.array("q", [0, 120, 240])
+        assert list(hourly["COUNT"])[:2] == [1, 5]
+        assert math.isnan(hourly["COUNT"][2])
+        assert list(ts.resample(120, how="max")["COUNT"])[:2] == [1, 3]
+
+    def test_resample_invalid(self):
+        ts = TimeSeries.from_series([])
+        with pytest.raises(ValueError, match="how must be one of"):
+            ts.resample(60, how="median")
+        with pytest.raises(ValueError):
+            ts.resample(0)
+
+    def test_align(self):
+        a = TimeSeries.from_series([{"time": 0, "x": 1}, {"time": 60, "x": 2}])
+        b = TimeSeries.from_series([{"time": 60, "x": 3}, {"time": 120, "x": 4}])
+
+        a2, b2 = TimeSeries.align(a, b)
+        assert a2.timestamps == b2.timestamps == array.array("q", [0, 60, 120])
+        assert math.isnan(a2["x"][2])
+        assert math.isnan(b2["x"][0])
+
+    def test_compare_offset(self):
+        current = TimeSeries.from_series([{"time": 86400 + t, "COUNT": 10} for t in (0, 60)])
+        previous = TimeSeries.from_series([{"time": t, "COUNT": 7} for t in (0, 60)])
+
+        baseline = current.compare(previous, 86400)
+        assert baseline.timestamps == current.timestamps
+        assert baseline["COUNT"] == array.array("d", [7, 7])
+
+    def test_to_numpy_shares_memory(self):
+        pytest.importorskip("numpy")
+        ts = TimeSeries.from_series(SERIES)
+        timestamps, values = ts.to_numpy()
+
+        assert timestamps.dtype == "int64"
+        ts["COUNT", "api"][0] = 42
+        assert values["COUNT", ("api",)][0] == 42
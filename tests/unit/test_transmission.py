@@ -0,0 +1,156 @@
+"""Tests for the background batching Transmission."""
+
+import asyncio
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from honeycomb import BatchEvent, HoneycombClient, Transmission, TransmissionOverflowError
+
+
+def _accept_all(request):
+    """Respond 202 for every event in the posted batch."""
+    events = json.loads(request.content)
+    return Response(200, json=[{"status": 202} for _ in events])
+
+
+async def _drain(tx: Transmission) -> list:
+    responses = []
+    while not tx.responses.empty():
+        responses.append(tx.responses.get_nowait())
+    return responses
+
+
+class TestTransmission:
+    """Tests for Transmission batching and response delivery."""
+
+    @respx.mock
+    async def test_batches_by_count(self):
+        """Events are grouped into batches of max_batch_size."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+
+        async with (
+            HoneycombClient(api_key="test-key") as client,
+            client.events.transmission(max_batch_size=10, send_frequency=5.0) as tx,
+        ):
+            for i in range(25):
+                assert tx.add("ds", {"i": i})
+
+        sizes = sorted(len(json.loads(call.request.content)) for call in route.calls)
+        assert sizes == [5, 10, 10]
+        responses = await _drain(tx)
+        assert len(responses) == 25
+        assert all(r.ok for r in responses)
+
+    @respx.mock
+    async def test_batches_per_dataset(self):
+        """Each batch only contains events for a single dataset."""
+        route_a = respx.post("https://api.honeycomb.io/1/batch/a").mock(side_effect=_accept_all)
+        route_b = respx.post("https://api.honeycomb.io/1/batch/b").mock(side_effect=_accept_all)
+
+        async with (
+            HoneycombClient(api_key="test-key") as client,
+            client.events.transmission() as tx,
+        ):
+            tx.add("a", {"n": 1})
+            tx.add("b", BatchEvent(data={"n": 2}, samplerate=5))
+            tx.add("a", {"n": 3})
+
+        assert route_a.call_count == 1
+        assert route_b.call_count == 1
+        assert json.loads(route_a.calls[0].request.content) == [
+            {"data": {"n": 1}},
+            {"data": {"n": 3}},
+        ]
+        assert json.loads(route_b.calls[0].request.content) == [{"data": {"n": 2}, "samplerate": 5}]
+
+    @respx.mock
+    async def test_flushes_on_age(self):
+        """A partial batch is sent once it is older than send_frequency."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+
+        async with HoneycombClient(api_key="test-key") as client:
+            tx = client.events.transmission(max_batch_size=100, send_frequency=0.01)
+            tx.add("ds", {"n": 1})
+            response = await asyncio.wait_for(tx.responses.get(), timeout=1.0)
+            assert route.call_count == 1
+            assert response.ok
+            await tx.close()
+
+    @respx.mock
+    async def test_batches_by_bytes(self):
+        """A batch is cut before it exceeds max_batch_bytes."""
+        route = respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+
+        async with (
+            HoneycombClient(api_key="test-key") as client,
+            client.events.transmission(max_batch_bytes=200) as tx,
+        ):
+            for _ in range(4):
+                tx.add("ds", {"payload": "x" * 60})
+
+        assert route.call_count == 2
+        for call in route.calls:
+            assert len(call.request.content) <= 200
+
+    @respx.mock
+    async def test_metadata_and_per_event_results(self):
+        """Responses carry per-event results and caller metadata."""
+        respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(200, json=[{"status": 202}, {"status": 400, "error": "bad"}])
+        )
+
+        async with (
+            HoneycombClient(api_key="test-key") as client,
+            client.events.transmission() as tx,
+        ):
+            tx.add("ds", {"n": 1}, metadata="first")
+            tx.add("ds", {"n": 2}, metadata="second")
+
+        responses = {r.metadata: r for r in await _drain(tx)}
+        assert responses["first"].ok
+        assert not responses["second"].ok
+        assert responses["second"].result.error == "bad"
+
+    @respx.mock
+    async def test_request_error_reported_for_every_event(self):
+        """A failed batch request produces an error response per event."""
+        respx.post("https://api.honeycomb.io/1/batch/ds").mock(
+            return_value=Response(403, json={"error": "forbidden"})
+        )
+
+        async with (
+            HoneycombClient(api_key="test-key") as client,
+            client.events.transmission() as tx,
+        ):
+            tx.add("ds", {"n": 1})
+            tx.add("ds", {"n": 2})
+
+        responses = await _drain(tx)
+        assert len(responses) == 2
+        assert all(r.error is not None and not r.ok for r in responses)
+
+    async def test_overflow_drops_event(self):
+        """Events beyond pending_work_capacity are dropped with an error response."""
+        async with HoneycombClient(api_key="test-key") as client:
+            tx = client.events.transmission(pending_work_capacity=1)
+            assert tx.add("ds", {"n": 1})
+            assert not tx.add("ds", {"n": 2})
+
+            dropped = tx.responses.get_nowait()
+            assert isinstance(dropped.error, TransmissionOverflowError)
+            assert dropped.event.data == {"n": 2}
+
+            with respx.mock:
+                respx.post("https://api.honeycomb.io/1/batch/ds").mock(side_effect=_accept_all)
+                await tx.close()
+
+    async def test_add_after_close_raises(self):
+        """A closed transmission rejects new events."""
+        async with HoneycombClient(api_key="test-key") as client:
+            tx = client.events.transmission()
+            await tx.close()
+            with pytest.raises(RuntimeError, match="closed"):
+                tx.add("ds", {"n": 1})
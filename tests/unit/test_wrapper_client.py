@@ -1,5 +1,10 @@
 """Tests for the wrapper HoneycombClient and resource classes."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -56,6 +61,30 @@ class TestHoneycombClientInit:
         with HoneycombClient(api_key="test-key", sync=True) as client:
             assert client.is_sync
 
+    def test_sync_client_created_once_across_threads(self, monkeypatch):
+        """Worker threads racing on the lazy sync client share one httpx.Client."""
+        created = []
+
+        class SlowClient(httpx.Client):
+            def __init__(self, **kwargs):
+                time.sleep(0.01)
+                super().__init__(**kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(httpx, "Client", SlowClient)
+        barrier = threading.Barrier(8)
+
+        def get(client):
+            barrier.wait()
+            return client._get_sync_client()
+
+        with HoneycombClient(api_key="test-key", sync=True) as client:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(get, [client] * 8))
+
+            assert len(created) == 1
+            assert all(result is created[0] for result in results)
+
 
 class TestResourceAccessors:
     """Tests for resource property accessors."""